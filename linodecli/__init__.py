@@ -3,24 +3,36 @@
 Argument parser for the linode CLI
 """
 
-import argparse
 import logging
 import os
 import sys
-from importlib.metadata import version
-from sys import argv
 
-from rich import print as rprint
-from rich.table import Column, Table
-
-from linodecli import plugins
+from linodecli import plugins, profiling, timings
 from linodecli.exit_codes import ExitCodes
 
-from .arg_helpers import register_args, register_plugin, remove_plugin
+from .arg_helpers import (
+    build_parser,
+    parse_bake_args,
+    register_plugin,
+    remove_plugin,
+)
+from .batch import get_help as get_batch_help
+from .batch import open_input
+from .batch import parse_args as parse_batch_args
+from .batch import run_batch
 from .cli import CLI
+from .client import (
+    ApiError,
+    ArgumentError,
+    ConfigurationError,
+    LinodeClient,
+    LinodeClientError,
+)
 from .completion import get_completions
 from .configuration import ENV_TOKEN_NAME
-from .help_formatter import SortingHelpFormatter
+from .fanout import DEFAULT_PARALLEL_IDS, handle_command_ids
+from .fanout import parse_args as parse_fanout_args
+from .fanout import read_ids
 from .help_pages import (
     HELP_TOPICS,
     print_help_action,
@@ -40,44 +52,99 @@ BASE_URL = "https://api.linode.com/v4"
 
 TEST_MODE = os.getenv("LINODE_CLI_TEST_MODE") == "1"
 
-# Configure the `logging` package log level depending on the --debug flag.
-logging.basicConfig(
-    level=logging.DEBUG if "--debug" in argv else logging.WARNING,
-)
+# `from .cli import CLI` binds the linodecli.cli submodule here, which would
+# shadow the module-level CLI object created by __getattr__ below
+globals().pop("cli", None)
 
-# if any of these arguments are given, we don't need to prompt for configuration
-skip_config = (
-    any(c in argv for c in ["--skip-config", "--version", "completion"])
-    or TEST_MODE
-)
 
-cli = CLI(
-    VERSION,
-    handle_url_overrides(BASE_URL, override_path=True),
-    skip_config=skip_config,
-)
+def _skip_config(argv: list) -> bool:
+    """
+    Returns whether the given command line can run without prompting
+    for configuration.
+    """
+    # if any of these arguments are given, we don't need to prompt for configuration
+    return (
+        any(c in argv for c in ["--skip-config", "--version", "completion"])
+        or TEST_MODE
+    )
 
 
-def main():  # pylint: disable=too-many-branches,too-many-statements
+def _make_cli(skip_config: bool) -> CLI:
+    """
+    Creates the CLI object for a command.
+    """
+    return CLI(
+        VERSION,
+        handle_url_overrides(BASE_URL, override_path=True),
+        skip_config=skip_config,
+    )
+
+
+def __getattr__(name: str):
+    """
+    Creates the module-level CLI object the first time it is accessed, so
+    plugins and scripts can keep using `from linodecli import cli` without
+    every import of linodecli loading the baked spec and config.  While
+    main() is running, this is the CLI object handling the command.
+    """
+    if name == "cli":
+        global cli  # pylint: disable=global-variable-undefined
+
+        cli = _make_cli(_skip_config(sys.argv))
+        return cli
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# pylint: disable-next=too-many-branches,too-many-statements,too-many-locals
+def main():
     """
     Handle incoming command arguments
     """
-    parser = argparse.ArgumentParser(
-        "linode-cli",
-        add_help=False,
-        formatter_class=SortingHelpFormatter,
-        description="The Linode Command Line Interface.\n\nAliases: lin, linode",
+    # --profile is handled before any other arguments are parsed, so the CLI
+    # can be profiled from the moment it is loaded
+    profile_path, profile_memory, argv = profiling.parse_args(sys.argv)
+    profiling.start(profile_path, profile_memory)
+
+    # Configure the `logging` package log level depending on the --debug flag.
+    logging.basicConfig(
+        level=logging.DEBUG if "--debug" in argv else logging.WARNING,
     )
-    parsed, args = register_args(parser).parse_known_args()
+
+    # Timings must be enabled before the CLI is loaded so loading can be timed
+    if "--timings" in argv or os.getenv(timings.ENV_TIMINGS) == "1":
+        timings.enable()
+
+    skip_config = _skip_config(argv)
+
+    # Plugins may import the CLI object from this module
+    global cli  # pylint: disable=global-variable-undefined
+
+    cli = _make_cli(skip_config)
+
+    parser = build_parser()
+
+    with timings.phase("arg parsing"):
+        parsed, args = parser.parse_known_args(argv[1:])
+
+    profiling.set_context(parsed.command, parsed.action)
 
     cli.output_handler.configure(parsed, cli.suppress_warnings)
 
     if parsed.all_rows:
         cli.pagination = False
 
+    if parsed.parallel_pages < 1:
+        print("--parallel-pages must be at least 1", file=sys.stderr)
+        sys.exit(ExitCodes.ARGUMENT_ERROR)
+
+    cli.parallel_pages = parsed.parallel_pages
+
     cli.defaults = not parsed.no_defaults
-    cli.retry_count = 0
     cli.no_retry = parsed.no_retry
+    cli.retry_max_attempts = parsed.retry_max_attempts
+    cli.no_cache = parsed.no_cache
+    cli.refresh_cache = parsed.refresh
     cli.suppress_warnings = parsed.suppress_warnings
     cli.page = parsed.page
     cli.page_size = parsed.page_size
@@ -104,7 +171,7 @@ def main():  # pylint: disable=too-many-branches,too-many-statements
         if parsed.action is None:
             print("No spec provided, cannot bake", file=sys.stderr)
             sys.exit(ExitCodes.ARGUMENT_ERROR)
-        cli.bake(parsed.action)
+        cli.bake(parsed.action, jobs=parse_bake_args(args).jobs)
         sys.exit(ExitCodes.SUCCESS)
     elif cli.ops is None:
         # if not spec was found and we weren't baking, we're doomed
@@ -170,6 +237,16 @@ def main():  # pylint: disable=too-many-branches,too-many-statements
         print(get_completions(cli.ops, parsed.help, parsed.action))
         sys.exit(ExitCodes.SUCCESS)
 
+    if parsed.command == "batch":
+        if parsed.help:
+            print(get_batch_help())
+            sys.exit(ExitCodes.SUCCESS)
+
+        batch_args = parse_batch_args(args)
+
+        with open_input(parsed.action) as f:
+            sys.exit(run_batch(cli, f, parallel=batch_args.parallel))
+
     # handle a help for the CLI
     if parsed.command is None or (parsed.command is None and parsed.help):
         parser.print_help()
@@ -282,4 +359,24 @@ def main():  # pylint: disable=too-many-branches,too-many-statements
                 print_help_action(cli, parsed.command, parsed.action)
             sys.exit(ExitCodes.SUCCESS)
 
+        try:
+            operation = cli.find_operation(parsed.command, parsed.action)
+        except ValueError:
+            # handle_command reports unknown actions
+            operation = None
+
+        if operation is not None:
+            ids_args, ids_remaining = parse_fanout_args(args, operation)
+
+            # Otherwise, every argument is left for the operation to parse
+            if ids_args.ids is not None or ids_args.ids_from is not None:
+                handle_command_ids(
+                    cli,
+                    parsed.command,
+                    parsed.action,
+                    ids_remaining,
+                    read_ids(ids_args.ids, ids_args.ids_from),
+                    parallel=ids_args.parallel or DEFAULT_PARALLEL_IDS,
+                )
+
         cli.handle_command(parsed.command, parsed.action, args)
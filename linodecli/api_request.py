@@ -1,22 +1,38 @@
+# pylint: disable=too-many-lines
 """
 This module is responsible for handling HTTP requests to the Linode API.
 """
 
+import argparse
+import functools
 import itertools
 import json
 import os
 import sys
 import time
+from dataclasses import dataclass, replace
 from logging import getLogger
-from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+from urllib.parse import urlparse
 
 import requests
-from packaging import version
 from requests import Response
 
 from linodecli.exit_codes import ExitCodes
 from linodecli.helpers import API_CA_PATH, API_VERSION_OVERRIDE
 
+from . import rate_limit, response_cache, timings, version_check
 from .baked.operation import (
     ExplicitEmptyListValue,
     ExplicitJsonValue,
@@ -24,16 +40,61 @@ from .baked.operation import (
     OpenAPIOperation,
 )
 from .baked.util import get_path_segments
-from .helpers import handle_url_overrides
+from .helpers import handle_url_overrides, map_ordered
 
 if TYPE_CHECKING:
     from linodecli.cli import CLI
 
 logger = getLogger(__name__)
 
+# The page size used when retrieving all pages of a resource
+ALL_PAGES_PAGE_SIZE = 500
+
+
+@dataclass
+class RequestContext:
+    """
+    The state of a single API request, such as the page to request and the
+    number of times it has been retried.
+
+    Requests made with the same CLI don't share any of this state, so they
+    can be made from many threads at once.  If no context is given for a
+    request, one is created from the options the CLI was invoked with.
+    """
+
+    page: int = 1
+    page_size: int = 100
+    raw_body: Optional[str] = None
+    defaults: bool = True
+    retry_count: int = 0
+
+    @classmethod
+    def from_cli(cls, ctx: "CLI", **overrides: Any) -> "RequestContext":
+        """
+        Returns a new request context using the options the given CLI was
+        invoked with.
+
+        :param ctx: The main CLI object.
+        :param overrides: Fields of the context to set instead of the CLI's options.
+
+        :return: The new request context.
+        """
+        values = {
+            "page": ctx.page,
+            "page_size": ctx.page_size,
+            "raw_body": ctx.raw_body,
+            "defaults": ctx.defaults,
+        }
+        values.update(overrides)
+
+        return cls(**values)
+
 
 def get_all_pages(
-    ctx: "CLI", operation: OpenAPIOperation, args: List[str]
+    ctx: "CLI",
+    operation: OpenAPIOperation,
+    args: Union[List[str], argparse.Namespace],
+    request: Optional[RequestContext] = None,
 ) -> Dict[str, Any]:
     """
     Retrieves all pages of a resource from multiple API responses
@@ -41,70 +102,115 @@ def get_all_pages(
 
     :param ctx: The main CLI object that maintains API request state.
     :param operation: The OpenAPI operation to be executed.
-    :param args: A list of arguments passed to the API request.
+    :param args: A list of arguments passed to the API request, or the
+                 arguments already parsed by the operation.
+    :param request: The context to make the requests with (default: from ctx).
 
     :return: A dictionary containing the merged results from all pages.
     """
+    return merge_results_data(iter_all_pages(ctx, operation, args, request))
+
+
+# pylint: disable-next=too-many-arguments
+def iter_all_pages(
+    ctx: "CLI",
+    operation: OpenAPIOperation,
+    args: Union[List[str], argparse.Namespace],
+    request: Optional[RequestContext] = None,
+    skip_error_handling: bool = False,
+    filter_header: Optional[dict] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Retrieves all pages of a resource, yielding the JSON response for each
+    page in order as it is received.
+
+    Only a bounded number of pages are held in memory at once, so results
+    can be processed as they arrive rather than after the last page.
+
+    :param ctx: The main CLI object that maintains API request state.
+    :param operation: The OpenAPI operation to be executed.
+    :param args: A list of arguments passed to the API request, or the
+                 arguments already parsed by the operation.
+    :param request: The context to make the requests with (default: from ctx).
+                    Each page is requested with a copy of this context.
+    :param skip_error_handling: Whether to raise a requests.HTTPError if a page
+                                can't be retrieved, rather than exiting.
+    :param filter_header: Optional filter header to be included in the requests
+                          (default: None).
+
+    :yield: The JSON response (as a dictionary) for each page.
+    """
+    if request is None:
+        request = RequestContext.from_cli(ctx, page_size=ALL_PAGES_PAGE_SIZE)
+
+    with timings.page(1):
+        response = do_request(
+            ctx,
+            operation,
+            args,
+            filter_header=filter_header,
+            skip_error_handling=skip_error_handling,
+            request=replace(request, page=1),
+        )
+
+        if skip_error_handling:
+            response.raise_for_status()
 
-    ctx.page_size = 500
-    ctx.page = 1
-    result = do_request(ctx, operation, args).json()
+        with timings.phase("JSON decode"):
+            result = response.json()
 
+    # Read this before yielding, since consumers may modify the result
     total_pages = result.get("pages")
 
+    yield result
+
     # If multiple pages exist, generate results for all additional pages
     if total_pages and total_pages > 1:
-        pages_needed = range(2, total_pages + 1)
-
-        result = _merge_results_data(
-            itertools.chain(
-                (result,),
-                _generate_all_pages_results(ctx, operation, args, pages_needed),
-            )
+        yield from _generate_all_pages_results(
+            ctx,
+            operation,
+            args,
+            range(2, total_pages + 1),
+            parallel=ctx.parallel_pages,
+            request=request,
+            skip_error_handling=skip_error_handling,
+            filter_header=filter_header,
         )
-    return result
 
 
+# pylint: disable-next=too-many-arguments
 def do_request(
     ctx: "CLI",
     operation: OpenAPIOperation,
-    args: List[str],
+    args: Union[List[str], argparse.Namespace],
     filter_header: Optional[dict] = None,
     skip_error_handling: bool = False,
-) -> (
-    Response
-):  # pylint: disable=too-many-locals,too-many-branches,too-many-statements
+    request: Optional[RequestContext] = None,
+) -> Response:
     """
     Makes an HTTP request to an API operation's URL and returns the resulting response.
     Optionally retries the request if specified, handles errors, and supports debugging.
 
     :param ctx: The main CLI object that maintains API request state.
     :param operation: The OpenAPI operation to be executed.
-    :param args: A list of arguments passed to the API request.
+    :param args: A list of arguments passed to the API request, or the
+                 arguments already parsed by the operation.
     :param filter_header: Optional filter header to be included in the request (default: None).
     :param skip_error_handling: Whether to skip error handling (default: False).
+    :param request: The context to make the request with (default: from ctx).
 
     :return: The `Response` object returned from the HTTP request.
     """
-    # TODO: Revisit using pre-built calls from OpenAPI
-    method = getattr(requests, operation.method)
-    headers = {
-        "Authorization": f"Bearer {ctx.config.get_token()}",
-        "Content-Type": "application/json",
-        "User-Agent": ctx.user_agent,
-    }
+    if request is None:
+        request = RequestContext.from_cli(ctx)
 
-    parsed_args = operation.parse_args(args)
-
-    url = _build_request_url(ctx, operation, parsed_args)
+    # TODO: Revisit using pre-built calls from OpenAPI
+    method = getattr(ctx.session, operation.method)
 
-    body = _build_request_body(ctx, operation, parsed_args)
+    prepared = _prepare_request(ctx, operation, args, filter_header, request)
 
-    filter_header = _build_filter_header(
-        operation, parsed_args, filter_header=filter_header
-    )
-    if filter_header is not None:
-        headers["X-Filter"] = filter_header
+    if prepared.fresh is not None:
+        return prepared.fresh
 
     # Print response debug info is requested
     if ctx.debug_request:
@@ -112,20 +218,184 @@ def do_request(
         # using single-line structured logging in the future.
         logger.debug(
             "\n%s",
-            "\n".join(_format_request_for_log(method, url, headers, body)),
+            "\n".join(
+                _format_request_for_log(
+                    method, prepared.url, prepared.headers, prepared.body
+                )
+            ),
         )
 
-    result = method(url, headers=headers, data=body, verify=API_CA_PATH)
+    def __send() -> Response:
+        # When recording timings, the body is downloaded separately so the
+        # time to the first byte of the response can be measured
+        with timings.phase("time to first byte"):
+            response = method(
+                prepared.url,
+                headers=prepared.headers,
+                data=prepared.body,
+                verify=API_CA_PATH,
+                stream=timings.enabled(),
+            )
 
-    # Print response debug info is requested
-    if ctx.debug_request:
-        logger.debug("\n%s", "\n".join(_format_response_for_log(result)))
+        if timings.enabled():
+            with timings.phase("body download"):
+                _ = response.content
+
+        return response
+
+    steps = _send_steps(ctx, operation, prepared, request)
+    step, value = next(steps)
+
+    while step != "done":
+        outcome = None
+
+        if step == "send":
+            try:
+                outcome = __send()
+            except (requests.ConnectionError, requests.Timeout) as e:
+                outcome = e
+        else:
+            with timings.phase(step):
+                time.sleep(value)
 
-    # Retry the request if necessary
-    while _check_retry(result) and not ctx.no_retry and ctx.retry_count < 3:
-        time.sleep(_get_retry_after(result.headers))
-        ctx.retry_count += 1
-        result = method(url, headers=headers, data=body, verify=API_CA_PATH)
+        step, value = steps.send(outcome)
+
+    result = value
+
+    return _finish_request(
+        ctx, operation, prepared, result, skip_error_handling
+    )
+
+
+@dataclass
+class PreparedRequest:  # pylint: disable=too-many-instance-attributes
+    """
+    A request to an API operation that is ready to be sent, along with
+    the state needed to handle its response.
+
+    This is built the same way however the request is sent, so requests
+    sent by linodecli.api_request_async are identical to those sent here.
+    """
+
+    url: str
+    headers: Dict[str, str]
+    body: Optional[str]
+    filter_header: Optional[str]
+    resource: str
+    rate_limit_key: str
+    cache_ttl: int = 0
+    cache_key: Optional[str] = None
+    cached: Optional[response_cache.CachedResponse] = None
+
+    # A cached response that is fresh enough to use without a request
+    fresh: Optional[Response] = None
+
+
+def _prepare_request(
+    ctx: "CLI",
+    operation: OpenAPIOperation,
+    args: Union[List[str], argparse.Namespace],
+    filter_header: Optional[dict],
+    request: RequestContext,
+) -> PreparedRequest:
+    """
+    Builds a request to an API operation, and looks up any cached response
+    to it.
+
+    :param ctx: The main CLI object that maintains API request state.
+    :param operation: The OpenAPI operation to be executed.
+    :param args: A list of arguments passed to the API request, or the
+                 arguments already parsed by the operation.
+    :param filter_header: Optional filter header to be included in the request.
+    :param request: The context to make the request with.
+
+    :return: The prepared request.
+    """
+    with timings.phase("request build"):
+        headers = {
+            "Authorization": f"Bearer {ctx.config.get_token()}",
+            "Content-Type": "application/json",
+            "User-Agent": ctx.user_agent,
+        }
+
+        if isinstance(args, argparse.Namespace):
+            # Building the filter header consumes the parsed arguments, so
+            # they're copied in case they're reused for another request
+            parsed_args = argparse.Namespace(**vars(args))
+        else:
+            parsed_args = operation.parse_args(args)
+
+        url = _build_request_url(ctx, operation, parsed_args, request)
+
+        body = _build_request_body(ctx, operation, parsed_args, request)
+
+        filter_header = _build_filter_header(
+            operation, parsed_args, filter_header=filter_header
+        )
+        if filter_header is not None:
+            headers["X-Filter"] = filter_header
+
+    # The resource collection this request belongs to, e.g. linode/instances
+    resource = response_cache.get_resource(operation.url_path)
+
+    prepared = PreparedRequest(
+        url=url,
+        headers=headers,
+        body=body,
+        filter_header=filter_header,
+        resource=resource,
+        rate_limit_key=rate_limit.get_key(
+            ctx.config.get_token(), urlparse(url).netloc, resource
+        ),
+        cache_ttl=_get_cache_ttl(ctx, operation),
+    )
+
+    if prepared.cache_ttl > 0:
+        prepared.cache_key = response_cache.get_key(
+            ctx.config.get_token(), url, filter_header
+        )
+
+        if not ctx.refresh_cache:
+            prepared.cached = response_cache.load(resource, prepared.cache_key)
+
+        if prepared.cached is not None and prepared.cached.is_fresh(
+            prepared.cache_ttl
+        ):
+            logger.debug("Using cached response for %s", url)
+            prepared.fresh = prepared.cached.to_response()
+        elif prepared.cached is not None:
+            headers.update(prepared.cached.get_validators())
+
+    return prepared
+
+
+def _finish_request(
+    ctx: "CLI",
+    operation: OpenAPIOperation,
+    prepared: PreparedRequest,
+    result: Response,
+    skip_error_handling: bool = False,
+) -> Response:
+    """
+    Handles the response to a request, updating the response cache and
+    exiting with an error if the request failed.
+
+    :param ctx: The main CLI object that maintains API request state.
+    :param operation: The OpenAPI operation that was executed.
+    :param prepared: The request that was sent.
+    :param result: The response to the request.
+    :param skip_error_handling: Whether to skip error handling (default: False).
+
+    :return: The response, or the cached response if it is still valid.
+    """
+    if prepared.cached is not None and result.status_code == 304:
+        logger.debug("Cached response for %s is still valid", prepared.url)
+        result = prepared.cached.revalidated()
+    elif prepared.cache_ttl > 0 and result.status_code == 200:
+        response_cache.store(prepared.resource, prepared.cache_key, result)
+    elif operation.method != "get" and 199 < result.status_code < 399:
+        # Any cached responses for this resource may now be outdated
+        response_cache.invalidate(prepared.resource)
 
     _attempt_warn_old_version(ctx, result)
 
@@ -136,7 +406,153 @@ def do_request(
     return result
 
 
-def _merge_results_data(results: Iterable[dict]) -> Optional[Dict[str, Any]]:
+def _send_steps(
+    ctx: "CLI",
+    operation: OpenAPIOperation,
+    prepared: "PreparedRequest",
+    request: RequestContext,
+) -> Generator[Tuple[str, Any], Union[None, Response, Exception], None]:
+    """
+    Applies the CLI's rate limit and retry policy to sending a request,
+    leaving the waiting and sending to the caller, so requests sent from
+    threads and from coroutines are handled the same way.
+
+    Each step yielded is a (step, value) tuple, where the step is one of:
+
+    - "rate limit wait" or "retry wait"; the caller should wait the number
+      of seconds given by the value.  The step is also the timing phase.
+    - "send"; the caller should send the request once and send back its
+      response, or the requests.ConnectionError or requests.Timeout raised.
+    - "done"; the value is the response to the last attempt.
+
+    If the last attempt raised an error that isn't retried, it is re-raised.
+    Advancing this reads and writes the shared rate limit state.
+
+    :param ctx: The main CLI object that maintains API request state.
+    :param operation: The OpenAPI operation being executed.
+    :param prepared: The request to send.
+    :param request: The context of the request, which records the number of
+                    retries made.
+
+    :return: A generator of the steps to send the request.
+    """
+    attempt = 1
+
+    while True:
+        # Wait for our turn if the API's rate limit is nearly exhausted
+        for wait in rate_limit.waits(prepared.rate_limit_key):
+            yield "rate limit wait", wait
+
+        outcome = yield "send", None
+
+        if isinstance(outcome, Exception):
+            delay = _get_retry_delay(ctx, operation, attempt, error=outcome)
+            if delay is None:
+                raise outcome
+        else:
+            rate_limit.update(prepared.rate_limit_key, outcome)
+
+            # Print response debug info is requested
+            if ctx.debug_request:
+                logger.debug(
+                    "\n%s", "\n".join(_format_response_for_log(outcome))
+                )
+
+            delay = _get_retry_delay(ctx, operation, attempt, response=outcome)
+            if delay is None:
+                yield "done", outcome
+                return
+
+        yield "retry wait", delay
+
+        attempt += 1
+        request.retry_count += 1
+
+
+def _get_retry_delay(
+    ctx: "CLI",
+    operation: OpenAPIOperation,
+    attempt: int,
+    response: Optional[Response] = None,
+    error: Optional[Exception] = None,
+) -> Optional[float]:
+    """
+    Returns how long to wait before retrying a request that failed with
+    the given response or error, according to the CLI's retry policy.
+
+    :param ctx: The main CLI object that maintains API request state.
+    :param operation: The OpenAPI operation being executed.
+    :param attempt: The number of attempts made so far.
+    :param response: The response to the last attempt, if one was received.
+    :param error: The error raised by the last attempt, if any.
+
+    :return: The number of seconds to wait, or None if the request should
+             not be retried.
+    """
+    policy = ctx.retry_policy
+
+    if not policy.should_retry(
+        operation.method, attempt, response=response, error=error
+    ):
+        return None
+
+    if error is not None:
+        delay = policy.get_delay(attempt)
+        logger.debug("Request failed (%s); retrying in %.2fs", error, delay)
+    else:
+        delay = policy.get_delay(attempt, response=response)
+        logger.debug(
+            "Request failed with status %s; retrying in %.2fs",
+            response.status_code,
+            delay,
+        )
+
+    return delay
+
+
+def _get_cache_ttl(ctx: "CLI", operation: OpenAPIOperation) -> int:
+    """
+    Returns the number of seconds responses for an operation may be cached for,
+    or 0 if they should not be cached.
+
+    Only GET responses are cached, and only if a TTL is configured for
+    the operation (cache_ttl.COMMAND.ACTION), its command (cache_ttl.COMMAND),
+    or all commands (cache_ttl).
+
+    :param ctx: The main CLI object that maintains API request state.
+    :param operation: The OpenAPI operation to be executed.
+
+    :return: The cache TTL for responses of this operation, in seconds.
+    """
+    if operation.method != "get" or ctx.no_cache:
+        return 0
+
+    for key in (
+        f"cache_ttl.{operation.command}.{operation.action}",
+        f"cache_ttl.{operation.command}",
+        "cache_ttl",
+    ):
+        value = ctx.config.get_value(key)
+        if value is not None:
+            break
+    else:
+        return 0
+
+    try:
+        ttl = int(value)
+        if ttl < 0:
+            raise ValueError
+    except ValueError:
+        print(
+            f"Invalid {key} {value}; must be a non-negative integer",
+            file=sys.stderr,
+        )
+        sys.exit(ExitCodes.ARGUMENT_ERROR)
+
+    return ttl
+
+
+def merge_results_data(results: Iterable[dict]) -> Optional[Dict[str, Any]]:
     """
     Merges multiple JSON responses into one, combining their 'data' fields
     and setting 'pages' and 'page' to 1 if they exist.
@@ -167,26 +583,67 @@ def _merge_results_data(results: Iterable[dict]) -> Optional[Dict[str, Any]]:
     return merged_result
 
 
+# pylint: disable-next=too-many-arguments
 def _generate_all_pages_results(
     ctx: "CLI",
     operation: OpenAPIOperation,
-    args: List[str],
+    args: Union[List[str], argparse.Namespace],
     pages_needed: Iterable[int],
+    parallel: int = 1,
+    request: Optional[RequestContext] = None,
+    skip_error_handling: bool = False,
+    filter_header: Optional[dict] = None,
 ) -> Iterable[dict]:
     """
     Generates results from multiple pages by iterating through the specified page numbers
-    and yielding the JSON response for each page.e.
+    and yielding the JSON response for each page.
+
+    If parallel is greater than 1, up to that many pages are requested at once.
+    Results are always yielded in the order of pages_needed.
 
     :param ctx: The main CLI object that maintains API request state.
     :param operation: The OpenAPI operation to be executed.
-    :param args: A list of arguments passed to the API request.
+    :param args: A list of arguments passed to the API request, or the
+                 arguments already parsed by the operation.
     :param pages_needed: An iterable of page numbers to request.
+    :param parallel: The maximum number of pages to request at once.
+    :param request: The context to make the requests with (default: from ctx).
+                    Each page is requested with a copy of this context.
+    :param skip_error_handling: Whether to raise a requests.HTTPError if a page
+                                can't be retrieved, rather than exiting.
+    :param filter_header: Optional filter header to be included in the requests
+                          (default: None).
 
     :yield: The JSON response (as a dictionary) for each requested page.
     """
-    for p in pages_needed:
-        ctx.page = p
-        yield do_request(ctx, operation, args).json()
+    if request is None:
+        request = RequestContext.from_cli(ctx)
+
+    def __get_page(p: int) -> dict:
+        with timings.page(p):
+            response = do_request(
+                ctx,
+                operation,
+                args,
+                filter_header=filter_header,
+                skip_error_handling=skip_error_handling,
+                request=replace(request, page=p),
+            )
+
+            if skip_error_handling:
+                response.raise_for_status()
+
+            with timings.phase("JSON decode"):
+                return response.json()
+
+    # Pages are yielded (or their errors raised) in page order, and no
+    # remaining pages are requested once a page fails
+    yield from map_ordered(
+        __get_page,
+        pages_needed,
+        parallel,
+        wait=functools.partial(timings.phase, "waiting for pages"),
+    )
 
 
 def _build_filter_header(
@@ -250,7 +707,10 @@ def _build_filter_header(
 
 
 def _build_request_url(
-    ctx: "CLI", operation: OpenAPIOperation, parsed_args: Any
+    ctx: "CLI",
+    operation: OpenAPIOperation,
+    parsed_args: Any,
+    request: Optional[RequestContext] = None,
 ) -> str:
     """
     Constructs the full request URL for an API operation,
@@ -259,9 +719,13 @@ def _build_request_url(
     :param ctx: The main CLI object that maintains API request state.
     :param operation: The OpenAPI operation to be executed.
     :param parsed_args: The parsed arguments from the CLI or request.
+    :param request: The context of the request (default: from ctx).
 
     :return: The fully constructed request URL as a string.
     """
+    if request is None:
+        request = RequestContext.from_cli(ctx)
+
     url_base = handle_url_overrides(
         operation.url_base,
         host=ctx.config.get_value("api_host"),
@@ -281,7 +745,7 @@ def _build_request_url(
 
     # Append pagination parameters for GET requests
     if operation.method == "get":
-        result += f"?page={ctx.page}&page_size={ctx.page_size}"
+        result += f"?page={request.page}&page_size={request.page_size}"
 
     return result
 
@@ -337,7 +801,10 @@ def _traverse_request_body(o: Any) -> Any:
 
 
 def _build_request_body(
-    ctx: "CLI", operation: OpenAPIOperation, parsed_args: Any
+    ctx: "CLI",
+    operation: OpenAPIOperation,
+    parsed_args: Any,
+    request: Optional[RequestContext] = None,
 ) -> Optional[str]:
     """
     Builds the request body for API calls, handling default values and nested structures.
@@ -345,12 +812,16 @@ def _build_request_body(
     :param ctx: The main CLI object that maintains API request state.
     :param operation: The OpenAPI operation to be executed.
     :param parsed_args: The parsed arguments from the CLI or request.
+    :param request: The context of the request (default: from ctx).
 
     :return: A JSON string representing the request body, or None if not applicable.
     """
+    if request is None:
+        request = RequestContext.from_cli(ctx)
+
     if operation.method in ("get", "delete"):
         # GET and DELETE operations don't have a body
-        if ctx.raw_body is not None:
+        if request.raw_body is not None:
             print(
                 f"--raw-body cannot be specified for actions with method {operation.method}",
                 file=sys.stderr,
@@ -367,7 +838,7 @@ def _build_request_body(
 
     # If the user has specified the --raw-body argument,
     # return it.
-    if ctx.raw_body is not None:
+    if request.raw_body is not None:
         specified_keys = [
             k for k, v in vars(parsed_args).items() if __should_include(k, v)
         ]
@@ -380,10 +851,10 @@ def _build_request_body(
             )
             sys.exit(ExitCodes.ARGUMENT_ERROR)
 
-        return ctx.raw_body
+        return request.raw_body
 
     # Merge defaults into body if applicable
-    if ctx.defaults:
+    if request.defaults:
         parsed_args = ctx.config.update(parsed_args, operation.allowed_defaults)
 
     expanded_json = {}
@@ -474,6 +945,9 @@ def _attempt_warn_old_version(ctx: "CLI", result: Any) -> None:
     if ctx.suppress_warnings:
         return
 
+    # pylint: disable-next=import-outside-toplevel
+    from packaging import version
+
     api_version_higher = False
 
     if "X-Spec-Version" in result.headers:
@@ -511,45 +985,35 @@ def _attempt_warn_old_version(ctx: "CLI", result: Any) -> None:
                 file=sys.stderr,
             )
 
-    if api_version_higher:
-        # check to see if there is, in fact, a version to upgrade to.  If not, don't
-        # suggest an upgrade (since there's no package anyway)
-        new_version_exists = False
+    if not api_version_higher:
+        return
 
-        try:
-            # do this all in a try block since it must _never_ prevent the CLI
-            # from showing command output
-            pypi_response = requests.get(
-                "https://pypi.org/pypi/linode-cli/json", timeout=1  # seconds
-            )
+    suppress_version_warning = ctx.config.get_bool(
+        "suppress-version-warning"
+    ) or os.getenv("LINODE_CLI_SUPPRESS_VERSION_WARNING")
+    if suppress_version_warning:
+        return
 
-            if pypi_response.status_code == 200:
-                # we got data back
-                pypi_version = pypi_response.json()["info"]["version"]
+    # check to see if there is, in fact, a version to upgrade to.  If not, don't
+    # suggest an upgrade (since there's no package anyway).  This never waits
+    # on PyPI, so it can't delay the command output.
+    latest_version = version_check.get_latest_version()
 
-                # no need to be fancy; these should always be valid versions
-                if version.parse(pypi_version) > version.parse(ctx.version):
-                    new_version_exists = True
-        except:
-            # I know, but if anything happens here the end user should still
-            # be able to see the command output
-            print(
-                "Unable to determine if a new linode-cli package is available "
-                "in pypi.  If this message persists, open a ticket or invoke "
-                "with --suppress-warnings",
-                file=sys.stderr,
-            )
-        suppress_version_warning = ctx.config.get_bool(
-            "suppress-version-warning"
-        ) or os.getenv("LINODE_CLI_SUPPRESS_VERSION_WARNING")
-        if new_version_exists and not suppress_version_warning:
-            print(
-                f"The API responded with version {spec_version}, which is newer than "
-                f"the CLI's version of {ctx.spec_version}.  Please update the CLI to get "
-                "access to the newest features.  You can update with a "
-                "simple `pip3 install --upgrade linode-cli`",
-                file=sys.stderr,
-            )
+    try:
+        new_version_exists = latest_version is not None and version.parse(
+            latest_version
+        ) > version.parse(ctx.version)
+    except version.InvalidVersion:
+        new_version_exists = False
+
+    if new_version_exists:
+        print(
+            f"The API responded with version {spec_version}, which is newer than "
+            f"the CLI's version of {ctx.spec_version}.  Please update the CLI to get "
+            "access to the newest features.  You can update with a "
+            "simple `pip3 install --upgrade linode-cli`",
+            file=sys.stderr,
+        )
 
 
 def _handle_error(ctx: "CLI", response: Any) -> None:
@@ -576,34 +1040,3 @@ def _handle_error(ctx: "CLI", response: Any) -> None:
             to=sys.stderr,
         )
     sys.exit(ExitCodes.REQUEST_FAILED)
-
-
-def _check_retry(response):
-    """
-    Check for valid retry scenario, returns true if retry is valid.
-
-    :param response: The HTTP response object from the API request.
-    """
-    if response.status_code in (408, 429):
-        # request timed out or rate limit exceeded
-        return True
-
-    return (
-        response.headers
-        and response.status_code == 400
-        and response.headers.get("Server") == "nginx"
-        and response.headers.get("Content-Type") == "text/html"
-    )
-
-
-def _get_retry_after(headers: Dict[str, str]) -> int:
-    """
-    Extracts the "Retry-After" value from the response headers and returns it
-    as an integer representing the number of seconds to wait before retrying.
-
-    :param headers: The HTTP response headers as a dictionary.
-
-    :return: The number of seconds to wait before retrying, or 0 if not specified.
-    """
-    retry_str = headers.get("Retry-After", "")
-    return int(retry_str) if retry_str else 0
@@ -0,0 +1,248 @@
+"""
+This module sends requests to the Linode API from asyncio coroutines, so
+many operations can be awaited concurrently from a single thread.
+
+Requests are built, cached, retried and rate limited exactly as they are
+by linodecli.api_request, which provides the policy for each step of sending
+a request.  If aiohttp is installed, requests are sent with an aiohttp session
+shared by every request made from the same event loop with the same pool
+size; otherwise, each request is sent with the CLI's requests session in the
+event loop's default executor.
+
+Reading and writing the response cache and the shared rate limit state
+blocks on disk I/O and file locks, so it is also done in the default
+executor rather than on the event loop.
+"""
+
+import argparse
+import asyncio
+import functools
+import ssl
+import weakref
+from logging import getLogger
+from types import ModuleType, SimpleNamespace
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union
+
+import requests
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+from linodecli.helpers import API_CA_PATH
+
+from .api_request import (
+    PreparedRequest,
+    RequestContext,
+    _finish_request,
+    _format_request_for_log,
+    _prepare_request,
+    _send_steps,
+)
+from .baked.operation import OpenAPIOperation
+
+if TYPE_CHECKING:
+    from linodecli.cli import CLI
+
+logger = getLogger(__name__)
+
+# The aiohttp sessions requests are sent with from each event loop,
+# by pool size
+_sessions: (
+    "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[int, Any]]"
+) = weakref.WeakKeyDictionary()
+
+
+# pylint: disable-next=too-many-arguments
+async def do_request(
+    ctx: "CLI",
+    operation: OpenAPIOperation,
+    args: Union[List[str], argparse.Namespace],
+    filter_header: Optional[dict] = None,
+    skip_error_handling: bool = False,
+    request: Optional[RequestContext] = None,
+) -> Response:
+    """
+    Makes an HTTP request to an API operation's URL and returns the resulting
+    response, without blocking the event loop.  This is an asyncio counterpart
+    of linodecli.api_request.do_request(...), and takes the same arguments.
+
+    :param ctx: The main CLI object that maintains API request state.
+    :param operation: The OpenAPI operation to be executed.
+    :param args: A list of arguments passed to the API request, or the
+                 arguments already parsed by the operation.
+    :param filter_header: Optional filter header to be included in the request (default: None).
+    :param skip_error_handling: Whether to skip error handling (default: False).
+    :param request: The context to make the request with (default: from ctx).
+
+    :return: The `Response` object returned from the HTTP request.
+    """
+    if request is None:
+        request = RequestContext.from_cli(ctx)
+
+    prepared = await _run_blocking(
+        _prepare_request, ctx, operation, args, filter_header, request
+    )
+
+    if prepared.fresh is not None:
+        return prepared.fresh
+
+    # Print response debug info is requested
+    if ctx.debug_request:
+        logger.debug(
+            "\n%s",
+            "\n".join(
+                _format_request_for_log(
+                    getattr(requests, operation.method),
+                    prepared.url,
+                    prepared.headers,
+                    prepared.body,
+                )
+            ),
+        )
+
+    # The steps read and write the shared rate limit state, so they're
+    # advanced in the executor
+    steps = _send_steps(ctx, operation, prepared, request)
+    step, value = await _run_blocking(next, steps)
+
+    while step != "done":
+        outcome = None
+
+        if step == "send":
+            try:
+                outcome = await _send(ctx, operation.method, prepared)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                outcome = e
+        else:
+            await asyncio.sleep(value)
+
+        step, value = await _run_blocking(steps.send, outcome)
+
+    return await _run_blocking(
+        _finish_request, ctx, operation, prepared, value, skip_error_handling
+    )
+
+
+async def close():
+    """
+    Closes the aiohttp sessions used by the running event loop, if any.  This
+    should be awaited once the loop has finished making requests.
+    """
+    sessions = _sessions.pop(asyncio.get_running_loop(), {})
+
+    for session in sessions.values():
+        await session.close()
+
+
+async def _run_blocking(func: Callable[..., Any], *args: Any) -> Any:
+    """
+    Runs a function that blocks (e.g. on disk I/O) in the running event
+    loop's default executor, so other requests aren't stalled by it.
+    """
+    return await asyncio.get_running_loop().run_in_executor(
+        None, functools.partial(func, *args)
+    )
+
+
+async def _send(ctx: "CLI", method: str, prepared: PreparedRequest) -> Response:
+    """
+    Sends a prepared request once, with aiohttp if it is installed.
+    """
+    aiohttp = _import_aiohttp()
+
+    if aiohttp is None:
+        return await asyncio.get_running_loop().run_in_executor(
+            None,
+            functools.partial(
+                getattr(ctx.session, method),
+                prepared.url,
+                headers=prepared.headers,
+                data=prepared.body,
+                verify=API_CA_PATH,
+            ),
+        )
+
+    session = _get_session(ctx, aiohttp)
+
+    # Errors are raised as the equivalent requests errors, so they're
+    # retried by the same policy
+    try:
+        async with session.request(
+            method.upper(),
+            prepared.url,
+            headers=prepared.headers,
+            data=prepared.body,
+            ssl=_get_ssl_context(),
+        ) as response:
+            content = await response.read()
+    except (asyncio.TimeoutError, aiohttp.ServerTimeoutError) as e:
+        raise requests.Timeout(str(e)) from e
+    except aiohttp.ClientError as e:
+        raise requests.ConnectionError(str(e)) from e
+
+    return _to_response(response, content)
+
+
+def _to_response(response: Any, content: bytes) -> Response:
+    """
+    Converts an aiohttp response to a requests response, so it can be handled
+    the same way as responses to requests sent by linodecli.api_request.
+    """
+    result = Response()
+    result.status_code = response.status
+    result.reason = response.reason
+    result.url = str(response.url)
+    result.headers = CaseInsensitiveDict(response.headers)
+    result._content = content  # pylint: disable=protected-access
+
+    # The debug output reads the HTTP version from the raw response
+    result.raw = SimpleNamespace(
+        version=response.version.major * 10 + response.version.minor
+    )
+
+    return result
+
+
+def _get_session(ctx: "CLI", aiohttp: ModuleType) -> Any:
+    """
+    Returns the aiohttp session used by the running event loop for the CLI's
+    pool size, creating it the first time it is requested.  At most that
+    many connections are opened at once by the session, so CLIs (or clients)
+    with different pool sizes don't share one.
+    """
+    pool_size = ctx.get_pool_size()
+    sessions = _sessions.setdefault(asyncio.get_running_loop(), {})
+    session = sessions.get(pool_size)
+
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=pool_size)
+        )
+        sessions[pool_size] = session
+
+    return session
+
+
+@functools.lru_cache(maxsize=None)
+def _get_ssl_context() -> Union[ssl.SSLContext, bool]:
+    """
+    Returns the SSL context used to verify the API's certificate, which uses
+    the CA bundle given by LINODE_CLI_CA if set.
+    """
+    if isinstance(API_CA_PATH, str):
+        return ssl.create_default_context(cafile=API_CA_PATH)
+
+    return True
+
+
+@functools.lru_cache(maxsize=None)
+def _import_aiohttp() -> Optional[ModuleType]:
+    """
+    Returns the aiohttp module, or None if it isn't installed.
+    """
+    try:
+        # pylint: disable-next=import-outside-toplevel
+        import aiohttp
+    except ImportError:
+        return None
+
+    return aiohttp
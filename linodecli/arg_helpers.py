@@ -6,13 +6,16 @@ functionalities for the Linode CLI.
 """
 
 import sys
-from argparse import ArgumentParser
+from argparse import ArgumentParser, Namespace
 from configparser import ConfigParser
 from importlib import import_module
-from typing import Dict, Tuple
+from typing import Dict, List, Tuple
 
 from linodecli import plugins
+from linodecli.exit_codes import ExitCodes
+from linodecli.help_formatter import SortingHelpFormatter
 from linodecli.helpers import (
+    DEFAULT_PARALLEL_PAGES,
     register_args_shared,
     register_debug_arg,
     register_pagination_args_shared,
@@ -20,6 +23,29 @@ from linodecli.helpers import (
 from linodecli.output.helpers import register_output_args_shared
 
 
+def build_parser() -> ArgumentParser:
+    """
+    Builds the parser for the static command arguments of the Linode CLI.
+
+    Abbreviations of these arguments aren't accepted; the arguments of the
+    action are parsed later, and an abbreviation would be ambiguous with (or
+    take the place of) any action argument that shares its prefix, such as
+    an action's --id and --ids.
+
+    :return: The ArgumentParser instance.
+    """
+    return register_args(
+        ArgumentParser(
+            "linode-cli",
+            add_help=False,
+            allow_abbrev=False,
+            formatter_class=SortingHelpFormatter,
+            description="The Linode Command Line Interface.\n\n"
+            "Aliases: lin, linode",
+        )
+    )
+
+
 def register_args(parser: ArgumentParser) -> ArgumentParser:
     """
     Register static command arguments for the Linode CLI.
@@ -61,6 +87,27 @@ def register_args(parser: ArgumentParser) -> ArgumentParser:
         help="Skip retrying on common errors like timeouts.",
     )
 
+    parser.add_argument(
+        "--retry-max-attempts",
+        metavar="COUNT",
+        type=int,
+        help="The maximum number of times to send a request that fails "
+        "with a transient error, including the first attempt.",
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Don't use or store cached responses for this command.",
+    )
+
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore cached responses for this command and replace them "
+        "with fresh ones.",
+    )
+
     parser.add_argument(
         "--version",
         "-v",
@@ -90,6 +137,37 @@ def register_args(parser: ArgumentParser) -> ArgumentParser:
         + "Additionally, this argument can only be used with POST and PUT actions.",
     )
 
+    parser.add_argument(
+        "--parallel-pages",
+        metavar="COUNT",
+        type=int,
+        default=DEFAULT_PARALLEL_PAGES,
+        help="When using --all-rows, the maximum number of pages to request "
+        f"at once.  Defaults to {DEFAULT_PARALLEL_PAGES}.",
+    )
+
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Print how long each phase of the command took to stderr.",
+    )
+
+    parser.add_argument(
+        "--profile",
+        metavar="PATH",
+        nargs="?",
+        help="Profile the command and write the results to a pstats file.  "
+        "The path must be given as --profile=PATH; by default, the file is "
+        "named after the command and written to the current directory.",
+    )
+
+    parser.add_argument(
+        "--profile-memory",
+        action="store_true",
+        help="Print the peak memory usage of the command and the largest "
+        "allocations to stderr.",
+    )
+
     # Register shared argument groups
     register_output_args_shared(parser)
     register_pagination_args_shared(parser)
@@ -99,6 +177,33 @@ def register_args(parser: ArgumentParser) -> ArgumentParser:
     return parser
 
 
+def parse_bake_args(args: List[str]) -> Namespace:
+    """
+    Parses the arguments specific to the bake command.
+
+    :param args: The arguments remaining after the global arguments are parsed.
+
+    :return: The parsed bake arguments.
+    """
+    parser = ArgumentParser("linode-cli bake", add_help=False)
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="The number of worker processes to bake operations with. "
+        "If 0, one worker is used per CPU.",
+    )
+
+    parsed, _ = parser.parse_known_args(args)
+
+    if parsed.jobs < 0:
+        print("--jobs must not be negative", file=sys.stderr)
+        sys.exit(ExitCodes.ARGUMENT_ERROR)
+
+    return parsed
+
+
 # TODO: maybe move to plugins/__init__.py
 def register_plugin(
     module: str, config: ConfigParser, ops: Dict[str, str]
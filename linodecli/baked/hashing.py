@@ -0,0 +1,156 @@
+"""
+Logic for hashing the path items of an OpenAPI spec so operations for unchanged
+paths can be reused between bakes.
+"""
+
+import glob
+import hashlib
+import json
+import os
+from typing import Any, Dict, Optional, Set
+
+
+def hash_path_items(spec: Dict[str, Any], salt: str = "") -> Dict[str, str]:
+    """
+    Hashes each path item in the given spec along with every component it
+    references, directly or transitively, through a ``$ref``.
+
+    Two path items with the same hash will always produce the same operations
+    when baked, so long as they are baked by the same version of the CLI.
+
+    :param spec: The parsed OpenAPI spec.
+    :type spec: Dict[str, Any]
+    :param salt: An additional value to include in every hash (e.g. the CLI version).
+    :type salt: str
+
+    :returns: A mapping of each path in the spec to the hex digest of its content.
+    :rtype: Dict[str, str]
+    """
+    # The servers are used to resolve the URL of every operation
+    global_digest = _digest([salt, spec.get("servers")])
+
+    ref_digests = {}
+    ref_children = {}
+
+    def __ref_closure(refs: Set[str]) -> Set[str]:
+        closure = set()
+        pending = list(refs)
+
+        while pending:
+            ref = pending.pop()
+            if ref in closure:
+                continue
+
+            closure.add(ref)
+
+            if ref not in ref_children:
+                target = _resolve_ref(spec, ref)
+                ref_digests[ref] = _digest(target)
+                ref_children[ref] = _find_refs(target)
+
+            pending.extend(ref_children[ref])
+
+        return closure
+
+    result = {}
+
+    for path, item in spec.get("paths", {}).items():
+        if not isinstance(item, dict):
+            continue
+
+        closure = __ref_closure(_find_refs(item))
+
+        result[path] = _digest(
+            [
+                global_digest,
+                path,
+                item,
+                [(ref, ref_digests[ref]) for ref in sorted(closure)],
+            ]
+        )
+
+    return result
+
+
+def source_digest() -> str:
+    """
+    Returns a digest of the source of the modules used to build operations.
+
+    This should be included in the salt passed to hash_path_items(...) so that
+    operations baked by different versions of the baking logic are never reused.
+
+    :returns: The hex digest of the baking logic's source.
+    :rtype: str
+    """
+    result = hashlib.sha256()
+
+    for source_path in sorted(
+        glob.glob(os.path.join(os.path.dirname(__file__), "*.py"))
+    ):
+        with open(source_path, "rb") as f:
+            result.update(f.read())
+
+    return result.hexdigest()
+
+
+def _digest(value: Any) -> str:
+    """
+    Returns a stable hex digest of the given JSON-like value.
+    """
+    # YAML specs may contain values (e.g. dates) that aren't JSON-serializable
+    encoded = json.dumps(value, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def _find_refs(value: Any) -> Set[str]:
+    """
+    Returns every $ref string found in the given JSON-like value.
+    """
+    refs = set()
+    pending = [value]
+
+    while pending:
+        entry = pending.pop()
+
+        if isinstance(entry, dict):
+            ref = entry.get("$ref")
+            if isinstance(ref, str):
+                refs.add(ref)
+
+            pending.extend(entry.values())
+        elif isinstance(entry, list):
+            pending.extend(entry)
+
+    return refs
+
+
+def _resolve_ref(spec: Dict[str, Any], ref: str) -> Optional[Any]:
+    """
+    Resolves a local JSON pointer $ref (e.g. #/components/schemas/Foo) against
+    the given spec.
+
+    :returns: The referenced value, or None if the ref could not be resolved.
+    """
+    if not ref.startswith("#/"):
+        return None
+
+    segments = [
+        segment.replace("~1", "/").replace("~0", "~")
+        for segment in ref[2:].split("/")
+    ]
+
+    result = spec
+
+    for segment in segments:
+        if isinstance(result, dict) and segment in result:
+            result = result[segment]
+        elif isinstance(result, list) and segment.isdigit():
+            index = int(segment)
+            if index >= len(result):
+                return None
+
+            result = result[index]
+        else:
+            return None
+
+    return result
@@ -1,9 +1,11 @@
+# pylint: disable=too-many-lines
 """
 CLI Operation logic
 """
 
 import argparse
 import glob
+import itertools
 import json
 import logging
 import platform
@@ -14,12 +16,10 @@ from collections.abc import Callable
 from dataclasses import dataclass
 from getpass import getpass
 from os import environ, path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
 from urllib.parse import urlparse
 
-import openapi3.paths
-from openapi3.paths import Operation, Parameter
-
+from linodecli import timings
 from linodecli.baked.parsing import simplify_description
 from linodecli.baked.request import (
     OpenAPIFilteringRequest,
@@ -27,11 +27,17 @@ from linodecli.baked.request import (
     OpenAPIRequestArg,
 )
 from linodecli.baked.response import OpenAPIResponse
-from linodecli.baked.util import unescape_arg_segment
+from linodecli.baked.util import (
+    intern_str,
+    set_slots_state,
+    unescape_arg_segment,
+)
 from linodecli.exit_codes import ExitCodes
 from linodecli.help_formatter import SortingHelpFormatter
 from linodecli.output.output_handler import OutputHandler
-from linodecli.overrides import OUTPUT_OVERRIDES
+
+if TYPE_CHECKING:
+    from openapi3.paths import Operation, Parameter
 
 
 def parse_boolean(value: str) -> bool:
@@ -149,6 +155,20 @@ class ListArgumentAction(argparse.Action):
     lists in the output namespace.
     """
 
+    def __init__(
+        self, *args, adjacent_keys: Optional[List[str]] = None, **kwargs
+    ):
+        """
+        :param adjacent_keys: The destinations of all fields in the same list
+                              object as this field, including this field.
+                              If None, these are found in the namespace on
+                              each call.
+        :type adjacent_keys: Optional[List[str]]
+        """
+        super().__init__(*args, **kwargs)
+
+        self.adjacent_keys = adjacent_keys
+
     def __call__(
         self,
         parser: argparse.ArgumentParser,
@@ -170,11 +190,13 @@ class ListArgumentAction(argparse.Action):
             return
 
         # A list of adjacent fields
-        adjacent_keys = [
-            k
-            for k in vars(namespace).keys()
-            if k.split(".")[:-1] == dest_parent
-        ]
+        adjacent_keys = self.adjacent_keys
+        if adjacent_keys is None:
+            adjacent_keys = [
+                k
+                for k in vars(namespace).keys()
+                if k.split(".")[:-1] == dest_parent
+            ]
 
         # Let's populate adjacent fields ahead of time
         for k in adjacent_keys:
@@ -278,13 +300,17 @@ class OpenAPIOperationParameter:
     A parameter is a variable element of the URL path, generally an ID or slug
     """
 
-    def __init__(self, parameter: openapi3.paths.Parameter):
+    __slots__ = ("name", "type")
+
+    __setstate__ = set_slots_state
+
+    def __init__(self, parameter: "Parameter"):
         """
         :param parameter: The Parameter object this is parsing values from
         :type parameter: openapi3.Parameter
         """
-        self.name = parameter.name
-        self.type = parameter.schema.type
+        self.name = intern_str(parameter.name)
+        self.type = intern_str(parameter.schema.type)
 
     def __repr__(self):
         return f"<OpenAPIOperationParameter {self.name}>"
@@ -296,8 +322,43 @@ class OpenAPIOperation:
     This is the class that should be pickled when building the CLI.
     """
 
+    __slots__ = (
+        "request",
+        "responses",
+        "response_model",
+        "allowed_defaults",
+        "required_fields",
+        "method",
+        "command",
+        "action",
+        "action_aliases",
+        "summary",
+        "description",
+        "description_rich",
+        "params",
+        "url_base",
+        "url_path",
+        "default_api_version",
+        "url",
+        "docs_url",
+        "samples",
+        # The cached argument parser for this operation.  This is never set
+        # while baking, so it is never pickled.
+        "_parser",
+    )
+
+    def __getstate__(self):
+        # The cached parser can't be pickled, and is rebuilt on demand anyway
+        return None, {
+            k: getattr(self, k)
+            for k in self.__slots__
+            if k != "_parser" and hasattr(self, k)
+        }
+
+    __setstate__ = set_slots_state
+
     def __init__(
-        self, command, operation: Operation, method, params
+        self, command, operation: "Operation", method, params
     ):  # pylint: disable=too-many-locals,too-many-branches,too-many-statements
         """
         Wraps an openapi3.Operation object and handles pulling out values relevant
@@ -343,18 +404,18 @@ class OpenAPIOperation:
             if self.response_model and self.response_model.is_paginated:
                 self.request = OpenAPIFilteringRequest(self.response_model)
 
-        self.method = method
-        self.command = command
+        self.method = intern_str(method)
+        self.command = intern_str(command)
 
         action = operation.extensions.get(
             "linode-cli-action", operation.operationId
         )
         if isinstance(action, list):
-            self.action_aliases = action[1:]
-            self.action = action[0]
+            self.action_aliases = [intern_str(v) for v in action[1:]]
+            self.action = intern_str(action[0])
         else:
             self.action_aliases = {}
-            self.action = action
+            self.action = intern_str(action)
 
         # Ensure the summary has punctuation
         self.summary = operation.summary.rstrip(".") + "."
@@ -388,7 +449,10 @@ class OpenAPIOperation:
             self.url_base,
             self.url_path,
             self.default_api_version,
-        ) = self._get_api_url_components(operation, params)
+        ) = (
+            intern_str(v)
+            for v in self._get_api_url_components(operation, params)
+        )
 
         self.url = self.url_base + self.url_path
 
@@ -447,7 +511,7 @@ class OpenAPIOperation:
 
     @staticmethod
     def _resolve_api_version(
-        params: List[Parameter], server_url: str
+        params: List["Parameter"], server_url: str
     ) -> Optional[str]:
         """
         Returns the API version for a given list of params and target URL.
@@ -492,7 +556,7 @@ class OpenAPIOperation:
 
     @staticmethod
     def _get_api_url_components(
-        operation: Operation, params: List[Parameter]
+        operation: "Operation", params: List["Parameter"]
     ) -> Tuple[str, str, str]:
         """
         Returns the URL components for a given operation.
@@ -547,15 +611,81 @@ class OpenAPIOperation:
         if self.response_model.attrs == []:
             return
 
+        # pylint: disable-next=import-outside-toplevel
+        from linodecli.overrides import OUTPUT_OVERRIDES
+
         override = OUTPUT_OVERRIDES.get(
             (self.command, self.action, handler.mode)
         )
         if override is not None and not override(self, handler, json):
             return
 
-        json = self.response_model.fix_json(json)
+        with timings.phase("fix_json"):
+            json = self.response_model.fix_json(json)
+
         handler.print_response(self.response_model, json)
 
+    def can_stream_response(self, handler: OutputHandler) -> bool:
+        """
+        Returns whether the pages of this operation's response can be printed
+        as they are received using process_response_pages.
+
+        :param handler: The CLI output handler.
+        :type handler: OutputHandler
+
+        :returns: Whether the response can be streamed.
+        :rtype: bool
+        """
+        if self.response_model is None or self.response_model.attrs == []:
+            return False
+
+        # Row extensions select from the whole response rather than each page
+        if self.response_model.rows:
+            return False
+
+        # pylint: disable-next=import-outside-toplevel
+        from linodecli.overrides import OUTPUT_OVERRIDES
+
+        # Output overrides expect the complete response
+        if (self.command, self.action, handler.mode) in OUTPUT_OVERRIDES:
+            return False
+
+        return handler.supports_streaming(self.response_model)
+
+    def process_response_pages(
+        self, pages: Iterable[Dict[str, Any]], handler: OutputHandler
+    ):
+        """
+        Processes each page of a paginated response as JSON and prints rows
+        as each page is received. The output is identical to calling
+        process_response_json with the merged pages.
+
+        This should only be used if can_stream_response returns True.
+
+        :param pages: The json response for each page.
+        :type pages: Iterable[Dict[str, Any]]
+
+        :param handler: The CLI output handler.
+        :type handler: OutputHandler
+        """
+        pages = iter(pages)
+
+        # Request the first page before printing anything so request
+        # errors are not preceded by partial output (e.g. headers)
+        first_page = next(pages, None)
+        if first_page is None:
+            return
+
+        def __fix_json(page: Dict[str, Any]) -> List[Any]:
+            with timings.phase("fix_json"):
+                return self.response_model.fix_json(page)
+
+        rows = itertools.chain.from_iterable(
+            map(__fix_json, itertools.chain((first_page,), pages))
+        )
+
+        handler.print_response(self.response_model, rows)
+
     def _add_args_filter(self, parser: argparse.ArgumentParser):
         """
         Builds up filter args for GET operation.
@@ -591,8 +721,8 @@ class OpenAPIOperation:
         parser.add_argument(
             "--order-by",
             choices=filterable_args,
-            help="Attribute to order the results by - must be filterable.",
-            required="--order" in sys.argv,
+            help="Attribute to order the results by - must be filterable. "
+            "Required if --order is specified.",
         )
 
         parser.add_argument(
@@ -616,6 +746,7 @@ class OpenAPIOperation:
         """
 
         list_items = []
+        actions = []
 
         # build args for body JSON
         for arg in self.args:
@@ -635,7 +766,7 @@ class OpenAPIOperation:
 
             if arg.datatype == "array":
                 # special handling for input arrays
-                parser.add_argument(
+                action = parser.add_argument(
                     "--" + arg_path_unescaped,
                     dest=arg.path,
                     metavar=arg_name_unescaped,
@@ -643,7 +774,7 @@ class OpenAPIOperation:
                     type=arg_type_handler,
                 )
             elif arg.is_child:
-                parser.add_argument(
+                action = parser.add_argument(
                     "--" + arg_path_unescaped,
                     dest=arg.path,
                     metavar=arg_name_unescaped,
@@ -654,7 +785,7 @@ class OpenAPIOperation:
             else:
                 if arg.datatype == "string" and arg.format == "password":
                     # special case - password input
-                    parser.add_argument(
+                    action = parser.add_argument(
                         "--" + arg_path_unescaped,
                         nargs="?",
                         action=PasswordPromptAction,
@@ -664,7 +795,7 @@ class OpenAPIOperation:
                     "ssl-cert",
                     "ssl-key",
                 ):
-                    parser.add_argument(
+                    action = parser.add_argument(
                         "--" + arg_path_unescaped,
                         dest=arg.path,
                         metavar=arg_name_unescaped,
@@ -672,13 +803,30 @@ class OpenAPIOperation:
                         type=arg_type_handler,
                     )
                 else:
-                    parser.add_argument(
+                    action = parser.add_argument(
                         "--" + arg_path_unescaped,
                         dest=arg.path,
                         metavar=arg_name_unescaped,
                         type=arg_type_handler,
                     )
 
+            actions.append(action)
+
+        # Resolve the adjacent fields of each list argument up front
+        # so they aren't searched for on every value
+        adjacent_keys = defaultdict(list)
+
+        for action in actions:
+            adjacent_keys[tuple(action.dest.split(".")[:-1])].append(
+                action.dest
+            )
+
+        for action in actions:
+            if isinstance(action, ListArgumentAction):
+                action.adjacent_keys = adjacent_keys[
+                    tuple(action.dest.split(".")[:-1])
+                ]
+
         return list_items
 
     def _validate_parent_child_conflicts(self, parsed: argparse.Namespace):
@@ -817,6 +965,7 @@ class OpenAPIOperation:
 
         return parsed
 
+    @timings.timed("arg parsing")
     def parse_args(self, args: Any) -> argparse.Namespace:
         """
         Given sys.argv after the operation name, parse args based on the params
@@ -829,6 +978,49 @@ class OpenAPIOperation:
         :rtype: Namespace
         """
 
+        parser, list_items = self._get_parser()
+
+        parsed = parser.parse_args(args)
+
+        if self.method == "get" and parsed.order_by is None:
+            # --order-by can't be marked as required, since the cached
+            # parser is shared between calls with different arguments
+            if any(v == "--order" or v.startswith("--order=") for v in args):
+                parser.error("the following arguments are required: --order-by")
+
+        if self.method in ("post", "put"):
+            self._validate_parent_child_conflicts(parsed)
+
+        return self._handle_list_items(list_items, parsed)
+
+    def get_option_strings(self) -> List[str]:
+        """
+        Returns the option strings (e.g. --label) this operation's
+        arguments are given with.
+
+        :returns: The option strings of this operation.
+        :rtype: List[str]
+        """
+        parser, _ = self._get_parser()
+
+        # pylint: disable-next=protected-access
+        return [v for action in parser._actions for v in action.option_strings]
+
+    def _get_parser(
+        self,
+    ) -> Tuple[argparse.ArgumentParser, List[Tuple[str, str]]]:
+        """
+        Returns the argument parser for this operation, building it the first
+        time it is requested.  Parsers hold no state between calls to
+        parse_args(...), so a single parser is reused for every call.
+
+        :returns: The parser and the list items it populates.
+        :rtype: Tuple[ArgumentParser, List[Tuple[str, str]]]
+        """
+        cached = getattr(self, "_parser", None)
+        if cached is not None:
+            return cached
+
         #  build an argparse
         parser = argparse.ArgumentParser(
             prog=f"linode-cli {self.command} {self.action}",
@@ -847,16 +1039,14 @@ class OpenAPIOperation:
         elif self.method in ("post", "put"):
             list_items = self._add_args_post_put(parser)
 
-        parsed = parser.parse_args(args)
+        # pylint: disable-next=attribute-defined-outside-init
+        self._parser = (parser, list_items)
 
-        if self.method in ("post", "put"):
-            self._validate_parent_child_conflicts(parsed)
-
-        return self._handle_list_items(list_items, parsed)
+        return self._parser
 
     @staticmethod
     def _resolve_operation_docs_url_legacy(
-        operation: Operation,
+        operation: "Operation",
     ) -> Optional[str]:
         """
         Gets the docs URL for a given operation in the legacy OpenAPI spec.
@@ -876,7 +1066,7 @@ class OpenAPIOperation:
         return f"https://www.linode.com/docs/api/{tag_path}/#{summary_path}"
 
     @staticmethod
-    def _resolve_operation_docs_url(operation: Operation) -> Optional[str]:
+    def _resolve_operation_docs_url(operation: "Operation") -> Optional[str]:
         """
         Gets the docs URL for a given OpenAPI operation.
 
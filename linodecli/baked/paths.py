@@ -0,0 +1,111 @@
+"""
+Logic for building the operations of a single path in an OpenAPI spec.
+
+Everything that decides which operations a path produces belongs in this
+package, so hashing.source_digest(...) covers it; operations reused from a
+previous bake are only ever as current as that digest.
+"""
+
+from logging import getLogger
+from typing import TYPE_CHECKING, List, Tuple
+
+from linodecli.baked.operation import OpenAPIOperation
+
+if TYPE_CHECKING:
+    from openapi3.paths import Path
+
+METHODS = ("get", "post", "put", "delete")
+
+logger = getLogger(__name__)
+
+
+def bake_path(
+    path: "Path",
+) -> List[Tuple[str, str, OpenAPIOperation]]:
+    """
+    Builds the operations for each method of the given path.
+
+    :param path: The path to build operations for.
+    :type path: openapi3.paths.Path
+
+    :returns: The command, action and operation for each operation built.
+    :rtype: List[Tuple[str, str, OpenAPIOperation]]
+    """
+    ext = {
+        "skip": "linode-cli-skip",
+        "action": "linode-cli-action",
+        "command": "linode-cli-command",
+        "defaults": "linode-cli-allowed-defaults",
+    }
+
+    result = []
+    command = path.extensions.get(ext["command"], None)
+
+    for m in METHODS:
+        operation = getattr(path, m)
+
+        if operation is None:
+            continue
+
+        operation_log_fmt = f"{m.upper()} {path.path[-1]}"
+
+        logger.debug(
+            "%s: Attempting to generate command for operation",
+            operation_log_fmt,
+        )
+
+        if ext["skip"] in operation.extensions:
+            logger.debug(
+                "%s: Skipping operation due to x-%s extension",
+                operation_log_fmt,
+                ext["skip"],
+            )
+            continue
+
+        # We don't do this in the parent loop because certain paths
+        # may only have skipped operations
+        if command is None:
+            raise KeyError(
+                f"{operation_log_fmt}: Missing x-{ext['command']} extension"
+            )
+
+        action = operation.extensions.get(ext["action"], None)
+
+        if action is None:
+            action = operation.operationId
+            logger.info(
+                "%s: Using operationId (%s) as action because "
+                "%s extension is not specified",
+                operation_log_fmt,
+                action,
+                ext["action"],
+            )
+
+        if not action:
+            logger.warning(
+                "%s: Skipping operation due to unresolvable action",
+                operation_log_fmt,
+            )
+            continue
+
+        if isinstance(action, list):
+            action = action[0]
+
+        operation = OpenAPIOperation(command, operation, m, path.parameters)
+
+        logger.debug(
+            "%s %s: Successfully built command for operation: "
+            "command='%s %s'; summary='%s'; paginated=%s; num_args=%s; num_attrs=%s",
+            operation.method.upper(),
+            operation.url_path,
+            operation.command,
+            operation.action,
+            operation.summary.rstrip("."),
+            operation.response_model and operation.response_model.is_paginated,
+            len(operation.args),
+            len(operation.attrs),
+        )
+
+        result.append((command, action, operation))
+
+    return result
@@ -2,28 +2,53 @@
 Request details for a CLI Operation
 """
 
-from typing import List, Optional
-
-from openapi3.paths import MediaType
-from openapi3.schemas import Schema
+from typing import TYPE_CHECKING, List, Optional
 
 from linodecli.baked.parsing import simplify_description
 from linodecli.baked.response import OpenAPIResponse
 from linodecli.baked.util import (
     _aggregate_schema_properties,
     escape_arg_segment,
+    intern_str,
+    memoize_schema,
+    set_slots_state,
 )
 
+if TYPE_CHECKING:
+    from openapi3.paths import MediaType
+    from openapi3.schemas import Schema
+
 
 class OpenAPIRequestArg:
     """
     A single argument to a request as defined by a Schema in the OpenAPI spec
     """
 
+    # Thousands of these are baked, so we avoid a per-instance __dict__
+    __slots__ = (
+        "name",
+        "path",
+        "description",
+        "description_rich",
+        "required",
+        "read_only",
+        "format",
+        "datatype",
+        "item_type",
+        "is_parent",
+        "is_child",
+        "parent",
+        "depth",
+        "prefix",
+        "nullable",
+    )
+
+    __setstate__ = set_slots_state
+
     def __init__(  # pylint: disable=too-many-arguments
         self,
         name: str,
-        schema: Schema,
+        schema: "Schema",
         required: bool,
         prefix: Optional[str] = None,
         is_parent: bool = False,
@@ -52,21 +77,21 @@ class OpenAPIRequestArg:
                                 to a variant of this argument.
         """
         #: The name of this argument, mostly used for display and docs
-        self.name = name
+        self.name = intern_str(name)
 
         #: The path for this argument, which is full json path for its place in
         #: the larger response model
-        self.path = prefix + "." + name if prefix else name
+        self.path = intern_str(prefix + "." + name if prefix else name)
 
         description_rich, description = simplify_description(
             schema.description or ""
         )
 
         #: The description of this argument for Markdown/plaintext display
-        self.description = description
+        self.description = intern_str(description)
 
         #: The description of this argument for display on the help page
-        self.description_rich = description_rich
+        self.description_rich = intern_str(description_rich)
 
         #: If this argument is required for requests
         self.required = required
@@ -78,7 +103,7 @@ class OpenAPIRequestArg:
         #: either "json" to signal that we should not parse further spec here and just
         #: accept arbitrary json, or "file" to signal to the CLI to attempt to resolve
         #: the string passed in by the end user as a file path and send the entire file
-        self.format = (
+        self.format = intern_str(
             schema.extensions.get("linode-cli-format") or schema.format or None
         )
 
@@ -89,7 +114,7 @@ class OpenAPIRequestArg:
 
         #: The type accepted for this argument. This will ultimately determine what
         #: we accept in the ArgumentParser
-        self.datatype = (
+        self.datatype = intern_str(
             "object" if self.format == "json" else schema.type or "string"
         )
 
@@ -105,21 +130,21 @@ class OpenAPIRequestArg:
         #: The name of the list this argument falls under.
         #: This allows nested dictionaries to be specified in lists of objects.
         #: e.g. --interfaces.ipv4.nat_1_1
-        self.parent = parent
+        self.parent = intern_str(parent)
 
         #: The depth of this argument, or how many parent arguments this argument has.
         #: This is useful when formatting help pages.
         self.depth = depth
 
         #: The path of the path element in the schema.
-        self.prefix = prefix
+        self.prefix = intern_str(prefix)
 
         #: Whether null is an acceptable value for this attribute
         self.nullable = schema.nullable
 
         # handle the type for list values if this is an array
         if self.datatype == "array" and schema.items:
-            self.item_type = schema.items.type
+            self.item_type = intern_str(schema.items.type)
 
         # make sure we're not doing something wrong
         if self.item_type == "object":
@@ -129,8 +154,9 @@ class OpenAPIRequestArg:
             )
 
 
+@memoize_schema(list)
 def _parse_request_model(
-    schema: Schema,
+    schema: "Schema",
     prefix: Optional[str] = None,
     parent: Optional[str] = None,
     depth: int = 0,
@@ -233,7 +259,11 @@ class OpenAPIRequest:
     on the MediaType object of a requestBody portion of an OpenAPI Operation
     """
 
-    def __init__(self, request: MediaType) -> None:
+    __slots__ = ("required", "attrs", "attr_routes")
+
+    __setstate__ = set_slots_state
+
+    def __init__(self, request: "MediaType") -> None:
         """
         :param request: The request's MediaType object in the OpenAPI spec,
                         corresponding to the application/json data the endpoint
@@ -260,6 +290,9 @@ class OpenAPIRequest:
         self.attr_routes = {}
 
         if schema.oneOf is not None:
+            # pylint: disable-next=import-outside-toplevel
+            from openapi3.schemas import Schema
+
             for entry in schema.oneOf:
                 entry_schema = Schema(schema.path, entry, request._root)
                 if entry_schema.title is None:
@@ -280,6 +313,10 @@ class OpenAPIFilteringRequest:
     endpoints where filters are accepted.
     """
 
+    __slots__ = ("attrs", "attr_routes")
+
+    __setstate__ = set_slots_state
+
     def __init__(self, response_model: OpenAPIResponse) -> None:
         """
         :param response_model: The parsed response model whose properties may be
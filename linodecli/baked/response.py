@@ -2,12 +2,18 @@
 Converting the processed OpenAPI Responses into something the CLI can work with
 """
 
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from openapi3.paths import MediaType
-from openapi3.schemas import Schema
+from linodecli.baked.util import (
+    _aggregate_schema_properties,
+    intern_str,
+    memoize_schema,
+    set_slots_state,
+)
 
-from linodecli.baked.util import _aggregate_schema_properties
+if TYPE_CHECKING:
+    from openapi3.paths import MediaType
+    from openapi3.schemas import Schema
 
 
 def _is_paginated(response):
@@ -33,10 +39,27 @@ class OpenAPIResponseAttr:
     from it.
     """
 
+    # Thousands of these are baked, so we avoid a per-instance __dict__
+    __slots__ = (
+        "name",
+        "filterable",
+        "nested_list_depth",
+        "description",
+        "required",
+        "read_only",
+        "display",
+        "column_name",
+        "datatype",
+        "color_map",
+        "item_type",
+    )
+
+    __setstate__ = set_slots_state
+
     def __init__(
         self,
         name: str,
-        schema: Schema,
+        schema: "Schema",
         prefix: Optional[str] = None,
         nested_list_depth: int = 0,
     ) -> None:
@@ -53,7 +76,7 @@ class OpenAPIResponseAttr:
         :type: nested_list_depth: int
         """
         #: The name of this attribute, which is the full json path to it within the schema
-        self.name = name if prefix is None else prefix + "." + name
+        self.name = intern_str(name if prefix is None else prefix + "." + name)
 
         #: If this attribute is filterable in GET requests
         self.filterable = schema.extensions.get("linode-filterable")
@@ -63,7 +86,7 @@ class OpenAPIResponseAttr:
         self.nested_list_depth = nested_list_depth
 
         #: The description of this argument, for help display.  Only used for filterable attributes.
-        self.description = (
+        self.description = intern_str(
             schema.description.split(".")[0] if schema.description else ""
         )
 
@@ -79,10 +102,10 @@ class OpenAPIResponseAttr:
 
         #: The name of the column header for this attribute.  This is the schema's name
         #: without the full path to it
-        self.column_name = name
+        self.column_name = intern_str(name)
 
         #: The type of data this attribute contains
-        self.datatype = schema.type or "string"
+        self.datatype = intern_str(schema.type or "string")
 
         #: How we should associate values of this attribute to output colors
         self.color_map = schema.extensions.get("linode-cli-color")
@@ -90,7 +113,7 @@ class OpenAPIResponseAttr:
         #: The type for items in this attribute, if this attribute is a list
         self.item_type = None
         if schema.type == "array":
-            self.item_type = schema.items.type
+            self.item_type = intern_str(schema.items.type)
 
     @property
     def path(self) -> str:
@@ -161,6 +184,7 @@ class OpenAPIResponseAttr:
         return value
 
 
+@memoize_schema(list)
 def _parse_response_model(schema, prefix=None, nested_list_depth=0):
     """
     Recursively parses all properties of this schema to create a flattened set of
@@ -234,7 +258,11 @@ class OpenAPIResponse:
     responses section of an OpenAPI Operation
     """
 
-    def __init__(self, response: MediaType) -> None:
+    __slots__ = ("is_paginated", "attrs", "rows", "nested_list", "subtables")
+
+    __setstate__ = set_slots_state
+
+    def __init__(self, response: "MediaType") -> None:
         """
         :param response: The response's MediaType object in the OpenAPI spec,
                           corresponding to the application/json response type
@@ -0,0 +1,314 @@
+"""
+Logic for persisting baked operations to disk and lazily loading them back.
+
+Baked operations are stored in a versioned binary file with the following
+layout::
+
+    +--------+----------------+---------+---------+-----+
+    | header | index (pickle) | record  | record  | ... |
+    +--------+----------------+---------+---------+-----+
+
+The header contains a magic string, the format version and the length of the
+index.  The index contains the baked metadata (base URL, spec version, etc.)
+and the location of each command's record.  A command record contains the
+location of each of the command's operation records and a precomputed mapping
+of action aliases.  Each operation record is a single pickled OpenAPIOperation.
+
+The index may also contain the location of a bake manifest record, which maps
+each path in the spec to its content hash and the operations it produced.  This
+is only used to reuse unchanged operations when re-baking.
+
+At runtime the file is memory-mapped and only the index is decoded up front;
+command and operation records are only unpickled once they are accessed.
+"""
+
+import mmap
+import pickle
+import struct
+from collections.abc import Mapping
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple
+
+MAGIC = b"LCLIOPS\x00"
+
+#: The version of the baked store format.  This should be incremented
+#: whenever the layout of the header, index or records changes.
+FORMAT_VERSION = 1
+
+# magic, format version, index length
+HEADER = struct.Struct("<8sHQ")
+
+
+def dump_baked_ops(
+    ops: Dict[str, Dict[str, Any]],
+    metadata: Dict[str, Any],
+    f: IO[bytes],
+    manifest: Optional[Dict[str, Any]] = None,
+):  # pylint: disable=too-many-locals
+    """
+    Writes the given operations to the given file as a baked store.
+
+    :param ops: A mapping of commands -> actions -> operations.
+    :param metadata: Additional values to store in the index (e.g. _base_url).
+    :param f: The binary file to write the baked data to.
+    :param manifest: The bake manifest to store alongside the operations, if any.
+    """
+    records = []
+    commands = {}
+    offset = 0
+
+    def __add_record(record: bytes) -> Tuple[int, int]:
+        nonlocal offset
+
+        records.append(record)
+        location = (offset, len(record))
+        offset += len(record)
+
+        return location
+
+    for command, actions in ops.items():
+        operations = {}
+        aliases = {}
+
+        for action, operation in actions.items():
+            operations[action] = __add_record(pickle.dumps(operation))
+
+            for alias in operation.action_aliases:
+                aliases.setdefault(alias, action)
+
+        commands[command] = __add_record(
+            pickle.dumps({"operations": operations, "aliases": aliases})
+        )
+
+    index = {"metadata": metadata, "commands": commands}
+
+    if manifest is not None:
+        index["manifest"] = __add_record(pickle.dumps(manifest))
+
+    index = pickle.dumps(index)
+
+    f.write(HEADER.pack(MAGIC, FORMAT_VERSION, len(index)))
+    f.write(index)
+
+    for record in records:
+        f.write(record)
+
+
+def load_baked_ops(path: str) -> Tuple[Dict[str, Any], Mapping]:
+    """
+    Loads the index of the baked data file at the given path.
+
+    :param path: The path of the baked data file.
+
+    :returns: The baked metadata and a mapping of commands -> actions -> operations.
+              Operations are only unpickled once they are accessed.
+    """
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            # This is a legacy bake; everything was pickled into one dict
+            f.seek(0)
+            return _split_legacy_ops(pickle.load(f))
+
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    _, version, index_length = HEADER.unpack_from(buffer)
+    if version != FORMAT_VERSION:
+        buffer.close()
+        raise ValueError(
+            f"Unsupported baked data format version {version}; "
+            "please re-bake the CLI"
+        )
+
+    view = memoryview(buffer)
+    records_offset = HEADER.size + index_length
+
+    index = pickle.loads(view[HEADER.size : records_offset])
+
+    return index["metadata"], BakedOperations(
+        view[records_offset:],
+        index["commands"],
+        index.get("manifest"),
+        buffer=buffer,
+    )
+
+
+def _split_legacy_ops(
+    legacy: Dict[str, Any],
+) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+    """
+    Splits a legacy baked ops dict into its metadata and operations.
+    """
+    metadata = {k: v for k, v in legacy.items() if k.startswith("_")}
+    ops = {k: v for k, v in legacy.items() if not k.startswith("_")}
+    return metadata, ops
+
+
+class BakedCommand(Mapping):
+    """
+    A read-only mapping of actions -> operations for a single command that
+    lazily unpickles each operation's record on first access.
+    """
+
+    def __init__(
+        self,
+        records: memoryview,
+        operations: Dict[str, Tuple[int, int]],
+        aliases: Dict[str, str],
+    ):
+        """
+        :param records: A view of the records section of the baked data.
+        :type records: memoryview
+        :param operations: A mapping of actions to the (offset, length) of their record.
+        :type operations: Dict[str, Tuple[int, int]]
+        :param aliases: A mapping of action aliases to their action.
+        :type aliases: Dict[str, str]
+        """
+        self._records = records
+        self._operations = operations
+        self._loaded = {}
+
+        #: A mapping of action aliases to the action they refer to
+        self.aliases = aliases
+
+    def __getitem__(self, action: str) -> Any:
+        operation = self._loaded.get(action)
+        if operation is not None:
+            return operation
+
+        offset, length = self._operations[action]
+        operation = pickle.loads(self._records[offset : offset + length])
+
+        self._loaded[action] = operation
+        return operation
+
+    def __contains__(self, action: object) -> bool:
+        return action in self._operations
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._operations)
+
+    def __len__(self) -> int:
+        return len(self._operations)
+
+    def resolve(self, action: str) -> Optional[Any]:
+        """
+        Returns the operation for the given action or action alias.
+
+        :param action: The action or action alias to resolve.
+        :type action: str
+
+        :returns: The resolved operation, or None if no operation matches.
+        :rtype: Optional[OpenAPIOperation]
+        """
+        if action in self._operations:
+            return self[action]
+
+        if action in self.aliases:
+            return self[self.aliases[action]]
+
+        return None
+
+    def loaded_actions(self) -> List[str]:
+        """
+        Returns the actions whose records have been unpickled so far.
+        """
+        return list(self._loaded)
+
+
+class BakedOperations(Mapping):
+    """
+    A read-only mapping of commands -> actions -> operations backed by a
+    memory-mapped baked store.
+    """
+
+    def __init__(
+        self,
+        records: memoryview,
+        commands: Dict[str, Tuple[int, int]],
+        manifest: Optional[Tuple[int, int]] = None,
+        buffer: Optional[mmap.mmap] = None,
+    ):
+        """
+        :param records: A view of the records section of the baked data.
+        :type records: memoryview
+        :param commands: A mapping of commands to the (offset, length) of their record.
+        :type commands: Dict[str, Tuple[int, int]]
+        :param manifest: The (offset, length) of the bake manifest record, if any.
+        :type manifest: Optional[Tuple[int, int]]
+        :param buffer: The memory map the records are read from, if any.
+        :type buffer: Optional[mmap.mmap]
+        """
+        self._records = records
+        self._commands = commands
+        self._manifest = manifest
+        self._buffer = buffer
+        self._loaded = {}
+
+    def __enter__(self) -> "BakedOperations":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """
+        Closes the memory map backing this store, so the baked data file can
+        be replaced or removed (which Windows doesn't allow while it is
+        mapped).  Operations that have already been loaded remain usable,
+        but no further records can be loaded.
+        """
+        # Every view of the map must be released before it can be closed;
+        # loaded commands share this store's view of the records
+        self._records.release()
+
+        if self._buffer is not None:
+            self._buffer.close()
+
+    def __getitem__(self, command: str) -> BakedCommand:
+        result = self._loaded.get(command)
+        if result is not None:
+            return result
+
+        offset, length = self._commands[command]
+        record = pickle.loads(self._records[offset : offset + length])
+
+        result = BakedCommand(
+            self._records, record["operations"], record["aliases"]
+        )
+
+        self._loaded[command] = result
+        return result
+
+    def __contains__(self, command: object) -> bool:
+        return command in self._commands
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._commands)
+
+    def __len__(self) -> int:
+        return len(self._commands)
+
+    def loaded_operations(self) -> List[Tuple[str, str]]:
+        """
+        Returns the (command, action) pairs whose records have been
+        unpickled so far.
+        """
+        return [
+            (command, action)
+            for command, actions in self._loaded.items()
+            for action in actions.loaded_actions()
+        ]
+
+    def load_manifest(self) -> Optional[Dict[str, Any]]:
+        """
+        Returns the bake manifest stored alongside the operations.
+
+        :returns: A mapping of spec paths to their content hash and the
+                  (command, action) pairs they produced, or None if the
+                  baked data has no manifest.
+        :rtype: Optional[Dict[str, Tuple[str, List[Tuple[str, str]]]]]
+        """
+        if self._manifest is None:
+            return None
+
+        offset, length = self._manifest
+        return pickle.loads(self._records[offset : offset + length])
@@ -2,15 +2,143 @@
 Provides various utility functions for use in baking logic.
 """
 
+import contextlib
+import functools
 import re
+import sys
 from collections import defaultdict
-from typing import Any, Dict, List, Set, Tuple
+from logging import getLogger
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
-from openapi3.schemas import Schema
+if TYPE_CHECKING:
+    from openapi3.schemas import Schema
 
+logger = getLogger(__name__)
 
+
+class SchemaMemo:
+    """
+    Stores the results of flattening schemas for the duration of a bake, so
+    component schemas shared by many operations are only flattened once.
+    """
+
+    __slots__ = ("results", "hits", "misses")
+
+    def __init__(self):
+        #: The cached results, keyed by function, schema and arguments.
+        #: Each entry holds a reference to its schema so the id of the schema's
+        #: raw element is never reused.
+        self.results = {}
+
+        #: The number of cache hits and misses for each memoized function
+        self.hits = defaultdict(lambda: 0)
+        self.misses = defaultdict(lambda: 0)
+
+
+_schema_memo: Optional[SchemaMemo] = None
+
+
+def set_schema_memo(memo: Optional[SchemaMemo]) -> Optional[SchemaMemo]:
+    """
+    Sets the memo used by schema flattening functions.  If None, results
+    are not memoized.
+
+    :param memo: The memo to use.
+    :return: The previously active memo.
+    """
+    global _schema_memo  # pylint: disable=global-statement
+
+    previous = _schema_memo
+    _schema_memo = memo
+
+    return previous
+
+
+@contextlib.contextmanager
+def schema_memo() -> Iterator[SchemaMemo]:
+    """
+    Memoizes schema flattening within the context, logging the number of
+    cache hits for each memoized function on exit.
+
+    Schemas are memoized by the identity of their raw elements, so the spec
+    must not be modified while the context is active.
+    """
+    memo = SchemaMemo()
+    previous = set_schema_memo(memo)
+
+    try:
+        yield memo
+    finally:
+        set_schema_memo(previous)
+
+        for name in sorted(memo.misses):
+            logger.debug(
+                "Schema memo for %s: %s hits, %s misses",
+                name,
+                memo.hits[name],
+                memo.misses[name],
+            )
+
+
+def memoize_schema(copy_result: Callable[[Any], Any]):
+    """
+    Memoizes the decorated function within a schema_memo() context, keyed by
+    the schema it is given and its remaining arguments.
+
+    Every $ref to a schema resolves to a separate proxy object, so schemas are
+    keyed by their path and the identity of their raw element in the spec.
+
+    Baked objects are never modified once built, so results may share them;
+    only the containers holding them need to be copied.
+
+    :param copy_result: Returns a copy of a result that is safe to modify.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(schema, *args, **kwargs):
+            memo = _schema_memo
+            if memo is None:
+                return func(schema, *args, **kwargs)
+
+            key = (
+                func.__name__,
+                tuple(schema.path),
+                id(schema.raw_element),
+                args,
+                tuple(kwargs.items()),
+            )
+            entry = memo.results.get(key)
+
+            if entry is None:
+                memo.misses[func.__name__] += 1
+                entry = memo.results[key] = (
+                    schema,
+                    func(schema, *args, **kwargs),
+                )
+            else:
+                memo.hits[func.__name__] += 1
+
+            return copy_result(entry[1])
+
+        return wrapper
+
+    return decorator
+
+
+@memoize_schema(lambda result: (dict(result[0]), set(result[1])))
 def _aggregate_schema_properties(
-    schema: Schema,
+    schema: "Schema",
 ) -> Tuple[Dict[str, Any], Set[str]]:
     """
     Aggregates all properties in the given schema, accounting properties
@@ -26,9 +154,12 @@ def _aggregate_schema_properties(
 
     def __inner(
         path: List[str],
-        entry: Schema,
+        entry: "Schema",
     ):
         if isinstance(entry, dict):
+            # pylint: disable-next=import-outside-toplevel
+            from openapi3.schemas import Schema
+
             # TODO: Figure out why this happens (openapi3 package bug?)
             # pylint: disable=protected-access
             entry = Schema(path, entry, schema._root)
@@ -65,6 +196,37 @@ def _aggregate_schema_properties(
     )
 
 
+def intern_str(value: Optional[str]) -> Optional[str]:
+    """
+    Interns the given string so identical names, paths and descriptions
+    across baked objects share a single instance.  Because pickle memoizes
+    objects by identity, each shared string is only stored (and unpickled)
+    once per baked shard.
+
+    :param value: The string to intern.  Non-string values are returned as-is.
+    :return: The interned string.
+    """
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def set_slots_state(obj: Any, state: Any):
+    """
+    Restores the pickled state of an object that uses __slots__.  This is
+    used as the __setstate__ of baked classes so objects baked before they
+    used __slots__, whose state is a plain dict, can still be unpickled.
+
+    :param obj: The object being unpickled.
+    :param state: The pickled state; either a dict of attributes, or a
+                  (dict, slots) tuple as pickled for objects with __slots__.
+    """
+    if isinstance(state, tuple):
+        attrs, slots = state
+        state = {**(attrs or {}), **(slots or {})}
+
+    for key, value in state.items():
+        setattr(obj, key, value)
+
+
 ESCAPED_PATH_DELIMITER_PATTERN = re.compile(r"(?<!\\)\.")
 
 
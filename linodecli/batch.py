@@ -0,0 +1,283 @@
+"""
+Runs many commands in a single CLI process, for `linode-cli batch`.
+
+Each line of the input is a command, given either as it would be on the
+command line (e.g. `linodes view 123`) or as a JSON object with command,
+action and args keys.  The result of each command is written as a line of
+JSON tagged with the number of the line it was read from and the status the
+CLI would have exited with, so the results can be matched to the input and
+processed by other tools.
+
+Since every command is run by the same process, the spec, config and
+connections to the API are only loaded or established once.
+"""
+
+import argparse
+import contextlib
+import json
+import shlex
+import sys
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+)
+
+from linodecli.exit_codes import ExitCodes
+from linodecli.helpers import map_ordered
+
+if TYPE_CHECKING:
+    from linodecli.cli import CLI
+
+# The names the CLI may be invoked with, which are ignored at the start of
+# a command so lines can be copied from a shell script
+CLI_NAMES = ("linode-cli", "linode", "lin")
+
+
+def get_help() -> str:
+    """
+    Returns the help text of the batch command.
+
+    :returns: The help text.
+    :rtype: str
+    """
+    return (
+        "linode-cli batch [FILE] [--parallel COUNT]\n\n"
+        "Runs the commands in FILE (or stdin, if FILE is - or not given), one\n"
+        "per line, and prints the result of each as a line of JSON.  Commands\n"
+        "are given as they would be on the command line (e.g. `linodes view 123`),\n"
+        'or as JSON objects (e.g. {"command": "linodes", "action": "view",\n'
+        '"args": ["123"]}).  Use --parallel to run up to COUNT commands at once.'
+    )
+
+
+def parse_args(args: List[str]) -> argparse.Namespace:
+    """
+    Parses the options of the batch command, exiting if any other
+    arguments are given.
+
+    :param args: The arguments given after the batch command and its file.
+    :type args: List[str]
+
+    :returns: The parsed options.
+    :rtype: Namespace
+    """
+    parser = argparse.ArgumentParser(add_help=False, allow_abbrev=False)
+    parser.add_argument("--parallel", metavar="COUNT", type=int, default=1)
+
+    parsed, unknown = parser.parse_known_args(args)
+
+    if unknown:
+        print(
+            f"Unrecognized arguments for batch: {' '.join(unknown)}",
+            file=sys.stderr,
+        )
+        sys.exit(ExitCodes.ARGUMENT_ERROR)
+
+    if parsed.parallel < 1:
+        print("--parallel must be at least 1", file=sys.stderr)
+        sys.exit(ExitCodes.ARGUMENT_ERROR)
+
+    return parsed
+
+
+def parse_line(line: str) -> List[str]:
+    """
+    Parses a line of batch input into the command, action and arguments it
+    runs.
+
+    :param line: The line to parse.
+    :type line: str
+
+    :returns: The command, action and arguments.
+    :rtype: List[str]
+
+    :raises ValueError: If the line is not a valid command.
+    """
+    if line.startswith("{"):
+        entry = json.loads(line)
+
+        if not isinstance(entry, dict):
+            raise ValueError("Expected a JSON object")
+
+        args = entry.get("args", [])
+
+        if not isinstance(args, list):
+            raise ValueError("Expected args to be a list")
+
+        result = [entry.get("command"), entry.get("action"), *args]
+    else:
+        result = shlex.split(line)
+
+        if result and result[0] in CLI_NAMES:
+            result = result[1:]
+
+    if len(result) < 2 or not all(isinstance(v, str) for v in result[:2]):
+        raise ValueError("Expected a command and an action")
+
+    result = [str(v) for v in result]
+
+    # Help is printed to stdout, where it would be mixed in with the results
+    if any(v in ("-h", "--help") for v in result[2:]):
+        raise ValueError("Help can't be shown for a batch command")
+
+    return result
+
+
+def run_line(ctx: "CLI", number: int, line: str) -> Dict[str, Any]:
+    """
+    Runs the command on a line of batch input.
+
+    :param ctx: The main CLI object.
+    :type ctx: CLI
+    :param number: The number of the line in the input.
+    :type number: int
+    :param line: The line to run.
+    :type line: str
+
+    :returns: The result to print for this line.
+    :rtype: Dict[str, Any]
+    """
+    # pylint: disable-next=import-outside-toplevel
+    import requests
+
+    # pylint: disable-next=import-outside-toplevel
+    from linodecli.api_request import do_request
+
+    result: Dict[str, Any] = {"line": number}
+
+    try:
+        command, action, *args = parse_line(line)
+    except ValueError as e:
+        result.update(status=ExitCodes.ARGUMENT_ERROR, error=str(e))
+        return result
+
+    result.update(command=command, action=action)
+
+    try:
+        operation = ctx.find_operation(command, action)
+    except ValueError as e:
+        status = (
+            ExitCodes.UNRECOGNIZED_ACTION
+            if command in ctx.ops
+            else ExitCodes.UNRECOGNIZED_COMMAND
+        )
+        result.update(status=status, error=str(e))
+        return result
+
+    try:
+        response = do_request(ctx, operation, args, skip_error_handling=True)
+    except SystemExit as e:
+        # e.g. the arguments could not be parsed; the reason has already
+        # been printed to stderr.  The command didn't run, so it never
+        # counts as a success.
+        status = e.code
+        if not isinstance(status, int) or status == ExitCodes.SUCCESS:
+            status = ExitCodes.ARGUMENT_ERROR
+
+        result.update(status=status, error="Invalid arguments")
+        return result
+    except requests.RequestException as e:
+        result.update(status=ExitCodes.REQUEST_FAILED, error=str(e))
+        return result
+
+    success = 199 < response.status_code < 399
+
+    result.update(
+        status=ExitCodes.SUCCESS if success else ExitCodes.REQUEST_FAILED,
+        http_status=response.status_code,
+    )
+
+    try:
+        result["response"] = response.json()
+    except ValueError:
+        result["response"] = None
+
+    return result
+
+
+def run_batch(
+    ctx: "CLI",
+    lines: Iterable[str],
+    parallel: int = 1,
+    output: Optional[TextIO] = None,
+) -> int:
+    """
+    Runs the command on each line of batch input, printing the result of each
+    in the order they were given.  Blank lines and lines starting with # are
+    skipped.
+
+    If parallel is greater than 1, up to that many commands are run at once.
+
+    :param ctx: The main CLI object.
+    :type ctx: CLI
+    :param lines: The lines of batch input.
+    :type lines: Iterable[str]
+    :param parallel: The maximum number of commands to run at once.
+    :type parallel: int
+    :param output: The file to print results to.  Defaults to stdout.
+    :type output: Optional[TextIO]
+
+    :returns: The status to exit with; 0 if every command succeeded.
+    :rtype: int
+    """
+    output = output or sys.stdout
+
+    commands = (
+        (number, line.strip())
+        for number, line in enumerate(lines, start=1)
+        if line.strip() and not line.strip().startswith("#")
+    )
+
+    status = ExitCodes.SUCCESS
+
+    for result in _run_lines(ctx, commands, parallel):
+        if result["status"] != ExitCodes.SUCCESS:
+            status = ExitCodes.REQUEST_FAILED
+
+        print(json.dumps(result), file=output, flush=True)
+
+    return status
+
+
+def _run_lines(
+    ctx: "CLI", commands: Iterable[Any], parallel: int
+) -> Iterable[Dict[str, Any]]:
+    """
+    Runs the given (number, line) commands, yielding their results in order.
+    Only a bounded number of commands are read ahead of the results, so
+    input can be streamed.
+    """
+    return map_ordered(lambda c: run_line(ctx, *c), commands, parallel)
+
+
+@contextlib.contextmanager
+def open_input(path: Optional[str]) -> Iterator[TextIO]:
+    """
+    Opens the batch input at the given path, or stdin if the path is - or
+    not given.  The input is closed on exit unless it is stdin.
+
+    :param path: The path of the input.
+    :type path: Optional[str]
+
+    :returns: The opened input.
+    :rtype: Iterator[TextIO]
+    """
+    if path in (None, "-"):
+        yield sys.stdin
+        return
+
+    try:
+        # pylint: disable-next=consider-using-with
+        f = open(path, "r", encoding="utf-8")
+    except OSError as e:
+        print(f"Unable to read batch input {path}: {e}", file=sys.stderr)
+        sys.exit(ExitCodes.FILE_ERROR)
+
+    with f:
+        yield f
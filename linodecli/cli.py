@@ -2,30 +2,71 @@
 Responsible for managing spec and routing commands to operations.
 """
 
-import contextlib
 import json
 import os
 import pickle
 import sys
+import threading
+from collections.abc import Mapping
 from json import JSONDecodeError
 from logging import getLogger
 from sys import version_info
-from typing import IO, Any, Dict
-
-import requests
-import yaml
-from openapi3 import OpenAPI
-
-from linodecli.api_request import do_request, get_all_pages
-from linodecli.baked import OpenAPIOperation
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from linodecli import timings
+from linodecli.baked.paths import bake_path
+from linodecli.baked.store import (
+    BakedCommand,
+    BakedOperations,
+    dump_baked_ops,
+    load_baked_ops,
+)
 from linodecli.configuration import CLIConfig
 from linodecli.exit_codes import ExitCodes
+from linodecli.helpers import DEFAULT_PARALLEL_PAGES
 from linodecli.output.output_handler import OutputHandler, OutputMode
 
-METHODS = ("get", "post", "put", "delete")
+if TYPE_CHECKING:
+    from openapi3 import OpenAPI
+    from openapi3.paths import Path
+    from requests import Session
+
+    from linodecli.baked import OpenAPIOperation
+    from linodecli.retry import RetryPolicy
+
+# The default maximum number of connections kept alive per host
+DEFAULT_POOL_SIZE = 10
 
 logger = getLogger(__name__)
 
+# The spec used by bake worker processes; see CLI._bake_paths(...)
+_bake_worker_spec = None
+
+
+def _init_bake_worker(raw_spec: Dict[str, Any]):
+    """
+    Initializes a bake worker process with the given spec.
+    """
+    global _bake_worker_spec  # pylint: disable=global-statement
+
+    # pylint: disable-next=import-outside-toplevel
+    from openapi3 import OpenAPI
+
+    # pylint: disable-next=import-outside-toplevel
+    from linodecli.baked.util import SchemaMemo, set_schema_memo
+
+    _bake_worker_spec = OpenAPI(raw_spec)
+
+    # Each worker memoizes schemas for every path it bakes
+    set_schema_memo(SchemaMemo())
+
+
+def _bake_path_worker(path_name: str) -> List[Tuple[str, str, Any]]:
+    """
+    Builds the operations for the given path in a bake worker process.
+    """
+    return bake_path(_bake_worker_spec.paths[path_name])
+
 
 class CLI:  # pylint: disable=too-many-instance-attributes
     """
@@ -34,9 +75,10 @@ class CLI:  # pylint: disable=too-many-instance-attributes
 
     def __init__(self, version, base_url, skip_config=False):
         self.ops = {}
-        self.spec = {}
+        self._spec = None
         self.defaults = True  # whether to use default values for arguments
         self.pagination = True
+        self.parallel_pages = DEFAULT_PARALLEL_PAGES
         self.page = 1
         self.page_size = 100
         self.debug_request = False
@@ -46,139 +88,284 @@ class CLI:  # pylint: disable=too-many-instance-attributes
         self.suppress_warnings = False
         self.raw_body = None
 
+        # Whether to skip reading and writing (no_cache) or only reading
+        # (refresh_cache) cached responses
+        self.no_cache = False
+        self.refresh_cache = False
+
+        # Retry options given on the command line, which override the
+        # retry policy in the config
+        self.no_retry = False
+        self.retry_max_attempts = None
+        self._retry_policy = None
+
+        # The maximum number of connections kept alive per host.  If None,
+        # the pool_size config value or DEFAULT_POOL_SIZE is used.
+        self.pool_size = None
+        self._session = None
+
+        # Guards the lazy creation of state shared between threads
+        self._lock = threading.Lock()
+
         self.output_handler = OutputHandler()
-        self.config = CLIConfig(self.base_url, skip_config=skip_config)
+
+        with timings.phase("config load"):
+            self.config = CLIConfig(self.base_url, skip_config=skip_config)
+
         self.load_baked()
 
-    def bake(self, spec_location: str, save: bool = True):
+    def bake(
+        self, spec_location: str, save: bool = True, jobs: int = 1
+    ):  # pylint: disable=too-many-locals
         """
         Generates ops and bakes them to a pickle.
 
+        If a previous bake exists at the data file's location, operations for
+        paths whose content has not changed since that bake are reused rather
+        than rebuilt.
+
         :param spec_location: The URL or file path of the OpenAPI spec to parse.
         :param save: Whether the pickled operations should be saved to a file.
                      This is primarily intended for unit testing.
+        :param jobs: The number of worker processes to build operations with.
+                     If 0, one worker is used per CPU.
         """
+        # pylint: disable-next=import-outside-toplevel
+        from linodecli.baked.hashing import hash_path_items, source_digest
 
         try:
             logger.debug("Loading and parsing OpenAPI spec: %s", spec_location)
-            spec = self._load_openapi_spec(spec_location)
+            raw_spec = self._load_spec_dict(spec_location)
         except Exception as e:
             print(f"Failed to load spec: {e}")
             sys.exit(ExitCodes.REQUEST_FAILED)
 
-        self.spec = spec
-        self.ops = {}
-        ext = {
-            "skip": "linode-cli-skip",
-            "action": "linode-cli-action",
-            "command": "linode-cli-command",
-            "defaults": "linode-cli-allowed-defaults",
-        }
+        data_file = self._get_data_file()
 
-        for path in spec.paths.values():
-            command = path.extensions.get(ext["command"], None)
+        self._spec = None
 
-            for m in METHODS:
-                operation = getattr(path, m)
+        path_hashes = hash_path_items(
+            raw_spec, salt=f"{self.version}:{source_digest()}"
+        )
+        previous_ops, previous_manifest = (
+            self._load_previous_bake(data_file) if save else (None, {})
+        )
 
-                if operation is None:
-                    continue
+        # A mapping of paths to the (command, action, operation)s they produce
+        path_ops = {}
 
-                operation_log_fmt = f"{m.upper()} {path.path[-1]}"
+        for path_name, path_hash in path_hashes.items():
+            previous = previous_manifest.get(path_name)
 
-                logger.debug(
-                    "%s: Attempting to generate command for operation",
-                    operation_log_fmt,
-                )
+            if previous is not None and previous[0] == path_hash:
+                reused = self._reuse_path_ops(previous_ops, previous[1])
+                if reused is not None:
+                    path_ops[path_name] = reused
 
-                if ext["skip"] in operation.extensions:
-                    logger.debug(
-                        "%s: Skipping operation due to x-%s extension",
-                        operation_log_fmt,
-                        ext["skip"],
-                    )
-                    continue
-
-                # We don't do this in the parent loop because certain paths
-                # may only have skipped operations
-                if command is None:
-                    raise KeyError(
-                        f"{operation_log_fmt}: Missing x-{ext['command']} extension"
-                    )
-
-                action = operation.extensions.get(ext["action"], None)
-
-                if action is None:
-                    action = operation.operationId
-                    logger.info(
-                        "%s: Using operationId (%s) as action because "
-                        "%s extension is not specified",
-                        operation_log_fmt,
-                        action,
-                        ext["action"],
-                    )
-
-                if not action:
-                    logger.warning(
-                        "%s: Skipping operation due to unresolvable action",
-                        operation_log_fmt,
-                    )
-                    continue
-
-                if isinstance(action, list):
-                    action = action[0]
-
-                if command not in self.ops:
-                    self.ops[command] = {}
-
-                operation = OpenAPIOperation(
-                    command, operation, m, path.parameters
-                )
+        logger.info(
+            "Reused operations for %s of %s paths from the previous bake",
+            len(path_ops),
+            len(path_hashes),
+        )
 
-                logger.debug(
-                    "%s %s: Successfully built command for operation: "
-                    "command='%s %s'; summary='%s'; paginated=%s; num_args=%s; num_attrs=%s",
-                    operation.method.upper(),
-                    operation.url_path,
-                    operation.command,
-                    operation.action,
-                    operation.summary.rstrip("."),
-                    operation.response_model
-                    and operation.response_model.is_paginated,
-                    len(operation.args),
-                    len(operation.attrs),
-                )
+        path_ops.update(
+            self._bake_paths(
+                raw_spec,
+                [p for p in path_hashes if p not in path_ops],
+                jobs,
+            )
+        )
 
-                self.ops[command][action] = operation
+        # Operations are always merged in spec order so the result does not
+        # depend on which operations were reused or built in parallel
+        self.ops = {}
+        manifest = {}
+
+        for path_name, path_hash in path_hashes.items():
+            for command, action, operation in path_ops[path_name]:
+                self.ops.setdefault(command, {})[action] = operation
+
+            manifest[path_name] = (
+                path_hash,
+                [
+                    (command, action)
+                    for command, action, _ in path_ops[path_name]
+                ],
+            )
 
         # hide the base_url from the spec away
-        self.ops["_base_url"] = self.spec.servers[0].url
-        self.ops["_spec_version"] = self.spec.info.version
-        self.ops["_spec"] = self.spec
+        metadata = {
+            "_base_url": raw_spec["servers"][0]["url"],
+            "_spec_version": raw_spec["info"]["version"],
+        }
+
+        # Close the previous bake's memory map before the data file is
+        # replaced; reused operations have already been loaded from it
+        if previous_ops is not None:
+            previous_ops.close()
 
         # finish the baking
-        data_file = self._get_data_file()
+        if save:
+            # Write to a temporary file first so an interrupted bake never
+            # leaves a partially written data file behind
+            with open(f"{data_file}.tmp", "wb") as f:
+                dump_baked_ops(self.ops, metadata, f, manifest=manifest)
+
+            os.replace(f"{data_file}.tmp", data_file)
+        else:
+            with open(os.devnull, "wb") as f:
+                dump_baked_ops(self.ops, metadata, f, manifest=manifest)
+
+        # The raw spec is stored separately so it is never loaded
+        # when running commands.  We store the parsed spec dict rather
+        # than the OpenAPI object, since openapi3 objects are not usable
+        # once unpickled.
+        if save:
+            with open(self._get_spec_data_file(), "wb") as f:
+                pickle.dump(raw_spec, f)
+
+    def _bake_paths(
+        self, raw_spec: Dict[str, Any], path_names: List[str], jobs: int
+    ) -> Dict[str, List[Tuple[str, str, "OpenAPIOperation"]]]:
+        """
+        Builds the operations for the given paths, optionally across a pool of
+        worker processes.
+
+        :param raw_spec: The parsed OpenAPI spec.
+        :type raw_spec: Dict[str, Any]
+        :param path_names: The paths to build operations for.
+        :type path_names: List[str]
+        :param jobs: The number of worker processes to use.
+                     If 0, one worker is used per CPU.
+        :type jobs: int
+
+        :returns: A mapping of each path to the operations built for it.
+        :rtype: Dict[str, List[Tuple[str, str, OpenAPIOperation]]]
+        """
+        if len(path_names) < 1:
+            return {}
+
+        workers = min(jobs or os.cpu_count() or 1, len(path_names))
+
+        if workers < 2:
+            # pylint: disable-next=import-outside-toplevel
+            from openapi3 import OpenAPI
+
+            # pylint: disable-next=import-outside-toplevel
+            from linodecli.baked.util import schema_memo
+
+            self._spec = OpenAPI(raw_spec)
+
+            with schema_memo():
+                return {
+                    path_name: bake_path(self._spec.paths[path_name])
+                    for path_name in path_names
+                }
+
+        # pylint: disable-next=import-outside-toplevel
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_bake_worker,
+            initargs=(raw_spec,),
+        ) as executor:
+            # Split the paths into a few chunks per worker to limit
+            # the overhead of sending operations between processes
+            chunksize = max(1, len(path_names) // (workers * 4))
+
+            return dict(
+                zip(
+                    path_names,
+                    executor.map(
+                        _bake_path_worker, path_names, chunksize=chunksize
+                    ),
+                )
+            )
 
-        with open(data_file, "wb") if save else os.devnull as f:
-            pickle.dump(self.ops, f)
+    @staticmethod
+    def _reuse_path_ops(
+        previous_ops: Mapping,
+        path_ops: List[Tuple[str, str]],
+    ) -> Optional[List[Tuple[str, str, "OpenAPIOperation"]]]:
+        """
+        Loads the given operations from a previous bake.
+
+        :param previous_ops: The operations of the previous bake.
+        :type previous_ops: Mapping
+        :param path_ops: The (command, action) pairs to reuse.
+        :type path_ops: List[Tuple[str, str]]
+
+        :returns: The command, action and operation for each reused operation,
+                  or None if any of the operations could not be loaded.
+        :rtype: Optional[List[Tuple[str, str, OpenAPIOperation]]]
+        """
+        try:
+            return [
+                (command, action, previous_ops[command][action])
+                for command, action in path_ops
+            ]
+        except Exception as e:
+            logger.debug("Failed to reuse operations from previous bake: %s", e)
+            return None
+
+    @staticmethod
+    def _load_previous_bake(
+        data_file: str,
+    ) -> Tuple[Optional[Mapping], Dict[str, Any]]:
+        """
+        Loads the operations and bake manifest of a previous bake, if one exists
+        at the given location.
+
+        :param data_file: The location of the previous bake.
+        :type data_file: str
 
+        :returns: The operations and manifest of the previous bake, or None and an
+                  empty manifest if there is no usable previous bake.
+        :rtype: Tuple[Optional[Mapping], Dict[str, Any]]
+        """
+        if not os.path.exists(data_file):
+            return None, {}
+
+        try:
+            _, ops = load_baked_ops(data_file)
+
+            # Legacy bakes don't have a manifest
+            if not isinstance(ops, BakedOperations):
+                return None, {}
+
+            manifest = ops.load_manifest()
+        except Exception as e:
+            logger.debug("Failed to load previous bake %s: %s", data_file, e)
+            return None, {}
+
+        if manifest is None:
+            ops.close()
+            return None, {}
+
+        return ops, manifest
+
+    @timings.timed("spec load")
     def load_baked(self):
         """
-        Loads a baked spec representation from a baked pickle
+        Loads a baked spec representation from a baked pickle.
+
+        The baked data is memory-mapped and only its index is read here; each
+        operation is unpickled the first time it is accessed.
         """
         data_file = self._get_data_file()
         data_path = os.path.join(
             os.path.dirname(os.path.realpath(__file__)), data_file
         )
         if os.path.exists(data_path):
-            with open(data_path, "rb") as f:
-                self.ops = pickle.load(f)
-                if "_base_url" in self.ops:
-                    self.base_url = self.ops.pop("_base_url")
-                if "_spec_version" in self.ops:
-                    self.spec_version = self.ops.pop("_spec_version")
-                if "_spec" in self.ops:
-                    self.spec = self.ops.pop("_spec")
+            metadata, self.ops = load_baked_ops(data_path)
+            if "_base_url" in metadata:
+                self.base_url = metadata["_base_url"]
+            if "_spec_version" in metadata:
+                self.spec_version = metadata["_spec_version"]
+
+            # Legacy bakes include the raw spec in the data file
+            self._spec = metadata.get("_spec")
         else:
             print(
                 "No spec baked.  Please bake by calling this script as follows:",
@@ -194,6 +381,45 @@ class CLI:  # pylint: disable=too-many-instance-attributes
         """
         return f"data-{version_info[0]}"
 
+    def _get_spec_data_file(self):
+        """
+        Returns the name of the baked file containing the raw OpenAPI spec.
+        """
+        return f"{self._get_data_file()}-spec"
+
+    def _load_baked_spec(self) -> Optional["OpenAPI"]:
+        """
+        Loads the raw OpenAPI spec from the baked spec file, if it exists.
+
+        :returns: The OpenAPI object built from the baked spec, or None if the
+                  spec file does not exist.
+        """
+        spec_path = os.path.join(
+            os.path.dirname(os.path.realpath(__file__)),
+            self._get_spec_data_file(),
+        )
+        if not os.path.exists(spec_path):
+            return None
+
+        # pylint: disable-next=import-outside-toplevel
+        from openapi3 import OpenAPI
+
+        with open(spec_path, "rb") as f:
+            return OpenAPI(pickle.load(f))
+
+    @property
+    def spec(self) -> Optional["OpenAPI"]:
+        """
+        Returns the raw OpenAPI spec this CLI was baked from.
+
+        The spec is not needed to run commands, so it is only loaded from disk
+        the first time it is accessed.
+        """
+        if self._spec is None:
+            self._spec = self._load_baked_spec()
+
+        return self._spec
+
     def handle_command(self, command, action, args):
         """
         Given a command, action, and remaining kwargs, finds and executes the
@@ -201,15 +427,33 @@ class CLI:  # pylint: disable=too-many-instance-attributes
         """
 
         try:
-            operation = self.find_operation(command, action)
+            # Operations are loaded from the baked spec when first accessed
+            with timings.phase("spec load"):
+                operation = self.find_operation(command, action)
         except ValueError as e:
             print(e, file=sys.stderr)
             sys.exit(ExitCodes.REQUEST_FAILED)
 
-        if not self.pagination:
-            result = get_all_pages(self, operation, args)
+        # pylint: disable-next=import-outside-toplevel
+        from linodecli.api_request import (
+            do_request,
+            get_all_pages,
+            iter_all_pages,
+        )
+
+        if self.pagination:
+            response = do_request(self, operation, args)
+
+            with timings.phase("JSON decode"):
+                result = response.json()
+        elif operation.can_stream_response(self.output_handler):
+            # Print each page as it is received rather than merging them
+            operation.process_response_pages(
+                iter_all_pages(self, operation, args), self.output_handler
+            )
+            return
         else:
-            result = do_request(self, operation, args).json()
+            result = get_all_pages(self, operation, args)
 
         operation.process_response_json(result, self.output_handler)
 
@@ -245,6 +489,9 @@ class CLI:  # pylint: disable=too-many-instance-attributes
 
         operation = self.ops[command][action]
 
+        # pylint: disable-next=import-outside-toplevel
+        from linodecli.api_request import do_request
+
         result = do_request(
             self,
             operation,
@@ -255,6 +502,38 @@ class CLI:  # pylint: disable=too-many-instance-attributes
 
         return result.status_code, result.json()
 
+    async def call_operation_async(
+        self, command, action, args=None, filters=None
+    ):
+        """
+        An asyncio counterpart of call_operation(...), so plugins can make
+        many requests concurrently from a single thread.  The request is built,
+        retried and rate limited as it would be by call_operation(...).
+
+        :param filters: The X-Filter header to include in the request.  This overrides
+                        whatever is passed into to command as filters.
+        :type filters: dict
+        """
+        if args is None:
+            args = []
+        if command not in self.ops or action not in self.ops[command]:
+            raise ValueError(f"Unknown command/action {command}/{action}")
+
+        operation = self.ops[command][action]
+
+        # pylint: disable-next=import-outside-toplevel
+        from linodecli.api_request_async import do_request
+
+        result = await do_request(
+            self,
+            operation,
+            args,
+            filter_header=filters,
+            skip_error_handling=True,
+        )
+
+        return result.status_code, result.json()
+
     def find_operation(self, command, action):
         """
         Finds the corresponding operation for the given command and action.
@@ -268,6 +547,17 @@ class CLI:  # pylint: disable=too-many-instance-attributes
 
         command_dict = self.ops[command]
 
+        if isinstance(command_dict, BakedCommand):
+            # Baked commands include a precomputed alias index,
+            # so we don't need to load every operation to find a match
+            op = command_dict.resolve(action)
+            if op is not None:
+                return op
+
+            raise ValueError(
+                f"Action not found for command {command}: {action}"
+            )
+
         if action in command_dict:
             return command_dict[action]
 
@@ -279,6 +569,105 @@ class CLI:  # pylint: disable=too-many-instance-attributes
         # Fail if no matching alias was found
         raise ValueError(f"Action not found for command {command}: {action}")
 
+    @property
+    def session(self) -> "Session":
+        """
+        Returns the HTTP session used for all API requests made by this CLI,
+        creating it the first time it is requested.  Sharing a session lets
+        connections be kept alive and reused between requests, e.g. when
+        fetching every page of a list or when plugins call operations.
+
+        :returns: The shared HTTP session.
+        :rtype: requests.Session
+        """
+        if self._session is not None:
+            return self._session
+
+        with self._lock:
+            if self._session is None:
+                self._session = self._create_session()
+
+        return self._session
+
+    def _create_session(self) -> "Session":
+        """
+        Creates the HTTP session used for all API requests.
+        """
+        # pylint: disable-next=import-outside-toplevel
+        import requests
+
+        # pylint: disable-next=import-outside-toplevel
+        from requests.adapters import HTTPAdapter
+
+        pool_size = self.get_pool_size()
+
+        adapter = HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size
+        )
+
+        if timings.enabled():
+            timings.instrument_adapter(adapter)
+
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        return session
+
+    def get_pool_size(self) -> int:
+        """
+        Returns the maximum number of connections kept alive per host, from
+        the pool_size option or config value.
+
+        :returns: The connection pool size.
+        :rtype: int
+        """
+        pool_size = self.pool_size or self.config.get_value("pool_size")
+
+        try:
+            pool_size = int(pool_size or DEFAULT_POOL_SIZE)
+            if pool_size < 1:
+                raise ValueError
+        except ValueError:
+            print(
+                f"Invalid pool size {pool_size}; must be a positive integer",
+                file=sys.stderr,
+            )
+            sys.exit(ExitCodes.ARGUMENT_ERROR)
+
+        return pool_size
+
+    @property
+    def retry_policy(self) -> "RetryPolicy":
+        """
+        Returns the policy used to retry API requests that fail with
+        transient errors, loading it from the config the first time it
+        is requested.
+
+        :returns: The retry policy.
+        :rtype: RetryPolicy
+        """
+        if self._retry_policy is not None:
+            return self._retry_policy
+
+        # pylint: disable-next=import-outside-toplevel
+        from linodecli.retry import RetryPolicy
+
+        try:
+            self._retry_policy = RetryPolicy.from_config(
+                self.config,
+                max_attempts=1 if self.no_retry else self.retry_max_attempts,
+            )
+        except ValueError as e:
+            print(f"Invalid retry policy: {e}", file=sys.stderr)
+            sys.exit(ExitCodes.ARGUMENT_ERROR)
+
+        return self._retry_policy
+
+    @retry_policy.setter
+    def retry_policy(self, policy: "RetryPolicy"):
+        self._retry_policy = policy
+
     @property
     def user_agent(self) -> str:
         """
@@ -291,23 +680,40 @@ class CLI:  # pylint: disable=too-many-instance-attributes
         )
 
     @staticmethod
-    def _load_openapi_spec(spec_location: str) -> OpenAPI:
+    def _load_openapi_spec(spec_location: str) -> "OpenAPI":
         """
         Attempts to load the raw OpenAPI spec (YAML or JSON) at the given location.
 
         :param spec_location: The location of the OpenAPI spec.
                               This can be a local path or a URL.
 
-        :returns: A tuple containing the loaded OpenAPI object and the parsed spec in
-                  dict format.
+        :returns: The loaded OpenAPI object.
         """
+        # pylint: disable-next=import-outside-toplevel
+        from openapi3 import OpenAPI
 
-        with CLI._get_spec_file_reader(spec_location) as f:
-            parsed = CLI._parse_spec_file(f)
+        return OpenAPI(CLI._load_spec_dict(spec_location))
 
-        CLI._normalize_content_parameters(parsed)
+    @staticmethod
+    def _load_spec_dict(spec_location: str) -> Dict[str, Any]:
+        """
+        Loads and normalizes the raw OpenAPI spec (YAML or JSON) at the given
+        location without building an OpenAPI object from it.
 
-        return OpenAPI(parsed)
+        :param spec_location: The location of the OpenAPI spec.
+                              This can be a local path or a URL.
+
+        :returns: The parsed spec in dict format.
+        """
+        # pylint: disable-next=import-outside-toplevel
+        from linodecli.spec_cache import load_parsed_spec
+
+        def __parse(content: bytes) -> Dict[str, Any]:
+            parsed = CLI._parse_spec_file(content)
+            CLI._normalize_content_parameters(parsed)
+            return parsed
+
+        return load_parsed_spec(CLI._read_spec_file(spec_location), __parse)
 
     @staticmethod
     def _normalize_content_parameters(parsed: Dict[str, Any]):
@@ -356,66 +762,62 @@ class CLI:  # pylint: disable=too-many-instance-attributes
                         _fix_param(p)
 
     @staticmethod
-    @contextlib.contextmanager
-    def _get_spec_file_reader(
-        spec_location: str,
-    ):
+    def _read_spec_file(spec_location: str) -> bytes:
         """
-        Returns a reader for an OpenAPI spec file from the given location.
+        Reads the content of an OpenAPI spec file from the given location.
+
+        Remote spec files are cached locally and revalidated on each read.
 
         :param spec_location: The location of the OpenAPI spec.
                       This can be a local path or a URL.
 
-        :returns: A context manager yielding the spec file's reader.
+        :returns: The content of the spec file.
         """
 
         # Case for local file
         local_path = os.path.expanduser(spec_location)
         if os.path.exists(local_path):
-            f = open(local_path, "r", encoding="utf-8")
-
-            try:
-                yield f
-            finally:
-                f.close()
-
-            return
+            with open(local_path, "rb") as f:
+                return f.read()
 
         # Case for remote file
-        resp = requests.get(spec_location, stream=True, timeout=120)
-        if resp.status_code != 200:
-            raise RuntimeError(f"Failed to GET {spec_location}")
+        # pylint: disable-next=import-outside-toplevel
+        from linodecli.spec_cache import fetch_spec
 
-        # We need to access the underlying urllib
-        # response here so we can return a reader
-        # usable in yaml.safe_load(...) and json.load(...)
-        resp.raw.decode_content = True
-
-        try:
-            yield resp.raw
-        finally:
-            resp.close()
+        return fetch_spec(spec_location)
 
     @staticmethod
-    def _parse_spec_file(reader: IO) -> Dict[str, Any]:
+    def _parse_spec_file(content: bytes) -> Dict[str, Any]:
         """
-        Parses the given file reader into a dict and returns a dict.
+        Parses the given YAML or JSON spec file content and returns a dict.
+
+        JSON content is parsed with the json module directly, since it is
+        significantly faster than parsing it as YAML.
 
-        :param reader: A reader for a YAML or JSON file.
+        :param content: The content of a YAML or JSON file.
 
         :returns: The parsed file.
         """
 
+        # pylint: disable-next=import-outside-toplevel
+        import yaml
+
         errors = []
 
-        try:
-            return yaml.safe_load(reader)
-        except yaml.YAMLError as err:
-            errors.append(str(err))
+        text = content.decode("utf-8-sig")
+
+        if text.lstrip().startswith("{"):
+            try:
+                return json.loads(text)
+            except JSONDecodeError as err:
+                errors.append(str(err))
+
+        # Use the C-accelerated loader if libyaml is available
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
         try:
-            return json.load(reader)
-        except JSONDecodeError as err:
+            return yaml.load(text, Loader=loader)
+        except yaml.YAMLError as err:
             errors.append(str(err))
 
         raise ValueError(f"Failed to parse spec file: {'; '.join(errors)}")
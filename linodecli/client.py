@@ -0,0 +1,438 @@
+"""
+A client for calling Linode API operations from Python, using the same
+operations, configuration, and request handling as the CLI.
+"""
+
+import argparse
+import contextlib
+import os
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from linodecli.baked.operation import TYPES, OpenAPIOperation
+from linodecli.baked.util import get_path_segments
+from linodecli.cli import CLI
+from linodecli.configuration import ENV_TOKEN_NAME
+from linodecli.exit_codes import ExitCodes
+from linodecli.helpers import handle_url_overrides
+from linodecli.version import __version__
+
+BASE_URL = "https://api.linode.com/v4"
+
+# The config section holding a token given directly to a client, if the
+# client isn't using a configured user; it is never written to disk
+CLIENT_SECTION = "linode-cli-client"
+
+
+class LinodeClientError(Exception):
+    """
+    The base class for errors raised by a LinodeClient.
+    """
+
+
+class ConfigurationError(LinodeClientError):
+    """
+    Raised if a client can't be configured, e.g. if no token is available.
+    """
+
+
+class ArgumentError(LinodeClientError):
+    """
+    Raised if an operation is called with an unknown or invalid argument.
+    """
+
+
+class ApiError(LinodeClientError):
+    """
+    Raised if the API responds to a request with an error.
+    """
+
+    def __init__(self, response: Any):
+        """
+        :param response: The error response returned by the API.
+        :type response: requests.Response
+        """
+        self.response = response
+        self.status_code = response.status_code
+
+        try:
+            self.errors = response.json().get("errors", [])
+        except ValueError:
+            self.errors = []
+
+        reasons = "; ".join(
+            (
+                f"{error['field']}: {error.get('reason')}"
+                if error.get("field")
+                else str(error.get("reason"))
+            )
+            for error in self.errors
+        )
+
+        super().__init__(
+            f"Request failed: {self.status_code}"
+            + (f" ({reasons})" if reasons else "")
+        )
+
+
+class LinodeClient:
+    """
+    Calls Linode API operations from Python.
+
+    Operations are named by the same command and action as in the CLI, and
+    their arguments are given as keyword arguments named as in the API, e.g.::
+
+        client = LinodeClient()
+        client.call("linodes", "create", type="g6-nanode-1", region="us-east")
+
+        for linode in client.iter_items("linodes", "list", region="us-east"):
+            print(linode["label"])
+
+    The baked operations are loaded once when the client is created, and all
+    requests share one connection pool, so a client should be created once
+    and reused.  A client can be used from many threads at once.
+    """
+
+    # pylint: disable-next=too-many-arguments
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        user: Optional[str] = None,
+        *,
+        base_url: str = BASE_URL,
+        pool_size: Optional[int] = None,
+        retry_policy: Any = None,
+        defaults: bool = False,
+    ):
+        """
+        Creates a client.  If no token is given, the LINODE_CLI_TOKEN
+        environment variable or the token of a user configured with
+        `linode-cli configure` is used.
+
+        :param token: The API token to make requests with.  Unless a user
+                      is also given, no configured user's settings apply.
+        :type token: Optional[str]
+        :param user: The configured user whose token and settings are used.
+                     Defaults to the CLI's default user.
+        :type user: Optional[str]
+        :param base_url: The base URL of the API.
+        :type base_url: str
+        :param pool_size: The maximum number of connections kept alive.
+                          Defaults to the pool_size config value.
+        :type pool_size: Optional[int]
+        :param retry_policy: The policy used to retry failed requests.
+                             Defaults to the policy in the config.
+        :type retry_policy: Optional[RetryPolicy]
+        :param defaults: Whether to fill in arguments from the user's
+                         configured defaults, as the CLI does.
+        :type defaults: bool
+        """
+        self._cli = CLI(
+            __version__,
+            handle_url_overrides(base_url, override_path=True),
+            skip_config=True,
+        )
+
+        if self._cli.ops is None:
+            raise ConfigurationError("No spec baked; the CLI must be baked")
+
+        self._cli.defaults = defaults
+        self._cli.suppress_warnings = True
+        self._cli.pool_size = pool_size
+
+        if retry_policy is not None:
+            self._cli.retry_policy = retry_policy
+
+        self._configure(token, user)
+
+    def _configure(self, token: Optional[str], user: Optional[str]):
+        """
+        Loads the config file and sets the token to make requests with.
+        """
+        config = self._cli.config
+        config.load()
+
+        if user is not None and not config.config.has_section(user):
+            raise ConfigurationError(f"User {user} is not configured")
+
+        config.username = user or config.default_username() or None
+
+        # A configured user's token takes precedence over the environment
+        # only if that user was chosen explicitly
+        config.used_env_token = (
+            user is None and os.getenv(ENV_TOKEN_NAME) is not None
+        )
+
+        if token is not None:
+            config.used_env_token = False
+
+            # Without a user, an explicit token gets a section of its own so
+            # none of the default user's settings (e.g. api_host) apply
+            if user is None:
+                config.username = CLIENT_SECTION
+                config.config.remove_section(CLIENT_SECTION)
+                config.config.add_section(CLIENT_SECTION)
+
+            config.config.set(config.username, "token", token)
+
+        if not config.get_token():
+            raise ConfigurationError(
+                "No token given, set in the environment, or configured"
+            )
+
+    def call(
+        self,
+        command: str,
+        action: str,
+        *params: Any,
+        filters: Optional[Dict[str, Any]] = None,
+        page: int = 1,
+        page_size: int = 100,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """
+        Calls an operation, returning the JSON response.  For operations that
+        list resources, only a single page is returned; see iter_items(...).
+
+        :param command: The operation's command, e.g. "linodes".
+        :type command: str
+        :param action: The operation's action, e.g. "view".
+        :type action: str
+        :param params: The operation's URL parameters, e.g. a Linode's ID.
+        :type params: Any
+        :param filters: The X-Filter header to send, overriding any filters
+                        given as keyword arguments.
+        :type filters: Optional[Dict[str, Any]]
+        :param page: The page of results to return.
+        :type page: int
+        :param page_size: The number of results per page.
+        :type page_size: int
+        :param kwargs: The operation's arguments.
+        :type kwargs: Any
+
+        :returns: The JSON response.
+        :rtype: Dict[str, Any]
+        """
+        # pylint: disable-next=import-outside-toplevel
+        from linodecli.api_request import RequestContext, do_request
+
+        operation = self._find_operation(command, action)
+        args = self._build_args(operation, params, kwargs)
+
+        request = RequestContext(
+            page=page, page_size=page_size, defaults=self._cli.defaults
+        )
+
+        with _raise_on_exit():
+            response = do_request(
+                self._cli,
+                operation,
+                args,
+                filter_header=filters,
+                skip_error_handling=True,
+                request=request,
+            )
+
+        if not 199 < response.status_code < 399:
+            raise ApiError(response)
+
+        return response.json()
+
+    async def call_async(
+        self,
+        command: str,
+        action: str,
+        *params: Any,
+        filters: Optional[Dict[str, Any]] = None,
+        page: int = 1,
+        page_size: int = 100,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """
+        An asyncio counterpart of call(...), which takes the same arguments.
+        Many calls can be awaited at once from a single thread, e.g. with
+        asyncio.gather(...).
+
+        :returns: The JSON response.
+        :rtype: Dict[str, Any]
+        """
+        # pylint: disable-next=import-outside-toplevel
+        from linodecli.api_request import RequestContext
+
+        # pylint: disable-next=import-outside-toplevel
+        from linodecli.api_request_async import do_request
+
+        operation = self._find_operation(command, action)
+        args = self._build_args(operation, params, kwargs)
+
+        request = RequestContext(
+            page=page, page_size=page_size, defaults=self._cli.defaults
+        )
+
+        with _raise_on_exit():
+            response = await do_request(
+                self._cli,
+                operation,
+                args,
+                filter_header=filters,
+                skip_error_handling=True,
+                request=request,
+            )
+
+        if not 199 < response.status_code < 399:
+            raise ApiError(response)
+
+        return response.json()
+
+    async def close_async(self):
+        """
+        Closes the connections opened by call_async(...) from the running
+        event loop.  This should be awaited once the loop is done with the
+        client.
+        """
+        # pylint: disable-next=import-outside-toplevel
+        from linodecli.api_request_async import close
+
+        await close()
+
+    def iter_items(
+        self,
+        command: str,
+        action: str,
+        *params: Any,
+        filters: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Calls an operation that lists resources, yielding every resource on
+        every page of results.  Pages are requested as they are needed.
+
+        :param command: The operation's command, e.g. "linodes".
+        :type command: str
+        :param action: The operation's action, e.g. "list".
+        :type action: str
+        :param params: The operation's URL parameters.
+        :type params: Any
+        :param filters: The X-Filter header to send, overriding any filters
+                        given as keyword arguments.
+        :type filters: Optional[Dict[str, Any]]
+        :param kwargs: The attributes to filter the results by.
+        :type kwargs: Any
+
+        :yield: Each resource listed.
+        """
+        # pylint: disable-next=import-outside-toplevel
+        import requests
+
+        # pylint: disable-next=import-outside-toplevel
+        from linodecli.api_request import (
+            ALL_PAGES_PAGE_SIZE,
+            RequestContext,
+            iter_all_pages,
+        )
+
+        operation = self._find_operation(command, action)
+        args = self._build_args(operation, params, kwargs)
+
+        pages = iter_all_pages(
+            self._cli,
+            operation,
+            args,
+            request=RequestContext(
+                page_size=ALL_PAGES_PAGE_SIZE, defaults=self._cli.defaults
+            ),
+            skip_error_handling=True,
+            filter_header=filters,
+        )
+
+        while True:
+            try:
+                with _raise_on_exit():
+                    page = next(pages)
+            except StopIteration:
+                return
+            except requests.HTTPError as e:
+                raise ApiError(e.response) from e
+
+            yield from page.get("data", [])
+
+    def _find_operation(self, command: str, action: str) -> OpenAPIOperation:
+        """
+        Returns the operation for the given command and action.
+        """
+        try:
+            return self._cli.find_operation(command, action)
+        except ValueError as e:
+            raise ArgumentError(str(e)) from e
+
+    @staticmethod
+    def _build_args(
+        operation: OpenAPIOperation,
+        params: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+    ) -> argparse.Namespace:
+        """
+        Builds the arguments for a request in the form they would be parsed
+        by the operation.
+        """
+        if len(params) != len(operation.params):
+            raise ArgumentError(
+                f"{operation.command} {operation.action} takes "
+                f"{len(operation.params)} parameter(s) "
+                f"({', '.join(p.name for p in operation.params)}), "
+                f"but {len(params)} were given"
+            )
+
+        if operation.method == "get":
+            allowed = {a.name for a in operation.attrs if a.filterable}
+            result = {"order_by": None, "order": "asc"}
+        elif operation.method in ("post", "put"):
+            # Nested arguments are given as dicts (or lists of dicts) of
+            # their top-level argument, e.g. interfaces=[{"purpose": "vpc"}]
+            allowed = {
+                get_path_segments(a.path)[0]
+                for a in operation.args
+                if not a.read_only
+            }
+            result = {}
+        else:
+            allowed = set()
+            result = {}
+
+        result.update({name: None for name in allowed})
+
+        unknown = set(kwargs) - allowed - set(result)
+        if unknown:
+            raise ArgumentError(
+                f"Unknown argument(s) for {operation.command} "
+                f"{operation.action}: {', '.join(sorted(unknown))}"
+            )
+
+        result.update(kwargs)
+
+        if result.get("order_by") is not None and (
+            result["order_by"] not in allowed
+        ):
+            raise ArgumentError(f"Cannot order by {result['order_by']}")
+
+        for param, value in zip(operation.params, params):
+            try:
+                result[param.name] = TYPES[param.type](value)
+            except ValueError as e:
+                raise ArgumentError(f"Invalid {param.name}: {value}") from e
+
+        return argparse.Namespace(**result)
+
+
+@contextlib.contextmanager
+def _raise_on_exit() -> Iterator[None]:
+    """
+    Raises an error in place of any attempt to exit while handling
+    a request, e.g. because of an invalid config value.
+    """
+    try:
+        yield
+    except SystemExit as e:
+        if e.code == ExitCodes.ARGUMENT_ERROR:
+            raise ArgumentError("Invalid argument") from e
+
+        raise LinodeClientError(f"Request failed (exit code {e.code})") from e
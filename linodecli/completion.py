@@ -5,8 +5,6 @@ Contains any code relevant to generating/updating shell completions for linode-c
 
 from string import Template
 
-from openapi3 import OpenAPI
-
 
 def get_completions(ops, help_flag, action):
     """
@@ -104,7 +102,6 @@ complete -F _linode_cli lin"""
             command=op, actions=" ".join(list(actions.keys()))
         )
         for op, actions in ops.items()
-        if not isinstance(actions, OpenAPI)
     ]
 
     rendered = completion_template.safe_substitute(
@@ -3,18 +3,16 @@ Helper functions for configuration related to auth
 """
 
 import re
-import socket
 import sys
-import webbrowser
-from http import server
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional, Tuple
-
-import requests
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
 
 from linodecli.exit_codes import ExitCodes
 from linodecli.helpers import API_CA_PATH
 
+if TYPE_CHECKING:
+    import requests
+
 TOKEN_GENERATION_URL = "https://cloud.linode.com/profile/tokens"
 
 # The hardcoded OAuth client ID for use in web authentication.
@@ -35,7 +33,7 @@ r.send();
 
 
 def _handle_response_status(
-    response: requests.Response,
+    response: "requests.Response",
     exit_on_error: bool = False,
     status_validator: Optional[Callable[[int], bool]] = None,
 ):
@@ -93,6 +91,9 @@ def _do_get_request(
     :returns: The response from the API request.
     :rtype: Dict[str, Any]
     """
+    # pylint: disable-next=import-outside-toplevel
+    import requests
+
     return _do_request(
         base_url,
         requests.get,
@@ -164,6 +165,9 @@ def _check_full_access(base_url: str, token: str) -> bool:
     :returns: Whether the user has full access.
     :rtype: bool
     """
+    # pylint: disable-next=import-outside-toplevel
+    import requests
+
     headers = {
         "Authorization": f"Bearer {token}",
         "Content-Type": "application/json",
@@ -240,6 +244,12 @@ def _get_token_web(base_url: str) -> Tuple[str, str]:
     :return: A tuple containing the username and web token.
     :rtype: Tuple[str, str]
     """
+    # pylint: disable-next=import-outside-toplevel
+    import socket
+
+    # pylint: disable-next=import-outside-toplevel
+    import requests
+
     temp_token = _handle_oauth_callback()
     username = _username_for_token(base_url, temp_token)
 
@@ -276,6 +286,12 @@ def _handle_oauth_callback() -> str:
     :returns: The temporary OAuth token.
     :rtype: str
     """
+    # pylint: disable-next=import-outside-toplevel
+    import webbrowser
+
+    # pylint: disable-next=import-outside-toplevel
+    from http import server
+
     # load up landing page HTML
     landing_page_path = Path(__file__).parent.parent / "oauth-landing-page.html"
     try:
@@ -77,6 +77,13 @@ class CLIConfig:
         elif environ_token is not None:
             self.used_env_token = True
 
+    def load(self):
+        """
+        Loads the config file from disk, replacing any config already loaded.
+        Unlike initializing a CLIConfig, this never prompts for configuration.
+        """
+        self.config = _get_config(load=True)
+
     def default_username(self) -> str:
         """
         Returns the `default-user` username.
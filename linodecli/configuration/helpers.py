@@ -5,7 +5,6 @@ General helper functions for configuraiton
 import configparser
 import math
 import os
-import webbrowser
 from functools import partial
 from typing import Any, Callable, List, Optional
 
@@ -88,6 +87,9 @@ def _check_browsers() -> bool:
     :returns: Whether at least one known-working browser is found.
     :rtype: bool
     """
+    # pylint: disable-next=import-outside-toplevel
+    import webbrowser
+
     # let's see if we _can_ use web
     try:
         webbrowser.get()
@@ -0,0 +1,340 @@
+"""
+Runs a single action for many resources, for --ids and --ids-from.
+
+The action must take the ID of a resource as its first URL parameter, e.g.
+`linode-cli linodes reboot --ids 1,2,3`.  The action is run for each ID,
+up to a bounded number at once, with each request rate limited and retried
+as usual.  The results for every ID are printed together, followed by a
+summary of which IDs succeeded and which failed.
+"""
+
+import argparse
+import itertools
+import re
+import sys
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
+
+from linodecli.exit_codes import ExitCodes
+from linodecli.helpers import map_ordered
+
+if TYPE_CHECKING:
+    from linodecli.baked import OpenAPIOperation
+    from linodecli.cli import CLI
+
+# The default number of IDs an action is run for at once
+DEFAULT_PARALLEL_IDS = 4
+
+
+def parse_args(
+    args: List[str], operation: Optional["OpenAPIOperation"] = None
+) -> Tuple[argparse.Namespace, List[str]]:
+    """
+    Parses --ids, --ids-from and --parallel from the arguments of a command.
+
+    These are parsed once the operation is known rather than with the other
+    static arguments, so an operation's own arguments with the same names
+    take precedence and are left for it to parse.  The remaining arguments
+    should only be used in place of the given ones if --ids or --ids-from
+    was given.
+
+    :param args: The arguments of the command.
+    :type args: List[str]
+    :param operation: The operation the arguments are for, if any.
+    :type operation: Optional[OpenAPIOperation]
+
+    :returns: The parsed arguments and the remaining arguments.
+    :rtype: Tuple[Namespace, List[str]]
+    """
+    taken = set(operation.get_option_strings()) if operation else set()
+
+    parser = argparse.ArgumentParser(add_help=False, allow_abbrev=False)
+    parser.set_defaults(ids=None, ids_from=None, parallel=None)
+
+    if "--parallel" not in taken:
+        parser.add_argument("--parallel", metavar="COUNT", type=int)
+    if "--ids" not in taken:
+        parser.add_argument("--ids", metavar="ID,...", type=str)
+    if "--ids-from" not in taken:
+        parser.add_argument("--ids-from", metavar="FILE", type=str)
+
+    parsed, remaining = parser.parse_known_args(args)
+
+    ids_given = parsed.ids is not None or parsed.ids_from is not None
+
+    if parsed.parallel is not None and not ids_given:
+        print(
+            "--parallel can only be used with --ids or --ids-from",
+            file=sys.stderr,
+        )
+        sys.exit(ExitCodes.ARGUMENT_ERROR)
+
+    if parsed.parallel is not None and parsed.parallel < 1:
+        print("--parallel must be at least 1", file=sys.stderr)
+        sys.exit(ExitCodes.ARGUMENT_ERROR)
+
+    return parsed, remaining
+
+
+def read_ids(ids: Optional[str], ids_from: Optional[str]) -> List[str]:
+    """
+    Returns the IDs given to --ids, and those read from the file given to
+    --ids-from (or stdin, if it is -).  IDs may be separated by commas or
+    whitespace.
+
+    :param ids: The value of --ids.
+    :type ids: Optional[str]
+    :param ids_from: The value of --ids-from.
+    :type ids_from: Optional[str]
+
+    :returns: The IDs, in the order they were given.
+    :rtype: List[str]
+    """
+    values = [ids or ""]
+
+    if ids_from == "-":
+        values.append(sys.stdin.read())
+    elif ids_from is not None:
+        try:
+            with open(ids_from, "r", encoding="utf-8") as f:
+                values.append(f.read())
+        except OSError as e:
+            print(f"Unable to read IDs from {ids_from}: {e}", file=sys.stderr)
+            sys.exit(ExitCodes.FILE_ERROR)
+
+    return [v for v in re.split(r"[\s,]+", " ".join(values)) if v]
+
+
+def get_id_param(operation: "OpenAPIOperation") -> Optional[Any]:
+    """
+    Returns the URL parameter of an operation that IDs are given for, which
+    is its first URL parameter if that is an ID.
+
+    :param operation: The operation.
+    :type operation: OpenAPIOperation
+
+    :returns: The ID parameter, or None if the operation doesn't take one.
+    :rtype: Optional[OpenAPIOperationParameter]
+    """
+    if not operation.params:
+        return None
+
+    param = operation.params[0]
+
+    # e.g. linodeId, but not labels or names like "uuid" or "paid"
+    if (
+        param.type == "integer"
+        or param.name == "id"
+        or (param.name.endswith("Id"))
+    ):
+        return param
+
+    return None
+
+
+# pylint: disable-next=too-many-arguments
+def handle_command_ids(
+    ctx: "CLI",
+    command: str,
+    action: str,
+    args: List[str],
+    ids: List[str],
+    parallel: int = DEFAULT_PARALLEL_IDS,
+):
+    """
+    Runs an action for each of the given IDs, printing the results for every
+    ID and a summary to stderr, then exits.  The exit status is 0 only if the
+    action succeeded for every ID.
+
+    :param ctx: The main CLI object.
+    :type ctx: CLI
+    :param command: The command to run.
+    :type command: str
+    :param action: The action to run.
+    :type action: str
+    :param args: The arguments of the action, excluding the ID.
+    :type args: List[str]
+    :param ids: The IDs to run the action for.
+    :type ids: List[str]
+    :param parallel: The maximum number of IDs to run the action for at once.
+    :type parallel: int
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from linodecli.baked.operation import TYPES
+
+    try:
+        operation = ctx.find_operation(command, action)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        sys.exit(ExitCodes.REQUEST_FAILED)
+
+    param = get_id_param(operation)
+
+    if param is None:
+        print(
+            f"{command} {action} does not take an ID, so --ids and "
+            "--ids-from cannot be used",
+            file=sys.stderr,
+        )
+        sys.exit(ExitCodes.ARGUMENT_ERROR)
+
+    if not ids:
+        print("No IDs given", file=sys.stderr)
+        sys.exit(ExitCodes.ARGUMENT_ERROR)
+
+    # Parameters of any other type are passed through as given
+    convert = TYPES.get(param.type, str)
+
+    try:
+        values = [convert(v) for v in ids]
+    except ValueError:
+        print(f"Invalid {param.name}; expected {param.type}s", file=sys.stderr)
+        sys.exit(ExitCodes.ARGUMENT_ERROR)
+
+    # The arguments are parsed once, so invalid arguments (or prompts for
+    # a value) are only reported once rather than for every ID
+    parsed = operation.parse_args([ids[0], *args])
+
+    results = _run_ids(
+        ctx,
+        operation,
+        (
+            (v, argparse.Namespace(**{**vars(parsed), param.name: v}))
+            for v in values
+        ),
+        parallel,
+    )
+
+    failed = _print_results(ctx, operation, results)
+
+    sys.exit(ExitCodes.REQUEST_FAILED if failed else ExitCodes.SUCCESS)
+
+
+def _run_id(
+    ctx: "CLI", operation: "OpenAPIOperation", parsed: argparse.Namespace
+) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Runs an action for a single ID, returning the JSON response or the
+    reason it failed.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    import requests
+
+    # pylint: disable-next=import-outside-toplevel
+    from linodecli.api_request import (
+        do_request,
+        iter_all_pages,
+        merge_results_data,
+    )
+
+    try:
+        if not ctx.pagination and operation.method == "get":
+            return (
+                merge_results_data(
+                    iter_all_pages(
+                        ctx, operation, parsed, skip_error_handling=True
+                    )
+                ),
+                None,
+            )
+
+        response = do_request(ctx, operation, parsed, skip_error_handling=True)
+    except requests.HTTPError as e:
+        response = e.response
+    except requests.RequestException as e:
+        return None, str(e)
+    except SystemExit as e:
+        return None, f"exited with status {e.code}"
+
+    try:
+        result = response.json()
+    except ValueError:
+        result = None
+
+    if 199 < response.status_code < 399:
+        return result, None
+
+    reasons = [
+        error.get("reason")
+        for error in (result or {}).get("errors", [])
+        if error.get("reason")
+    ]
+
+    return None, f"{response.status_code}" + (
+        f": {'; '.join(reasons)}" if reasons else ""
+    )
+
+
+def _run_ids(
+    ctx: "CLI",
+    operation: "OpenAPIOperation",
+    calls: Iterable[Tuple[Any, argparse.Namespace]],
+    parallel: int,
+) -> Iterable[Tuple[Any, Optional[Dict[str, Any]], Optional[str]]]:
+    """
+    Runs an action for each (ID, arguments), yielding each ID with its result
+    in the order they were given.  Up to parallel IDs are run at once.
+    """
+    return map_ordered(
+        lambda call: (call[0], *_run_id(ctx, operation, call[1])),
+        calls,
+        parallel,
+    )
+
+
+def _print_results(
+    ctx: "CLI",
+    operation: "OpenAPIOperation",
+    results: Iterable[Tuple[Any, Optional[Dict[str, Any]], Optional[str]]],
+) -> int:
+    """
+    Prints the results for every ID together, then a summary of the result
+    for each ID to stderr.
+
+    :returns: The number of IDs the action failed for.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from linodecli.overrides import OUTPUT_OVERRIDES
+
+    handler = ctx.output_handler
+    model = operation.response_model
+    summary = []
+    responses = []
+
+    for value, result, error in results:
+        summary.append((value, error))
+
+        if result:
+            responses.append(result)
+
+    if (operation.command, operation.action, handler.mode) in OUTPUT_OVERRIDES:
+        # Output overrides print each response themselves
+        for result in responses:
+            operation.process_response_json(result, handler)
+    elif model is not None and model.attrs != []:
+        # Print the rows for every ID in one table (or JSON list)
+        rows = itertools.chain.from_iterable(
+            model.fix_json(r) for r in responses
+        )
+
+        handler.print_response(
+            model,
+            rows if operation.can_stream_response(handler) else list(rows),
+        )
+
+    failed = sum(1 for _, error in summary if error is not None)
+    width = max(len(str(value)) for value, _ in summary)
+
+    print("Summary:", file=sys.stderr)
+
+    for value, error in summary:
+        print(
+            f"  {str(value):<{width}}  "
+            + ("succeeded" if error is None else f"failed ({error})"),
+            file=sys.stderr,
+        )
+
+    print(
+        f"{len(summary) - failed} succeeded, {failed} failed", file=sys.stderr
+    )
+
+    return failed
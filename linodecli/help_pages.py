@@ -6,20 +6,17 @@ help pages.
 import sys
 import textwrap
 from collections import defaultdict
-from typing import Dict, List, Optional
-
-from rich import box
-from rich import print as rprint
-from rich.console import Console
-from rich.padding import Padding
-from rich.table import Column, Table
-from rich.text import Text
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 from linodecli.baked import OpenAPIOperation
 from linodecli.baked.request import OpenAPIRequestArg
 from linodecli.exit_codes import ExitCodes
+from linodecli.fanout import get_id_param
 from linodecli.plugins import plugins
 
+if TYPE_CHECKING:
+    from rich.console import Console
+
 HELP_ENV_VARS = {
     "LINODE_CLI_TOKEN": "A Linode Personal Access Token for the CLI to make requests with. "
     "If specified, the configuration step will be skipped.",
@@ -33,6 +30,10 @@ HELP_ENV_VARS = {
     "(e.g. 'https')",
     "LINODE_CLI_CONFIG": "Overrides the default configuration file path. "
     "(e.g '~/.linode/my-cli-config')",
+    "LINODE_CLI_TIMINGS": "If set to 1, prints how long each phase of every "
+    "command took to stderr, as with --timings.",
+    "LINODE_CLI_NO_RATE_LIMIT": "If set to 1, requests are sent without "
+    "waiting for the API's rate limits.",
 }
 
 HELP_TOPICS = {
@@ -48,9 +49,18 @@ def print_help_env_vars():
 
         linode-cli env-vars
     """
+    # pylint: disable-next=import-outside-toplevel
+    from rich import print as rprint
+
+    # pylint: disable-next=import-outside-toplevel
+    from rich.box import SQUARE
+
+    # pylint: disable-next=import-outside-toplevel
+    from rich.table import Table
+
     rprint("\n[bold cyan]Environment variables:")
 
-    table = Table(show_header=True, header_style="bold", box=box.SQUARE)
+    table = Table(show_header=True, header_style="bold", box=SQUARE)
     table.add_column("Name")
     table.add_column("Description")
 
@@ -67,6 +77,12 @@ def print_help_commands(ops):
         linode-cli commands
     """
     # commands to manage CLI users (don't call out to API)
+    # pylint: disable-next=import-outside-toplevel
+    from rich import print as rprint
+
+    # pylint: disable-next=import-outside-toplevel
+    from rich.table import Table
+
     rprint("\n[bold cyan]CLI user management commands:")
     um_commands = [["configure", "set-user", "show-users"], ["remove-user"]]
     table = Table(show_header=False)
@@ -84,7 +100,7 @@ def print_help_commands(ops):
 
     # other CLI commands
     rprint("\n[bold cyan]Other CLI commands:")
-    other_commands = [["completion"]]
+    other_commands = [["completion", "batch"]]
     table = Table(show_header=False)
     for cmd in other_commands:
         table.add_row(*cmd)
@@ -112,6 +128,12 @@ def print_help_plugins(config):
 
         linode-cli plugins
     """
+    # pylint: disable-next=import-outside-toplevel
+    from rich import print as rprint
+
+    # pylint: disable-next=import-outside-toplevel
+    from rich.table import Table
+
     if plugins.available(config):
         # only show this if there are any available plugins
         rprint("\n[bold cyan]Available plugins:")
@@ -134,6 +156,9 @@ def print_help_default():
     """
     Prints help output with options from the API spec
     """
+    # pylint: disable-next=import-outside-toplevel
+    from rich import print as rprint
+
     rprint("\n[bold cyan]Help Topics")
     for k, v in HELP_TOPICS.items():
         print("  " + k + ": " + v)
@@ -157,6 +182,12 @@ def print_help_command_actions(
     :param command: The command to print the help page for.
     """
 
+    # pylint: disable-next=import-outside-toplevel
+    from rich import print as rprint
+
+    # pylint: disable-next=import-outside-toplevel
+    from rich.table import Column, Table
+
     print(f"linode-cli {command} [ACTION]\n\nAvailable actions: ", file=file)
 
     content = [
@@ -180,6 +211,9 @@ def print_help_action(
     """
     Prints help relevant to the command and action
     """
+    # pylint: disable-next=import-outside-toplevel
+    from rich.console import Console
+
     try:
         op = cli.find_operation(command, action)
     except ValueError as exc:
@@ -197,6 +231,13 @@ def print_help_action(
     console.print()
     console.print(f"[cyan]{op.summary}[/]")
 
+    id_param = get_id_param(op)
+    if id_param is not None:
+        console.print(
+            f"Use --ids or --ids-from instead of {id_param.name.upper()} "
+            "to run this action for many IDs at once."
+        )
+
     if op.docs_url:
         console.print(
             f"[bold]API Documentation[/]: [link={op.docs_url}]{op.docs_url}[/link]"
@@ -233,7 +274,7 @@ def print_help_action(
         _help_action_print_body_args(console, op, op.args)
 
 
-def _help_action_print_filter_args(console: Console, op: OpenAPIOperation):
+def _help_action_print_filter_args(console: "Console", op: OpenAPIOperation):
     """
     Pretty-prints all the filter (GET) arguments for this operation.
     """
@@ -253,7 +294,7 @@ def _help_action_print_filter_args(console: Console, op: OpenAPIOperation):
 
 
 def _help_action_print_body_args(
-    console: Console,
+    console: "Console",
     op: OpenAPIOperation,
     args: List[OpenAPIRequestArg],
     title: Optional[str] = None,
@@ -261,6 +302,12 @@ def _help_action_print_body_args(
     """
     Pretty-prints all the body (POST/PUT) arguments for this operation.
     """
+    # pylint: disable-next=import-outside-toplevel
+    from rich.padding import Padding
+
+    # pylint: disable-next=import-outside-toplevel
+    from rich.text import Text
+
     console.print(f"[bold]Arguments{f' ({title})' if title else ''}:[/]")
 
     for group in _help_group_arguments(args):
@@ -2,13 +2,26 @@
 Various helper functions shared across multiple CLI components.
 """
 
+import contextlib
 import glob
+import itertools
 import os
 from argparse import ArgumentParser
+from collections import deque
 from pathlib import Path
-from typing import Optional
+from typing import (
+    Callable,
+    ContextManager,
+    Iterable,
+    Iterator,
+    Optional,
+    TypeVar,
+)
 from urllib.parse import urlparse
 
+T = TypeVar("T")
+R = TypeVar("R")
+
 API_HOST_OVERRIDE = os.getenv("LINODE_CLI_API_HOST")
 API_VERSION_OVERRIDE = os.getenv("LINODE_CLI_API_VERSION")
 API_SCHEME_OVERRIDE = os.getenv("LINODE_CLI_API_SCHEME")
@@ -18,6 +31,36 @@ API_SCHEME_OVERRIDE = os.getenv("LINODE_CLI_API_SCHEME")
 # no path is specified.
 API_CA_PATH = os.getenv("LINODE_CLI_CA", None) or True
 
+# The default number of pages requested at once when using --all-rows
+DEFAULT_PARALLEL_PAGES = 4
+
+CACHE_NAME = "linode-cli"
+
+
+def get_cache_dir(*parts: str, create: bool = True) -> str:
+    """
+    Returns the path to a directory under the CLI's cache directory,
+    creating it if it does not exist.
+
+    The cache directory is resolved on each call so it always respects
+    the current value of XDG_CACHE_HOME.
+
+    :param parts: The path segments of the directory under the cache directory.
+    :param create: Whether to create the directory if it does not exist.
+
+    :returns: The path to the cache directory.
+    """
+    path = os.path.join(
+        os.environ.get("XDG_CACHE_HOME", f"{os.path.expanduser('~')}/.cache"),
+        CACHE_NAME,
+        *parts,
+    )
+
+    if create:
+        os.makedirs(path, exist_ok=True)
+
+    return path
+
 
 def handle_url_overrides(
     url: str,
@@ -113,6 +156,62 @@ def register_debug_arg(parser: ArgumentParser):
     )
 
 
+def map_ordered(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    parallel: int,
+    wait: Callable[[], ContextManager] = contextlib.nullcontext,
+) -> Iterator[R]:
+    """
+    Calls a function for each item, yielding the results in the order of the
+    items.  If parallel is greater than 1, up to that many calls are run at
+    once in worker threads.
+
+    Only that many items are read ahead of the results, so items can be
+    streamed, and no more calls are started once the consumer stops or a
+    call raises an error (which is raised when its result is reached).
+
+    :param func: The function to call for each item.
+    :type func: Callable[[T], R]
+    :param items: The items to call the function for.
+    :type items: Iterable[T]
+    :param parallel: The maximum number of calls to run at once.
+    :type parallel: int
+    :param wait: Returns a context manager to wrap each wait for a result in,
+                 e.g. to record how long it took.
+    :type wait: Callable[[], ContextManager]
+
+    :returns: An iterator of the result of each call.
+    :rtype: Iterator[R]
+    """
+    if parallel <= 1:
+        yield from map(func, items)
+        return
+
+    # pylint: disable-next=import-outside-toplevel
+    from concurrent.futures import ThreadPoolExecutor
+
+    items = iter(items)
+    executor = ThreadPoolExecutor(max_workers=parallel)
+
+    try:
+        pending = deque(
+            executor.submit(func, item)
+            for item in itertools.islice(items, parallel)
+        )
+
+        while pending:
+            with wait():
+                result = pending.popleft().result()
+
+            for item in itertools.islice(items, 1):
+                pending.append(executor.submit(func, item))
+
+            yield result
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
 def expand_globs(pattern: str):
     """
     Expand glob pattern (for example, '/some/path/*.txt')
@@ -25,6 +25,13 @@ def register_output_args_shared(parser: ArgumentParser):
     parser.add_argument(
         "--json", action="store_true", help="Display output as JSON."
     )
+    parser.add_argument(
+        "--ndjson",
+        "--jsonl",
+        action="store_true",
+        help="Display output as newline-delimited JSON, with one object "
+        "per line.",
+    )
     parser.add_argument(
         "--markdown",
         action="store_true",
@@ -3,21 +3,33 @@ Handles formatting the output of commands used in Linode CLI
 """
 
 import copy
+import itertools
 import json
 import sys
 from argparse import Namespace
 from enum import Enum, auto
 from sys import stdout
-from typing import IO, Any, Dict, List, Optional, Union, cast
-
-from rich import box
-from rich import print as rprint
-from rich.console import OverflowMethod
-from rich.table import Column, Table
-
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Union,
+    cast,
+)
+
+from linodecli import timings
 from linodecli.baked.response import OpenAPIResponse, OpenAPIResponseAttr
 from linodecli.baked.util import get_terminal_keys
 
+if TYPE_CHECKING:
+    from rich.box import Box
+    from rich.console import OverflowMethod
+
 
 class OutputMode(Enum):
     """
@@ -29,6 +41,15 @@ class OutputMode(Enum):
     json = auto()
     markdown = auto()
     ascii_table = auto()
+    ndjson = auto()
+
+
+# Output modes that print rows as JSON objects
+JSON_OUTPUT_MODES = (OutputMode.json, OutputMode.ndjson)
+
+# The number of rows to print between flushes for non-interactive
+# newline-delimited JSON output; this matches the --all-rows page size
+NDJSON_FLUSH_ROWS = 500
 
 
 class OutputHandler:  # pylint: disable=too-few-public-methods,too-many-instance-attributes
@@ -88,14 +109,15 @@ class OutputHandler:  # pylint: disable=too-few-public-methods,too-many-instance
                 header, data, columns, title, to
             ),
             OutputMode.ascii_table: lambda: self._table_output(
-                header, data, columns, title, to, box_style=box.ASCII
+                header, data, columns, title, to, box_style="ASCII"
             ),
             OutputMode.delimited: lambda: self._delimited_output(
                 header, data, columns, to, title=title
             ),
             OutputMode.json: lambda: self._json_output(header, data, to),
+            OutputMode.ndjson: lambda: self._ndjson_output(header, data, to),
             OutputMode.markdown: lambda: self._table_output(
-                header, data, columns, title, to, box_style=box.MARKDOWN
+                header, data, columns, title, to, box_style="MARKDOWN"
             ),
         }
 
@@ -115,10 +137,33 @@ class OutputHandler:  # pylint: disable=too-few-public-methods,too-many-instance
 
         output_mode_to_func[self.mode]()
 
+    def supports_streaming(self, response_model: OpenAPIResponse) -> bool:
+        """
+        Returns whether responses for the given model can be printed row by row
+        as they are received, without first collecting every row.
+
+        Tables need every row to determine their layout, and subtables
+        are printed after the root table, so both require buffering.
+
+        :param response_model: The OpenAPI response to format this output with.
+        :type response_model: OpenAPIResponse
+
+        :returns: Whether print_response accepts an iterator of rows.
+        :rtype: bool
+        """
+        if self.mode in JSON_OUTPUT_MODES:
+            return True
+
+        if self.mode == OutputMode.delimited:
+            return self.single_table or not response_model.subtables
+
+        return False
+
+    @timings.timed("rendering")
     def print_response(
         self,
         response_model: OpenAPIResponse,
-        data: List[Union[str, dict]],
+        data: Iterable[Union[str, dict]],
         to: IO[str] = stdout,
     ):
         """
@@ -126,8 +171,9 @@ class OutputHandler:  # pylint: disable=too-few-public-methods,too-many-instance
 
         :param response_model: The OpenAPI response to format this output with.
         :type response_model: OpenAPIResponse
-        :param data: The API-returned data to output.
-        :type data: List[Union[str, dict]]
+        :param data: The API-returned data to output. This may only be an
+                     iterator if supports_streaming returns True.
+        :type data: Iterable[Union[str, dict]]
         :param to: The IO stream to output to.
         :type to: IO[str]
         """
@@ -140,7 +186,7 @@ class OutputHandler:  # pylint: disable=too-few-public-methods,too-many-instance
         if (
             response_model.subtables is not None
             # We do not want to use subtables in JSON output
-            and self.mode != OutputMode.json
+            and self.mode not in JSON_OUTPUT_MODES
             and not self.single_table
         ):
             for table in response_model.subtables:
@@ -260,15 +306,37 @@ class OutputHandler:  # pylint: disable=too-few-public-methods,too-many-instance
             for v in columns
             # We don't want to limit the attribute depth on JSON
             # outputs since JSON can properly display nested lists.
-            if self.mode == OutputMode.json or v.nested_list_depth < max_depth
+            if self.mode in JSON_OUTPUT_MODES or v.nested_list_depth < max_depth
         ]
 
     def _table_output(
-        self, header, data, columns, title, to, box_style=box.SQUARE
-    ):  # pylint: disable=too-many-arguments
+        self,
+        header,
+        data,
+        columns,
+        title,
+        to,
+        box_style: Union["Box", str] = "SQUARE",
+    ):  # pylint: disable=too-many-arguments,too-many-locals
         """
         Pretty-prints data in a table
+
+        :param box_style: The rich Box to draw the table with, or the name of one.
         """
+        # rich is only needed for table output, so we don't import it
+        # until a table is actually printed.
+        # pylint: disable-next=import-outside-toplevel
+        import rich.box
+
+        # pylint: disable-next=import-outside-toplevel
+        from rich import print as rprint
+
+        # pylint: disable-next=import-outside-toplevel
+        from rich.table import Column, Table
+
+        if isinstance(box_style, str):
+            box_style = getattr(rich.box, box_style)
+
         content = self._build_output_content(
             data,
             columns,
@@ -278,7 +346,7 @@ class OutputHandler:  # pylint: disable=too-few-public-methods,too-many-instance
         # Determine the rich overflow mode to use
         # for each column.
         overflow_mode = cast(
-            OverflowMethod, "fold" if self.disable_truncation else "ellipsis"
+            "OverflowMethod", "fold" if self.disable_truncation else "ellipsis"
         )
 
         # Convert the headers into column objects
@@ -328,14 +396,42 @@ class OutputHandler:  # pylint: disable=too-few-public-methods,too-many-instance
         """
         Prints data in JSON format
         """
+        self._print_json_list(self._get_json_content(header, data), to)
+
+    def _ndjson_output(self, header, data, to):
+        """
+        Prints data in newline-delimited JSON format, with one compact
+        object per line.
+
+        Output is flushed after every line when printing to a terminal,
+        and otherwise after every NDJSON_FLUSH_ROWS lines, so consumers
+        receive rows in batches as they are printed.
+        """
+        flush_rows = 1 if to.isatty() else NDJSON_FLUSH_ROWS
+
+        for i, row in enumerate(self._get_json_content(header, data), 1):
+            to.write(json.dumps(row, separators=(",", ":")) + "\n")
+
+            if i % flush_rows == 0:
+                to.flush()
+
+        to.flush()
+
+    def _get_json_content(self, header, data) -> Iterator[Dict[str, Any]]:
+        """
+        Yields the JSON object to print for each row of data.
+        """
         # Special handling for JSON headers.
         # We're only interested in the last part of the column name, unless the last
         # part is a dotted key. If the last part is a dotted key, include the entire dotted key.
 
-        content = []
-        if len(data) and isinstance(data[0], dict):  # we got delimited json in
+        data = iter(data)
+        first = next(data, None)
+        rows = itertools.chain((first,), data) if first is not None else ()
+
+        if isinstance(first, dict):  # we got delimited json in
             parsed_header = []
-            terminal_keys = get_terminal_keys(data[0])
+            terminal_keys = get_terminal_keys(first)
 
             for v in header:
                 parts = v.split(".")
@@ -348,22 +444,42 @@ class OutputHandler:  # pylint: disable=too-few-public-methods,too-many-instance
                     parsed_header.append(parts[-1])
 
             # parse down to the value we display
-            for row in data:
-                content.append(self._select_json_elements(parsed_header, row))
+            content = (
+                self._select_json_elements(parsed_header, row) for row in rows
+            )
         else:  # this is a list
             header = [v.split(".")[-1] for v in header]
 
-            for row in data:
-                content.append(dict(zip(header, row)))
+            content = (dict(zip(header, row)) for row in rows)
 
-        print(
-            json.dumps(
-                content,
-                indent=2 if self.pretty_json else None,
-                sort_keys=self.pretty_json,
-            ),
-            file=to,
-        )
+        return content
+
+    def _print_json_list(self, content: Iterable[Any], to: IO[str]):
+        """
+        Prints a JSON list one element at a time, producing the same
+        output as printing json.dumps of the whole list.
+        """
+        indent = 2 if self.pretty_json else None
+
+        # Elements of an indented list are separated by newlines
+        # and indented by one level
+        if self.pretty_json:
+            start, separator, end = "[\n  ", ",\n  ", "\n]"
+        else:
+            start, separator, end = "[", ", ", "]"
+
+        empty = True
+
+        for v in content:
+            element = json.dumps(v, indent=indent, sort_keys=self.pretty_json)
+            if self.pretty_json:
+                element = element.replace("\n", "\n  ")
+
+            to.write(start if empty else separator)
+            to.write(element)
+            empty = False
+
+        to.write("[]\n" if empty else end + "\n")
 
     @staticmethod
     def _select_json_elements(keys, json_res):
@@ -404,24 +520,21 @@ class OutputHandler:  # pylint: disable=too-few-public-methods,too-many-instance
         value_transform=lambda attr, model: model,
     ):
         """
-        Returns the `content` to be displayed by the corresponding output function.
+        Yields the `content` to be displayed by the corresponding output function.
         `value_transform` allows functions to specify how each value should be formatted.
         """
 
-        content = []
-
         if self.headers and header is not None:
-            content = [header]
+            yield header
 
         # We're not using models here
         # We won't apply transforms here since no formatting is being applied
         if isinstance(columns[0], str):
-            return content + data
+            yield from data
+            return
 
         for model in data:
-            content.append([value_transform(attr, model) for attr in columns])
-
-        return content
+            yield [value_transform(attr, model) for attr in columns]
 
     def configure(
         self,
@@ -436,6 +549,9 @@ class OutputHandler:  # pylint: disable=too-few-public-methods,too-many-instance
         elif parsed.json:
             self.mode = OutputMode.json
             self.columns = "*"
+        elif parsed.ndjson:
+            self.mode = OutputMode.ndjson
+            self.columns = "*"
         elif parsed.markdown:
             self.mode = OutputMode.markdown
         elif parsed.ascii_table:
@@ -443,7 +559,8 @@ class OutputHandler:  # pylint: disable=too-few-public-methods,too-many-instance
 
         if parsed.delimiter:
             self.delimiter = parsed.delimiter
-        if parsed.pretty:
+        # JSON lines can't be pretty-printed
+        if parsed.pretty and self.mode != OutputMode.ndjson:
             self.mode = OutputMode.json
             self.pretty_json = True
             self.columns = "*"
@@ -4,17 +4,13 @@ This allows us to easily alter per-command outputs, etc. without making
 large changes to the OpenAPI spec.
 """
 
-from typing import Dict, List
-
-from rich import box
-from rich import print as rprint
-from rich.align import Align
-from rich.console import Console
-from rich.table import Table
-from rich.theme import Theme
+from typing import TYPE_CHECKING, Dict, List
 
 from linodecli.output.output_handler import OutputMode
 
+if TYPE_CHECKING:
+    from rich.table import Table
+
 OUTPUT_OVERRIDES = {}
 
 REPLICA_STATUS_THEME = {
@@ -143,10 +139,22 @@ def handle_placement_unassign_linode(
 def linode_types_with_region_prices(
     operation, output_handler, json_data
 ) -> bool:
-    # pylint: disable=unused-argument
+    # pylint: disable=unused-argument,too-many-locals
     """
     Parse and reformat linode types output with region prices.
     """
+    # pylint: disable-next=import-outside-toplevel
+    from rich import print as rprint
+
+    # pylint: disable-next=import-outside-toplevel
+    from rich.align import Align
+
+    # pylint: disable-next=import-outside-toplevel
+    from rich.console import Console
+
+    # pylint: disable-next=import-outside-toplevel
+    from rich.table import Table
+
     if len(json_data["data"]) < 1:
         return True
 
@@ -205,6 +213,15 @@ def format_region_prices(data: Dict[str, any]) -> any:
     """
     Format nested region price entry into a sub-table.
     """
+    # pylint: disable-next=import-outside-toplevel
+    from rich import box
+
+    # pylint: disable-next=import-outside-toplevel
+    from rich.align import Align
+
+    # pylint: disable-next=import-outside-toplevel
+    from rich.table import Table
+
     subheaders = ["id", "hourly", "monthly"]
 
     sub_table = Table(box=box.SIMPLE_HEAVY)
@@ -222,10 +239,16 @@ def format_region_prices(data: Dict[str, any]) -> any:
     return sub_table
 
 
-def build_replicas_output(replicas: List) -> Table:
+def build_replicas_output(replicas: List) -> "Table":
     """
     Format nested replicas list to a sub-table.
     """
+    # pylint: disable-next=import-outside-toplevel
+    from rich.align import Align
+
+    # pylint: disable-next=import-outside-toplevel
+    from rich.table import Table
+
     replicas_output = Table(show_header=False, box=None)
     replicas_headers = replicas[0].keys()
     for replica in replicas:
@@ -246,6 +269,18 @@ def image_replicate_output(json_data) -> bool:
     """
     Parse and format the image replicate output table.
     """
+    # pylint: disable-next=import-outside-toplevel
+    from rich.align import Align
+
+    # pylint: disable-next=import-outside-toplevel
+    from rich.console import Console
+
+    # pylint: disable-next=import-outside-toplevel
+    from rich.table import Table
+
+    # pylint: disable-next=import-outside-toplevel
+    from rich.theme import Theme
+
     console = Console(theme=Theme(REPLICA_STATUS_THEME))
 
     output = Table(
@@ -272,10 +307,16 @@ def image_replicate_output(json_data) -> bool:
     return False
 
 
-def build_pg_members(members: List) -> Table:
+def build_pg_members(members: List) -> "Table":
     """
     Format nested linode members list to a sub-table.
     """
+    # pylint: disable-next=import-outside-toplevel
+    from rich.align import Align
+
+    # pylint: disable-next=import-outside-toplevel
+    from rich.table import Table
+
     table = Table()
 
     member_headers = members[0].keys()
@@ -295,6 +336,15 @@ def pg_view_output(json_data) -> bool:
     """
     Parse and format the placement group output table.
     """
+    # pylint: disable-next=import-outside-toplevel
+    from rich.align import Align
+
+    # pylint: disable-next=import-outside-toplevel
+    from rich.console import Console
+
+    # pylint: disable-next=import-outside-toplevel
+    from rich.table import Table
+
     output = Table(
         header_style="bold",
         show_lines=True,
@@ -321,6 +371,9 @@ def add_param_row(output, param_name, param_data):
     """
     Construct and add a row to the output table for DB Config view overrides.
     """
+    # pylint: disable-next=import-outside-toplevel
+    from rich.align import Align
+
     param_type = str(param_data.get("type", ""))
     example = str(param_data.get("example", ""))
     minimum = str(param_data.get("minimum", ""))
@@ -349,6 +402,12 @@ def databases_mysql_config_view_output(json_data) -> bool:
     """
     Parse and format the MySQL configuration output table.
     """
+    # pylint: disable-next=import-outside-toplevel
+    from rich.console import Console
+
+    # pylint: disable-next=import-outside-toplevel
+    from rich.table import Table
+
     output = Table(header_style="bold", show_lines=True)
 
     output.add_column("Parameter", style="bold")
@@ -380,6 +439,12 @@ def databases_postgres_config_view_output(json_data) -> bool:
     """
     Parse and format the PostgreSQL configuration output table.
     """
+    # pylint: disable-next=import-outside-toplevel
+    from rich.console import Console
+
+    # pylint: disable-next=import-outside-toplevel
+    from rich.table import Table
+
     output = Table(header_style="bold", show_lines=True)
 
     output.add_column("Parameter", style="bold")
@@ -0,0 +1,160 @@
+"""
+Profiles a CLI invocation, for --profile and --profile-memory.
+
+Profiling starts as soon as the CLI's main() is called, so loading the spec
+and config is included along with the command (or plugin) that is run, and
+the results are written when the CLI exits.
+"""
+
+import atexit
+import re
+import sys
+import time
+from typing import List, Optional, TextIO, Tuple
+
+PROFILE_ARG = "--profile"
+PROFILE_MEMORY_ARG = "--profile-memory"
+
+# The number of allocation sites included in the memory summary
+MEMORY_SUMMARY_LINES = 10
+
+_profiler = None
+_path: Optional[str] = None
+_memory = False
+_context: List[str] = []
+
+
+def parse_args(args: List[str]) -> Tuple[Optional[str], bool, List[str]]:
+    """
+    Extracts the profiling arguments from the given arguments.
+
+    Since the path given to --profile is optional, it must be given as
+    --profile=PATH; these arguments are removed before the remaining
+    arguments are parsed so the next argument isn't mistaken for a path.
+
+    :param args: The arguments the CLI was invoked with.
+    :type args: List[str]
+
+    :returns: The path to write the profile to (an empty string to use
+              the default path, or None if not profiling), whether to
+              summarize memory usage, and the remaining arguments.
+    :rtype: Tuple[Optional[str], bool, List[str]]
+    """
+    path = None
+    memory = False
+    remaining = []
+
+    for arg in args:
+        if arg == PROFILE_ARG:
+            path = ""
+        elif arg.startswith(f"{PROFILE_ARG}="):
+            path = arg.split("=", 1)[1]
+        elif arg == PROFILE_MEMORY_ARG:
+            memory = True
+        else:
+            remaining.append(arg)
+
+    return path, memory, remaining
+
+
+def start(path: Optional[str] = None, memory: bool = False):
+    """
+    Starts profiling, and writes the results when the CLI exits.
+
+    :param path: The path to write a pstats file to, an empty string to use
+                 a default path, or None to skip profiling function calls.
+    :type path: Optional[str]
+    :param memory: Whether to trace memory allocations and print a summary
+                   of them to stderr.
+    :type memory: bool
+    """
+    global _profiler, _path, _memory  # pylint: disable=global-statement
+
+    if path is None and not memory:
+        return
+
+    _path = path
+    _memory = memory
+
+    atexit.register(stop)
+
+    if memory:
+        # pylint: disable-next=import-outside-toplevel
+        import tracemalloc
+
+        tracemalloc.start()
+
+    if path is not None:
+        # pylint: disable-next=import-outside-toplevel
+        import cProfile
+
+        _profiler = cProfile.Profile()
+        _profiler.enable()
+
+
+def set_context(*parts: Optional[str]):
+    """
+    Records the command being profiled, which is included in the default
+    profile path and the summary printed when profiling stops.
+
+    :param parts: The command and action being run, if any.
+    :type parts: Optional[str]
+    """
+    _context[:] = [p for p in parts if p]
+
+
+def stop(file: Optional[TextIO] = None):
+    """
+    Stops profiling and writes the results.
+
+    :param file: The file to print the summary to.  Defaults to stderr.
+    :type file: Optional[TextIO]
+    """
+    global _profiler, _memory  # pylint: disable=global-statement
+
+    file = file or sys.stderr
+    command = " ".join(["linode-cli", *_context])
+
+    if _profiler is not None:
+        _profiler.disable()
+
+        path = _path or get_default_path()
+        _profiler.dump_stats(path)
+        _profiler = None
+
+        print(
+            f"Wrote profile of `{command}` to {path}; "
+            f"view it with `python3 -m pstats {path}`",
+            file=file,
+        )
+
+    if _memory:
+        # pylint: disable-next=import-outside-toplevel
+        import tracemalloc
+
+        snapshot = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        _memory = False
+
+        print(
+            f"Peak memory usage of `{command}`: {peak / 1024 / 1024:.1f} MiB",
+            file=file,
+        )
+        print("Largest allocations:", file=file)
+
+        for stat in snapshot.statistics("lineno")[:MEMORY_SUMMARY_LINES]:
+            print(f"  {stat}", file=file)
+
+
+def get_default_path() -> str:
+    """
+    Returns the default path to write a profile to, which identifies
+    the command that was profiled.
+
+    :returns: The default profile path.
+    :rtype: str
+    """
+    name = "-".join(["linode-cli", *_context, time.strftime("%Y%m%d%H%M%S")])
+
+    return re.sub(r"[^\w.-]", "_", name) + ".prof"
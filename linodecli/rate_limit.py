@@ -0,0 +1,365 @@
+"""
+A rate limiter for API requests that is shared by every CLI process on a host.
+
+The API reports the state of each rate limit in the X-RateLimit-Limit,
+X-RateLimit-Remaining and X-RateLimit-Reset response headers.  This state is
+stored in a small file per token and resource collection, which concurrent
+CLI processes update under a file lock.
+
+Before each request, a process reserves the next available time slot.  Slots
+are handed out immediately while plenty of requests remain in the current
+window; once fewer than PACING_THRESHOLD of them remain, the remaining
+requests are spread evenly over the rest of the window, and once none remain,
+requests wait for the window to reset.  This paces requests proactively rather
+than sending them until the API responds with 429.
+
+No state is read or written until the API has reported a rate limit, and
+none is reserved once the reported window has passed.  Rate limiting can be
+turned off entirely by setting LINODE_CLI_NO_RATE_LIMIT=1.
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import threading
+import time
+from logging import getLogger
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional
+
+from linodecli.helpers import get_cache_dir
+
+if TYPE_CHECKING:
+    from requests import Response
+
+logger = getLogger(__name__)
+
+RATE_LIMIT_DIR = "ratelimit"
+
+ENV_NO_RATE_LIMIT = "LINODE_CLI_NO_RATE_LIMIT"
+
+# The fraction of a window's requests below which requests are paced
+PACING_THRESHOLD = 0.2
+
+# The maximum number of seconds to wait at once.  Slots further away than
+# this aren't reserved; the caller waits this long and tries again, so it
+# picks up any newer state reported in the meantime.
+MAX_WAIT = 60
+
+# Reset headers below this value are relative to the current time
+_RELATIVE_RESET_MAX = 1_000_000_000
+
+# Serializes access to the state files between threads of this process
+_thread_lock = threading.Lock()
+
+
+def enabled() -> bool:
+    """
+    Returns whether requests should be rate limited.
+
+    :returns: False if rate limiting was turned off through the environment.
+    :rtype: bool
+    """
+    return os.getenv(ENV_NO_RATE_LIMIT) != "1"
+
+
+def get_key(token: str, host: str, resource: str) -> str:
+    """
+    Returns the key of the rate limit that applies to a request.
+
+    :param token: The token the request is made with.
+    :type token: str
+    :param host: The API host of the request.
+    :type host: str
+    :param resource: The resource collection of the request.
+    :type resource: str
+
+    :returns: The key of the rate limit.
+    :rtype: str
+    """
+    return hashlib.sha256(
+        json.dumps([token, host, resource]).encode()
+    ).hexdigest()
+
+
+def acquire(key: str) -> float:
+    """
+    Reserves a time slot for a request and waits until it is reached.
+
+    This does nothing until the API has reported the state of the rate limit.
+
+    :param key: The key of the rate limit.
+    :type key: str
+
+    :returns: The number of seconds waited.
+    :rtype: float
+    """
+    waited = 0
+
+    for wait in waits(key):
+        time.sleep(wait)
+        waited += wait
+
+    return waited
+
+
+def waits(key: str) -> Iterator[float]:
+    """
+    Reserves a time slot for a request, yielding each number of seconds the
+    caller must wait before the slot is reached, so callers that can't block
+    (e.g. coroutines) can wait for it themselves.
+
+    Advancing this reads and writes the shared rate limit state.
+
+    :param key: The key of the rate limit.
+    :type key: str
+
+    :returns: An iterator of the waits before the reserved slot.
+    :rtype: Iterator[float]
+    """
+    while True:
+        wait = reserve(key)
+        reserved = wait is not None
+
+        if not reserved:
+            wait = MAX_WAIT
+
+        if wait > 0:
+            logger.debug("Waiting %.2fs for rate limit", wait)
+            yield wait
+
+        if reserved:
+            return
+
+
+def reserve(key: str) -> Optional[float]:
+    """
+    Reserves a time slot for a request without waiting for it.
+
+    If the next slot is more than MAX_WAIT seconds away, no slot is reserved
+    and None is returned; the caller should wait MAX_WAIT seconds and try
+    again.  Requests are never sent before their slot.
+
+    :param key: The key of the rate limit.
+    :type key: str
+
+    :returns: The number of seconds until the reserved slot, or None.
+    :rtype: Optional[float]
+    """
+    if not enabled():
+        return 0
+
+    path = _state_path(key, create=False)
+
+    # The state is replaced atomically, so it can be checked without the
+    # lock; nothing is reserved until the API reports the current window
+    if not _is_current(_read_state(path)):
+        return 0
+
+    with _locked(path):
+        state = _read_state(path)
+        if not _is_current(state):
+            return 0
+
+        now = time.time()
+        slot = max(now, state["next"])
+        exhausted = state["remaining"] <= 0
+
+        if exhausted:
+            slot = max(slot, state["reset"])
+
+        if slot - now > MAX_WAIT:
+            # Too far away to reserve yet
+            return None
+
+        if exhausted:
+            state["remaining"] = state["limit"]
+            state["reset"] = slot + state["window"]
+
+        state["remaining"] -= 1
+
+        # Spread the remaining requests over the rest of the window
+        interval = 0
+        if state["remaining"] < state["limit"] * PACING_THRESHOLD:
+            interval = (state["reset"] - slot) / max(state["remaining"], 1)
+
+        state["next"] = slot + interval
+
+        _write_state(path, state)
+
+    return max(slot - now, 0)
+
+
+def update(key: str, response: "Response"):
+    """
+    Updates the state of a rate limit from the headers of an API response.
+
+    :param key: The key of the rate limit.
+    :type key: str
+    :param response: The response to read the rate limit headers from.
+    :type response: requests.Response
+    """
+    if not enabled():
+        return
+
+    reported = _parse_headers(response)
+
+    if reported is None:
+        return
+
+    path = _state_path(key)
+
+    if path is None:
+        return
+
+    with _locked(path):
+        state = _read_state(path)
+
+        if state is None or reported["reset"] > state["reset"] + 1:
+            # This is the first report of a new window
+            state = state or {"next": 0}
+            state.update(reported)
+        else:
+            # Responses may arrive out of order, so keep the lowest
+            # remaining count reported within the same window
+            state["limit"] = reported["limit"]
+            state["remaining"] = min(state["remaining"], reported["remaining"])
+            state["reset"] = max(state["reset"], reported["reset"])
+
+        state["window"] = max(state.get("window", 1), reported["window"])
+
+        _write_state(path, state)
+
+
+def _parse_headers(response: "Response") -> Optional[Dict[str, float]]:
+    """
+    Returns the rate limit state reported by a response, if any.
+    """
+    headers = response.headers
+    now = time.time()
+
+    try:
+        limit = int(headers["X-RateLimit-Limit"])
+        remaining = int(headers["X-RateLimit-Remaining"])
+        reset = float(headers["X-RateLimit-Reset"])
+    except (KeyError, TypeError, ValueError):
+        limit, remaining, reset = None, None, None
+
+    if response.status_code == 429:
+        # Every request will be rejected until the limit resets
+        retry_after = headers.get("Retry-After")
+        if isinstance(retry_after, str) and retry_after.isdigit():
+            reset = now + int(retry_after)
+
+        if reset is None:
+            return None
+
+        remaining = 0
+        limit = limit or 1
+
+    if limit is None or limit < 1:
+        return None
+
+    if reset < _RELATIVE_RESET_MAX:
+        reset += now
+
+    return {
+        "limit": limit,
+        "remaining": remaining,
+        "reset": reset,
+        "window": max(reset - now, 1),
+    }
+
+
+def _is_current(state: Optional[Dict[str, Any]]) -> bool:
+    """
+    Returns whether a rate limit's state describes the current window.
+    """
+    return state is not None and time.time() < state["reset"]
+
+
+def _state_path(key: str, create: bool = True) -> Optional[str]:
+    """
+    Returns the path to the state file of a rate limit, or None if the
+    cache directory could not be created.
+    """
+    try:
+        return os.path.join(
+            get_cache_dir(RATE_LIMIT_DIR, create=create), f"{key}.json"
+        )
+    except OSError as e:
+        logger.debug("Rate limit state is unavailable: %s", e)
+        return None
+
+
+@contextlib.contextmanager
+def _locked(path: str) -> Iterator[None]:
+    """
+    Holds an exclusive lock on a rate limit's state file.
+
+    The lock is advisory and is shared with other CLI processes through
+    a lock file next to the state file.
+    """
+    with _thread_lock, open(f"{path}.lock", "a+b") as lock_file:
+        _lock_file(lock_file)
+
+        try:
+            yield
+        finally:
+            _unlock_file(lock_file)
+
+
+def _read_state(path: Optional[str]) -> Optional[Dict[str, Any]]:
+    """
+    Reads the state of a rate limit, if present.
+    """
+    if path is None or not os.path.exists(path):
+        return None
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logger.debug("Failed to read rate limit state: %s", e)
+        return None
+
+
+def _write_state(path: str, state: Dict[str, Any]):
+    """
+    Atomically writes the state of a rate limit.
+    """
+    try:
+        with open(f"{path}.tmp", "w", encoding="utf-8") as f:
+            json.dump(state, f)
+
+        os.replace(f"{path}.tmp", path)
+    except OSError as e:
+        logger.debug("Failed to write rate limit state: %s", e)
+
+
+try:
+    import fcntl
+
+    def _lock_file(f):
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+
+    def _unlock_file(f):
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+except ImportError:  # Windows
+    import msvcrt
+
+    def _lock_file(f):
+        f.seek(0)
+
+        # LK_LOCK only retries for 10 seconds, so keep trying
+        while True:
+            try:
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                continue
+
+    def _unlock_file(f):
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
@@ -0,0 +1,391 @@
+"""
+An opt-in local cache for the responses of GET requests.
+
+Responses are cached by the user's token, the request URL (including the
+page) and the X-Filter header, and are reused until their TTL expires.
+Expired responses are revalidated using conditional requests (ETag and
+Last-Modified) when the API provided validators for them.
+
+Cached responses are grouped by the resource collection they belong to
+(e.g. ``linode/instances``), so a successful POST, PUT or DELETE on a
+resource invalidates every cached response for its collection.
+"""
+
+import contextlib
+import hashlib
+import io
+import json
+import os
+import shutil
+import threading
+import time
+from logging import getLogger
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from linodecli.helpers import get_cache_dir
+
+if TYPE_CHECKING:
+    from requests import Response
+
+logger = getLogger(__name__)
+
+# Serializes updates to the size file by threads of this process
+_size_lock = threading.Lock()
+
+RESPONSE_CACHE_DIR = "responses"
+
+# The maximum total size of all cached responses, in bytes
+MAX_RESPONSE_CACHE_SIZE = 32 * 1024 * 1024
+
+# The file holding the running total size of all cached responses, so the
+# cache only needs to be walked when it grows past MAX_RESPONSE_CACHE_SIZE
+SIZE_FILE = ".size"
+
+# The number of static path segments used to group cached responses,
+# e.g. /{apiVersion}/linode/instances/{linodeId} -> linode/instances
+RESOURCE_SEGMENTS = 2
+
+# Bump this whenever the format of cached responses changes
+CACHE_VERSION = 1
+
+
+class CachedResponse:
+    """
+    A response loaded from the response cache.
+    """
+
+    __slots__ = ("path", "entry")
+
+    def __init__(self, path: str, entry: Dict[str, Any]):
+        self.path = path
+        self.entry = entry
+
+    def is_fresh(self, ttl: int) -> bool:
+        """
+        Returns whether this response was stored less than ttl seconds ago.
+
+        :param ttl: The maximum age of a fresh response, in seconds.
+        :type ttl: int
+
+        :returns: Whether this response can be used without revalidation.
+        :rtype: bool
+        """
+        return time.time() - self.entry["stored_at"] < ttl
+
+    def get_validators(self) -> Dict[str, str]:
+        """
+        Returns the headers used to revalidate this response, if any.
+
+        :returns: The conditional request headers for this response.
+        :rtype: Dict[str, str]
+        """
+        headers = {}
+
+        if self.entry.get("etag"):
+            headers["If-None-Match"] = self.entry["etag"]
+        if self.entry.get("last_modified"):
+            headers["If-Modified-Since"] = self.entry["last_modified"]
+
+        return headers
+
+    def revalidated(self) -> "Response":
+        """
+        Marks this response as fresh after the API confirmed it is unchanged
+        and returns it.
+
+        :returns: The cached response.
+        :rtype: requests.Response
+        """
+        self.entry["stored_at"] = time.time()
+        _write_entry(self.path, self.entry)
+
+        return self.to_response()
+
+    def to_response(self) -> "Response":
+        """
+        Returns this cached response as a requests Response.
+
+        :returns: The cached response.
+        :rtype: requests.Response
+        """
+        # pylint: disable-next=import-outside-toplevel
+        from requests import Response
+
+        # pylint: disable-next=import-outside-toplevel
+        from requests.structures import CaseInsensitiveDict
+
+        result = Response()
+        result.status_code = self.entry["status_code"]
+        result.reason = self.entry["reason"]
+        result.url = self.entry["url"]
+        result.headers = CaseInsensitiveDict(self.entry["headers"])
+        result.encoding = "utf-8"
+        result.raw = io.BytesIO(self.entry["body"].encode("utf-8"))
+
+        return result
+
+
+def get_resource(url_path: str) -> str:
+    """
+    Returns the resource collection that responses for the given operation
+    URL path belong to.
+
+    :param url_path: The URL path template of an operation.
+    :type url_path: str
+
+    :returns: The resource collection, e.g. ``linode/instances``.
+    :rtype: str
+    """
+    segments = []
+
+    for segment in url_path.strip("/").split("/"):
+        if segment == "{apiVersion}":
+            continue
+
+        if segment.startswith("{") or len(segments) >= RESOURCE_SEGMENTS:
+            break
+
+        segments.append(segment)
+
+    return "/".join(segments)
+
+
+def get_key(token: str, url: str, filter_header: Optional[str]) -> str:
+    """
+    Returns the cache key for a GET request.
+
+    :param token: The token the request is made with.
+    :type token: str
+    :param url: The URL of the request, including the page.
+    :type url: str
+    :param filter_header: The X-Filter header of the request, if any.
+    :type filter_header: Optional[str]
+
+    :returns: The cache key for the request.
+    :rtype: str
+    """
+    return hashlib.sha256(
+        json.dumps([CACHE_VERSION, token, url, filter_header]).encode()
+    ).hexdigest()
+
+
+def load(resource: str, key: str) -> Optional[CachedResponse]:
+    """
+    Returns the cached response for the given key, if present.
+
+    :param resource: The resource collection of the request.
+    :type resource: str
+    :param key: The cache key of the request.
+    :type key: str
+
+    :returns: The cached response, or None if it is not cached.
+    :rtype: Optional[CachedResponse]
+    """
+    path = _entry_path(resource, key)
+
+    if path is None or not os.path.exists(path):
+        return None
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            entry = json.load(f)
+
+        # Mark this entry as recently used
+        os.utime(path)
+    except (OSError, ValueError) as e:
+        logger.debug("Failed to load cached response: %s", e)
+        return None
+
+    return CachedResponse(path, entry)
+
+
+def store(resource: str, key: str, response: "Response"):
+    """
+    Stores a successful response in the cache.
+
+    :param resource: The resource collection of the request.
+    :type resource: str
+    :param key: The cache key of the request.
+    :type key: str
+    :param response: The response to store.
+    :type response: requests.Response
+    """
+    path = _entry_path(resource, key)
+
+    if path is None:
+        return
+
+    try:
+        body = response.content.decode("utf-8")
+    except UnicodeDecodeError:
+        return
+
+    previous_size = _get_file_size(path)
+
+    _write_entry(
+        path,
+        {
+            "url": response.url,
+            "status_code": response.status_code,
+            "reason": response.reason,
+            "headers": dict(response.headers),
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "stored_at": time.time(),
+            "body": body,
+        },
+    )
+
+    total_size = _add_size(_get_file_size(path) - previous_size)
+
+    if total_size is None or total_size > MAX_RESPONSE_CACHE_SIZE:
+        _prune()
+
+
+def invalidate(resource: str):
+    """
+    Removes all cached responses for the given resource collection,
+    including those of any resources nested under it.
+
+    :param resource: The resource collection to invalidate.
+    :type resource: str
+    """
+    # Nothing needs to be invalidated if nothing was ever cached, so this
+    # never creates the cache directory
+    cache_dir = get_cache_dir(RESPONSE_CACHE_DIR, create=False)
+    path = os.path.join(cache_dir, resource)
+
+    try:
+        if os.path.isdir(path):
+            logger.debug("Invalidating cached responses for %s", resource)
+            shutil.rmtree(path)
+
+            # The running total is recalculated on the next store
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(os.path.join(cache_dir, SIZE_FILE))
+    except OSError as e:
+        logger.debug("Failed to invalidate cached responses: %s", e)
+
+
+def _entry_path(resource: str, key: str) -> Optional[str]:
+    """
+    Returns the path to a cached response, or None if the
+    cache directory could not be created.
+    """
+    try:
+        return os.path.join(
+            get_cache_dir(RESPONSE_CACHE_DIR, resource), f"{key}.json"
+        )
+    except OSError as e:
+        logger.debug("Response cache is unavailable: %s", e)
+        return None
+
+
+def _write_entry(path: str, entry: Dict[str, Any]):
+    """
+    Atomically writes a cached response.  Responses may contain sensitive
+    account data, so they are only readable by the current user.
+    """
+    # Each writer uses its own temporary file, since the same response
+    # may be stored by several threads or processes at once
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.debug("Failed to write to response cache: %s", e)
+
+
+def _size_path() -> str:
+    """
+    Returns the path to the file holding the total size of the cache.
+    """
+    return os.path.join(get_cache_dir(RESPONSE_CACHE_DIR), SIZE_FILE)
+
+
+def _get_file_size(path: str) -> int:
+    """
+    Returns the size of a file, or 0 if it doesn't exist.
+    """
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return 0
+
+
+def _write_size(size: int):
+    """
+    Atomically writes the total size of the cache.
+    """
+    path = _size_path()
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(str(size))
+
+    os.replace(tmp_path, path)
+
+
+def _add_size(delta: int) -> Optional[int]:
+    """
+    Adds delta bytes to the running total size of the cache and returns the
+    new total, or None if the total isn't known.
+
+    Concurrent processes may lose each other's updates; the total is only
+    an estimate, and is recalculated whenever the cache is pruned.
+    """
+    try:
+        with _size_lock:
+            with open(_size_path(), "r", encoding="utf-8") as f:
+                total_size = int(f.read()) + delta
+
+            _write_size(total_size)
+    except (OSError, ValueError):
+        return None
+
+    return total_size
+
+
+def _prune():
+    """
+    Removes the least recently used responses until the cache
+    is no larger than MAX_RESPONSE_CACHE_SIZE, then records its size.
+    """
+    try:
+        entries = []
+
+        for root, _, files in os.walk(get_cache_dir(RESPONSE_CACHE_DIR)):
+            for name in files:
+                if not name.endswith(".json"):
+                    continue
+
+                path = os.path.join(root, name)
+
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    # Replaced or removed by another writer
+                    continue
+
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        total_size = sum(size for _, size, _ in entries)
+
+        for _, size, path in sorted(entries):
+            if total_size <= MAX_RESPONSE_CACHE_SIZE:
+                break
+
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(path)
+
+            total_size -= size
+
+        with _size_lock:
+            _write_size(total_size)
+    except OSError as e:
+        logger.debug("Failed to prune response cache: %s", e)
@@ -0,0 +1,211 @@
+"""
+The policy used to retry API requests that fail with transient errors.
+"""
+
+import random
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, FrozenSet, Mapping, Optional
+
+import requests
+
+if TYPE_CHECKING:
+    from linodecli.configuration import CLIConfig
+
+# Response statuses that are retried by default
+DEFAULT_RETRY_STATUSES = frozenset({408, 429, 502, 503, 504})
+
+# Response statuses for which the API has not processed the request,
+# so it is always safe to retry it
+UNPROCESSED_STATUSES = frozenset({408, 429})
+
+# Methods that have the same effect however many times they are sent
+IDEMPOTENT_METHODS = frozenset({"get", "head", "options", "put", "delete"})
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Determines whether and when a failed API request should be retried.
+
+    Retries are delayed using exponential backoff, starting at base_delay
+    and doubling on each attempt up to max_delay.  With jitter, a random
+    delay between zero and that value is used instead, so that many clients
+    retrying at once don't all retry at the same time.  If the API gave a
+    Retry-After header, it is always respected.
+
+    Requests that may have been processed by the API (e.g. a POST that
+    failed with a 502 or a connection reset) are only retried if they are
+    idempotent, unless retry_non_idempotent is set.
+    """
+
+    max_attempts: int = 4
+    base_delay: float = 1.0
+    max_delay: float = 30.0
+    jitter: bool = True
+    retry_statuses: FrozenSet[int] = DEFAULT_RETRY_STATUSES
+    retry_non_idempotent: bool = False
+
+    def __post_init__(self):
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+        if self.base_delay < 0 or self.max_delay < 0:
+            raise ValueError("retry delays must not be negative")
+
+    @classmethod
+    def from_config(
+        cls, config: "CLIConfig", **overrides: Any
+    ) -> "RetryPolicy":
+        """
+        Returns the retry policy configured for the current user, using the
+        retry_max_attempts, retry_base_delay, retry_max_delay, retry_jitter
+        and retry_statuses config values where present.
+
+        :param config: The CLI config to read the policy from.
+        :type config: CLIConfig
+        :param overrides: Policy fields that override the config if not None.
+        :type overrides: Any
+
+        :returns: The configured retry policy.
+        :rtype: RetryPolicy
+
+        :raises ValueError: If a configured value is invalid.
+        """
+        values = {}
+
+        for key, value_type in (
+            ("max_attempts", int),
+            ("base_delay", float),
+            ("max_delay", float),
+        ):
+            value = config.get_value(f"retry_{key}")
+            if value is None:
+                continue
+
+            try:
+                values[key] = value_type(value)
+            except ValueError as e:
+                raise ValueError(f"invalid retry_{key} {value}") from e
+
+        if config.get_value("retry_jitter") is not None:
+            values["jitter"] = config.get_bool("retry_jitter")
+
+        statuses = config.get_value("retry_statuses")
+        if statuses is not None:
+            try:
+                values["retry_statuses"] = frozenset(
+                    int(v) for v in statuses.split(",") if v.strip()
+                )
+            except ValueError as e:
+                raise ValueError(f"invalid retry_statuses {statuses}") from e
+
+        values.update({k: v for k, v in overrides.items() if v is not None})
+
+        return cls(**values)
+
+    def should_retry(
+        self,
+        method: str,
+        attempt: int,
+        response: Optional[requests.Response] = None,
+        error: Optional[Exception] = None,
+    ) -> bool:
+        """
+        Returns whether a request should be retried after it failed with
+        the given response or error.
+
+        :param method: The HTTP method of the request, e.g. "get".
+        :type method: str
+        :param attempt: The number of attempts made so far.
+        :type attempt: int
+        :param response: The response to the request, if one was received.
+        :type response: Optional[requests.Response]
+        :param error: The error raised when sending the request, if any.
+        :type error: Optional[Exception]
+
+        :returns: Whether the request should be retried.
+        :rtype: bool
+        """
+        if attempt >= self.max_attempts:
+            return False
+
+        idempotent = (
+            self.retry_non_idempotent or method.lower() in IDEMPOTENT_METHODS
+        )
+
+        if error is not None:
+            # The request was never sent if the connection wasn't established
+            if isinstance(error, requests.ConnectTimeout):
+                return True
+
+            return idempotent and isinstance(
+                error, (requests.ConnectionError, requests.Timeout)
+            )
+
+        if response is None:
+            return False
+
+        if _is_gateway_error(response):
+            return True
+
+        if response.status_code not in self.retry_statuses:
+            return False
+
+        return idempotent or response.status_code in UNPROCESSED_STATUSES
+
+    def get_delay(
+        self, attempt: int, response: Optional[requests.Response] = None
+    ) -> float:
+        """
+        Returns the number of seconds to wait before retrying a request.
+
+        :param attempt: The number of attempts made so far.
+        :type attempt: int
+        :param response: The response to the last attempt, if any.
+        :type response: Optional[requests.Response]
+
+        :returns: The number of seconds to wait.
+        :rtype: float
+        """
+        if response is not None:
+            retry_after = get_retry_after(response.headers)
+            if retry_after is not None:
+                return retry_after
+
+        delay = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+
+        if self.jitter:
+            delay = random.uniform(0, delay)
+
+        return delay
+
+
+def get_retry_after(headers: Mapping[str, str]) -> Optional[int]:
+    """
+    Extracts the "Retry-After" value from the response headers and returns it
+    as an integer representing the number of seconds to wait before retrying.
+
+    :param headers: The HTTP response headers.
+    :type headers: Mapping[str, str]
+
+    :returns: The number of seconds to wait, or None if not specified.
+    :rtype: Optional[int]
+    """
+    retry_str = headers.get("Retry-After", "")
+    if not isinstance(retry_str, str) or not retry_str.isdigit():
+        return None
+
+    return int(retry_str)
+
+
+def _is_gateway_error(response: requests.Response) -> bool:
+    """
+    Returns whether the response is an error page from the API's gateway,
+    rather than a response from the API itself.
+    """
+    return bool(
+        response.headers
+        and response.status_code == 400
+        and response.headers.get("Server") == "nginx"
+        and response.headers.get("Content-Type") == "text/html"
+    )
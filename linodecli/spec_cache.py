@@ -0,0 +1,200 @@
+"""
+A local cache for OpenAPI specs used when baking.
+
+Remote specs are cached by URL and revalidated using conditional requests
+(ETag and Last-Modified), so an unchanged spec is never downloaded twice.
+
+Parsed and normalized specs are cached by a hash of their content, so an
+unchanged spec is never parsed twice regardless of where it was loaded from.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+from logging import getLogger
+from typing import Any, Callable, Dict, Optional
+
+from linodecli.helpers import get_cache_dir
+from linodecli.version import __version__
+
+logger = getLogger(__name__)
+
+SPEC_CACHE_DIR = "specs"
+
+# The maximum number of parsed specs to keep in the cache
+MAX_PARSED_SPECS = 4
+
+# Bump this whenever the format of cached specs changes
+CACHE_VERSION = 1
+
+
+def fetch_spec(url: str) -> bytes:
+    """
+    Returns the content of the remote spec at the given URL, revalidating
+    any cached copy of it rather than downloading it again.
+
+    :param url: The URL of the spec.
+    :type url: str
+
+    :returns: The content of the spec.
+    :rtype: bytes
+    """
+    # pylint: disable-next=import-outside-toplevel
+    import requests
+
+    key = _url_key(url)
+    meta_path = _cache_path(f"{key}.json")
+    content_path = _cache_path(f"{key}.spec")
+
+    meta = _read_meta(meta_path)
+    cached = meta is not None and os.path.exists(content_path)
+
+    headers = {}
+
+    if cached:
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    resp = requests.get(url, headers=headers, timeout=120)
+
+    if resp.status_code == 304 and cached:
+        logger.debug("Using cached spec for %s", url)
+
+        with open(content_path, "rb") as f:
+            return f.read()
+
+    if resp.status_code != 200:
+        raise RuntimeError(f"Failed to GET {url}")
+
+    content = resp.content
+
+    _write_cache_file(content_path, content)
+    _write_cache_file(
+        meta_path,
+        json.dumps(
+            {
+                "url": url,
+                "etag": resp.headers.get("ETag"),
+                "last_modified": resp.headers.get("Last-Modified"),
+            }
+        ).encode(),
+    )
+
+    return content
+
+
+def load_parsed_spec(
+    content: bytes, parse: Callable[[bytes], Dict[str, Any]]
+) -> Dict[str, Any]:
+    """
+    Returns the parsed spec for the given content, only calling the given
+    parse function if the content has not been parsed before.
+
+    :param content: The content of the spec.
+    :type content: bytes
+    :param parse: A function that parses and normalizes the content of a spec.
+    :type parse: Callable[[bytes], Dict[str, Any]]
+
+    :returns: The parsed spec.
+    :rtype: Dict[str, Any]
+    """
+    digest = hashlib.sha256(
+        f"{CACHE_VERSION}:{__version__}:".encode() + content
+    ).hexdigest()
+    parsed_path = _cache_path(f"{digest}.pickle")
+
+    if parsed_path is not None and os.path.exists(parsed_path):
+        try:
+            with open(parsed_path, "rb") as f:
+                result = pickle.load(f)
+
+            # Mark this entry as recently used
+            os.utime(parsed_path)
+
+            logger.debug("Using cached parsed spec %s", digest)
+            return result
+        except Exception as e:
+            logger.debug("Failed to load cached parsed spec: %s", e)
+
+    result = parse(content)
+
+    _write_cache_file(
+        parsed_path, pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+    )
+    _prune_parsed_specs()
+
+    return result
+
+
+def _url_key(url: str) -> str:
+    """
+    Returns the cache key for the given spec URL.
+    """
+    return hashlib.sha256(url.encode()).hexdigest()
+
+
+def _cache_path(name: str) -> Optional[str]:
+    """
+    Returns the path to the given file in the spec cache, or None if
+    the cache directory could not be created.
+    """
+    try:
+        return os.path.join(get_cache_dir(SPEC_CACHE_DIR), name)
+    except OSError as e:
+        logger.debug("Spec cache is unavailable: %s", e)
+        return None
+
+
+def _read_meta(path: Optional[str]) -> Optional[Dict[str, Any]]:
+    """
+    Reads the metadata for a cached remote spec, if present.
+    """
+    if path is None or not os.path.exists(path):
+        return None
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logger.debug("Failed to read spec cache metadata: %s", e)
+        return None
+
+
+def _write_cache_file(path: Optional[str], content: bytes):
+    """
+    Atomically writes the given content to a file in the spec cache.
+    Failures are logged rather than raised, since the cache is optional.
+    """
+    if path is None:
+        return
+
+    try:
+        with open(f"{path}.tmp", "wb") as f:
+            f.write(content)
+
+        os.replace(f"{path}.tmp", path)
+    except OSError as e:
+        logger.debug("Failed to write to spec cache: %s", e)
+
+
+def _prune_parsed_specs():
+    """
+    Removes all but the most recently used parsed specs from the cache.
+    """
+    try:
+        cache_dir = get_cache_dir(SPEC_CACHE_DIR)
+        entries = [
+            os.path.join(cache_dir, name)
+            for name in os.listdir(cache_dir)
+            if name.endswith(".pickle")
+        ]
+
+        entries.sort(key=os.path.getmtime, reverse=True)
+
+        for path in entries[MAX_PARSED_SPECS:]:
+            os.remove(path)
+    except OSError as e:
+        logger.debug("Failed to prune spec cache: %s", e)
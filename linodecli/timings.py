@@ -0,0 +1,273 @@
+"""
+Records how long each phase of a CLI invocation takes, for --timings.
+
+Phases are timed with the phase(...) context manager or the timed(...)
+decorator, and do nothing unless timings have been enabled.  Phases may be
+nested; each phase is recorded without the time spent in the phases nested
+within it, so the phases recorded on a thread add up to its total run time.
+
+Phases recorded while fetching a page of results are also attributed to
+that page, so the time spent on each page of --all-rows can be compared.
+"""
+
+import atexit
+import contextlib
+import functools
+import sys
+import threading
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+)
+
+if TYPE_CHECKING:
+    from requests.adapters import HTTPAdapter
+
+ENV_TIMINGS = "LINODE_CLI_TIMINGS"
+
+_enabled = False
+_start = 0.0
+_lock = threading.Lock()
+
+# The (phase, page, seconds) of each phase recorded
+_records: List[Tuple[str, Optional[int], float]] = []
+
+# The stack of active phases and the current page for each thread
+_local = threading.local()
+
+
+def enable():
+    """
+    Starts recording timings, and prints a summary of them to stderr
+    when the CLI exits.
+    """
+    global _enabled, _start  # pylint: disable=global-statement
+
+    if _enabled:
+        return
+
+    _enabled = True
+    _start = time.perf_counter()
+
+    atexit.register(print_summary)
+
+
+def enabled() -> bool:
+    """
+    Returns whether timings are being recorded.
+
+    :returns: Whether timings are enabled.
+    :rtype: bool
+    """
+    return _enabled
+
+
+@contextlib.contextmanager
+def phase(name: str) -> Iterator[None]:
+    """
+    Records the time spent in the wrapped block as the given phase.
+
+    :param name: The name of the phase, e.g. "spec load".
+    :type name: str
+    """
+    if not _enabled:
+        yield
+        return
+
+    stack = _local.__dict__.setdefault("stack", [])
+
+    # The time spent in nested phases is accumulated here
+    stack.append(0.0)
+    start = time.perf_counter()
+
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        nested = stack.pop()
+
+        if stack:
+            stack[-1] += elapsed
+
+        record(name, elapsed - nested)
+
+
+def timed(name: str) -> Callable:
+    """
+    A decorator that records each call to the decorated function as
+    the given phase.
+
+    :param name: The name of the phase.
+    :type name: str
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with phase(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+@contextlib.contextmanager
+def page(number: int) -> Iterator[None]:
+    """
+    Attributes the phases recorded in the wrapped block to the given page
+    of results.
+
+    :param number: The page number.
+    :type number: int
+    """
+    previous = getattr(_local, "page", None)
+    _local.page = number
+
+    try:
+        yield
+    finally:
+        _local.page = previous
+
+
+def record(name: str, seconds: float):
+    """
+    Records the time spent in a phase.
+
+    :param name: The name of the phase.
+    :type name: str
+    :param seconds: The number of seconds spent in the phase.
+    :type seconds: float
+    """
+    if not _enabled:
+        return
+
+    with _lock:
+        _records.append((name, getattr(_local, "page", None), seconds))
+
+
+def print_summary(file: Optional[TextIO] = None):
+    """
+    Prints the total time spent in each phase, and the time spent in each
+    phase for every page of results.
+
+    :param file: The file to print to.  Defaults to stderr.
+    :type file: Optional[TextIO]
+    """
+    file = file or sys.stderr
+
+    with _lock:
+        records = list(_records)
+
+    totals: Dict[str, List[float]] = {}
+    pages: Dict[int, Dict[str, float]] = {}
+
+    for name, number, seconds in records:
+        total = totals.setdefault(name, [0.0, 0])
+        total[0] += seconds
+        total[1] += 1
+
+        if number is not None:
+            page_phases = pages.setdefault(number, {})
+            page_phases[name] = page_phases.get(name, 0.0) + seconds
+
+    width = max((len(name) for name in totals), default=0)
+    width = max(width, len("total"))
+
+    print("Timings:", file=file)
+
+    for name, (seconds, count) in totals.items():
+        calls = f" ({count} times)" if count > 1 else ""
+        print(f"  {name:<{width}}  {_format(seconds)}{calls}", file=file)
+
+    print(
+        f"  {'total':<{width}}  {_format(time.perf_counter() - _start)}",
+        file=file,
+    )
+
+    if not pages:
+        return
+
+    print("Pages:", file=file)
+
+    for number, page_phases in sorted(pages.items()):
+        print(
+            f"  {number}: "
+            + ", ".join(
+                f"{name} {_format(seconds).strip()}"
+                for name, seconds in page_phases.items()
+            ),
+            file=file,
+        )
+
+
+def instrument_adapter(adapter: "HTTPAdapter"):
+    """
+    Records the time spent establishing connections and performing TLS
+    handshakes for requests sent through the given adapter.
+
+    :param adapter: The adapter to instrument.
+    :type adapter: requests.adapters.HTTPAdapter
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from urllib3.connection import HTTPConnection, HTTPSConnection
+
+    # pylint: disable-next=import-outside-toplevel
+    from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+    class TimedHTTPConnection(HTTPConnection):
+        """
+        An HTTP connection that records the time spent connecting.
+        """
+
+        @timed("connect")
+        def _new_conn(self):
+            return super()._new_conn()
+
+    class TimedHTTPSConnection(HTTPSConnection):
+        """
+        An HTTPS connection that records the time spent connecting and
+        performing the TLS handshake.
+        """
+
+        @timed("connect")
+        def _new_conn(self):
+            return super()._new_conn()  # pylint: disable=no-member
+
+        @timed("TLS handshake")
+        def connect(self):
+            return super().connect()  # pylint: disable=no-member
+
+    class TimedHTTPConnectionPool(HTTPConnectionPool):
+        """
+        An HTTP connection pool using TimedHTTPConnections.
+        """
+
+        ConnectionCls = TimedHTTPConnection
+
+    class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+        """
+        An HTTPS connection pool using TimedHTTPSConnections.
+        """
+
+        ConnectionCls = TimedHTTPSConnection
+
+    adapter.poolmanager.pool_classes_by_scheme = {
+        "http": TimedHTTPConnectionPool,
+        "https": TimedHTTPSConnectionPool,
+    }
+
+
+def _format(seconds: float) -> str:
+    """
+    Formats a number of seconds as milliseconds.
+    """
+    return f"{seconds * 1000:10.1f} ms"
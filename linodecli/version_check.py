@@ -0,0 +1,158 @@
+"""
+Checks PyPI for the latest release of the CLI without delaying commands.
+
+The latest version is cached on disk and only looked up again once the
+cached value is older than VERSION_CHECK_TTL.  Lookups happen at most once
+per process, in a background thread, so a slow or unreachable PyPI never
+delays command output; a stale cached version is used in the meantime.
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+from logging import getLogger
+from typing import Any, Dict, Optional
+
+import requests
+
+from linodecli.helpers import get_cache_dir
+
+logger = getLogger(__name__)
+
+PYPI_URL = "https://pypi.org/pypi/linode-cli/json"
+
+VERSION_CHECK_FILE = "latest-version.json"
+
+# The number of seconds the latest version is cached for
+VERSION_CHECK_TTL = 24 * 60 * 60
+
+# The number of seconds to wait for PyPI to respond
+VERSION_CHECK_TIMEOUT = 1
+
+_lock = threading.Lock()
+_cached: Optional[Dict[str, Any]] = None
+_thread: Optional[threading.Thread] = None
+
+
+def get_latest_version() -> Optional[str]:
+    """
+    Returns the latest version of the CLI published to PyPI, as last seen.
+
+    If the cached version is missing or expired, it is refreshed in the
+    background for future invocations; this never blocks on the network.
+
+    :returns: The latest known version, or None if it is not yet known.
+    :rtype: Optional[str]
+    """
+    global _cached, _thread  # pylint: disable=global-statement
+
+    with _lock:
+        if _cached is None:
+            _cached = _read_cache() or {}
+
+        if _thread is None and not _is_fresh(_cached):
+            _thread = threading.Thread(
+                target=_refresh, name="linode-cli-version-check", daemon=True
+            )
+            _thread.start()
+            atexit.register(wait)
+
+        return _cached.get("version")
+
+
+def wait(timeout: Optional[float] = VERSION_CHECK_TIMEOUT):
+    """
+    Waits for a background refresh of the latest version to finish, so
+    its result is cached for the next invocation.
+
+    :param timeout: The maximum number of seconds to wait.
+    :type timeout: Optional[float]
+    """
+    thread = _thread
+
+    if thread is not None:
+        thread.join(timeout)
+
+
+def _refresh():
+    """
+    Looks up the latest version from PyPI and caches it.
+    """
+    # Record the attempt even if it fails, so an unreachable PyPI is
+    # only retried once the TTL expires
+    result = {"checked": time.time(), "version": (_cached or {}).get("version")}
+
+    try:
+        response = requests.get(PYPI_URL, timeout=VERSION_CHECK_TIMEOUT)
+
+        if response.status_code == 200:
+            result["version"] = response.json()["info"]["version"]
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        logger.debug("Failed to check PyPI for a newer version: %s", e)
+
+    _write_cache(result)
+
+
+def _is_fresh(cached: Dict[str, Any]) -> bool:
+    """
+    Returns whether a cached lookup is recent enough to be reused.
+    """
+    checked = cached.get("checked")
+
+    return (
+        isinstance(checked, (int, float))
+        and 0 <= time.time() - checked < VERSION_CHECK_TTL
+    )
+
+
+def _cache_path() -> Optional[str]:
+    """
+    Returns the path to the cached latest version, or None if the cache
+    directory could not be created.
+    """
+    try:
+        return os.path.join(get_cache_dir(), VERSION_CHECK_FILE)
+    except OSError as e:
+        logger.debug("Version check cache is unavailable: %s", e)
+        return None
+
+
+def _read_cache() -> Optional[Dict[str, Any]]:
+    """
+    Reads the cached latest version, if present.
+    """
+    path = _cache_path()
+
+    if path is None or not os.path.exists(path):
+        return None
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            result = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.debug("Failed to read cached latest version: %s", e)
+        return None
+
+    return result if isinstance(result, dict) else None
+
+
+def _write_cache(result: Dict[str, Any]):
+    """
+    Atomically writes the cached latest version.
+    """
+    path = _cache_path()
+
+    if path is None:
+        return
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(result, f)
+
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.debug("Failed to cache latest version: %s", e)
@@ -0,0 +1,101 @@
+"""
+Benchmarks full, parallel and incremental bakes of a generated spec.
+
+Usage:
+    python -m tests.benchmarks.bake [--commands N] [--runs N] [--jobs N]
+"""
+
+import argparse
+import copy
+import json
+import os
+import tempfile
+import time
+from unittest import mock
+
+from linodecli.cli import CLI
+from tests.benchmarks.spec import generate_spec
+
+
+def _bake(spec_path: str, data_path: str, jobs: int = 1) -> float:
+    with (
+        mock.patch.object(CLI, "_get_data_file", lambda self: data_path),
+        mock.patch.object(CLI, "load_baked"),
+    ):
+        cli = CLI("0.0.0", "http://localhost", skip_config=True)
+
+        start = time.perf_counter()
+        cli.bake(spec_path, jobs=jobs)
+        return time.perf_counter() - start
+
+
+def _write_spec(spec_path: str, spec):
+    with open(spec_path, "w", encoding="utf-8") as f:
+        json.dump(spec, f)
+
+
+def main():
+    """
+    Runs the benchmark and prints the results.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--commands", type=int, default=200)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--jobs", type=int, default=0)
+    args = parser.parse_args()
+
+    spec = generate_spec(args.commands)
+
+    # A spec with a single changed path
+    changed_spec = copy.deepcopy(spec)
+    changed_path = next(iter(changed_spec["paths"].values()))
+    changed_path["get"]["summary"] = "List some resources"
+
+    results = {
+        "full": [],
+        f"parallel (jobs={args.jobs})": [],
+        "unchanged": [],
+        "one path changed": [],
+    }
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        spec_path = os.path.join(tmp_dir, "spec.json")
+        data_path = os.path.join(tmp_dir, "data-3")
+
+        for run in range(args.runs):
+            if os.path.exists(data_path):
+                os.remove(data_path)
+
+            # Full bakes always start with an empty spec cache
+            os.environ["XDG_CACHE_HOME"] = os.path.join(
+                tmp_dir, f"cache-{run}-parallel"
+            )
+
+            _write_spec(spec_path, spec)
+            results[f"parallel (jobs={args.jobs})"].append(
+                _bake(spec_path, data_path, jobs=args.jobs)
+            )
+
+            with open(data_path, "rb") as f:
+                parallel_bake = f.read()
+
+            os.remove(data_path)
+            os.environ["XDG_CACHE_HOME"] = os.path.join(tmp_dir, f"cache-{run}")
+            results["full"].append(_bake(spec_path, data_path))
+
+            with open(data_path, "rb") as f:
+                assert f.read() == parallel_bake, "parallel bake differs"
+
+            results["unchanged"].append(_bake(spec_path, data_path))
+
+            _write_spec(spec_path, changed_spec)
+            results["one path changed"].append(_bake(spec_path, data_path))
+
+    print(f"{'commands:':<32}{args.commands}")
+
+    for name, times in results.items():
+        print(f"{name + ' bake:':<32}{min(times) * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Benchmarks the size, load time and memory footprint of baked operations.
+
+Usage:
+    python -m tests.benchmarks.baked_ops [--commands N] [--runs N]
+"""
+
+import argparse
+import gc
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from unittest import mock
+
+from linodecli.baked.store import load_baked_ops
+from linodecli.cli import CLI
+from tests.benchmarks.spec import generate_spec
+
+
+@contextmanager
+def _baked_spec(num_commands: int):
+    """
+    Bakes a generated spec into a temporary directory and yields the
+    path of the resulting data file.
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        spec_path = os.path.join(tmp_dir, "spec.json")
+        data_path = os.path.join(tmp_dir, "data-3")
+
+        with open(spec_path, "w", encoding="utf-8") as f:
+            json.dump(generate_spec(num_commands), f)
+
+        with (
+            mock.patch.object(CLI, "_get_data_file", lambda self: data_path),
+            mock.patch.object(CLI, "load_baked"),
+        ):
+            cli = CLI("0.0.0", "http://localhost", skip_config=True)
+            cli.bake(spec_path)
+
+        yield data_path
+
+
+def _load_all(data_path: str):
+    _, ops = load_baked_ops(data_path)
+    return {command: dict(ops[command]) for command in ops}
+
+
+def _load_one(data_path: str):
+    _, ops = load_baked_ops(data_path)
+    command = next(iter(ops))
+    return ops[command][next(iter(ops[command]))]
+
+
+def _time(func, data_path: str, runs: int) -> float:
+    times = []
+
+    for _ in range(runs):
+        gc.collect()
+        start = time.perf_counter()
+        func(data_path)
+        times.append(time.perf_counter() - start)
+
+    return min(times)
+
+
+def _measure(data_path: str, runs: int):
+
+    gc.collect()
+    tracemalloc.start()
+    loaded = _load_all(data_path)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del loaded
+
+    return {
+        "file_size_kb": os.path.getsize(data_path) / 1024,
+        "load_one_ms": _time(_load_one, data_path, runs) * 1000,
+        "load_all_ms": _time(_load_all, data_path, runs) * 1000,
+        "loaded_kb": allocated / 1024,
+    }
+
+
+def main():
+    """
+    Runs the benchmark and prints the results.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--commands", type=int, default=200)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    with _baked_spec(args.commands) as data_path:
+        results = _measure(data_path, args.runs)
+
+    print(f"commands:           {args.commands}")
+    print(f"baked file size:    {results['file_size_kb']:.1f} KiB")
+    print(f"load one operation: {results['load_one_ms']:.2f} ms")
+    print(f"load all ops:       {results['load_all_ms']:.1f} ms")
+    print(f"loaded ops memory:  {results['loaded_kb']:.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+"""
+Generates large synthetic OpenAPI specs for benchmarking the bake and load
+logic without requiring access to the real Linode spec.
+"""
+
+import copy
+from typing import Any, Dict
+
+PAGINATION_PROPERTIES = {
+    "page": {"type": "integer", "readOnly": True, "description": "The page."},
+    "pages": {"type": "integer", "readOnly": True, "description": "Pages."},
+    "results": {
+        "type": "integer",
+        "readOnly": True,
+        "description": "The total number of results.",
+    },
+}
+
+
+def _property(name: str, index: int) -> Dict[str, Any]:
+    types = ["string", "integer", "boolean", "number"]
+
+    return {
+        "type": types[index % len(types)],
+        "description": f"The {name} of this resource. "
+        "This is a long description shared by many operations.",
+        "x-linode-filterable": index % 3 == 0,
+        "x-linode-cli-display": index if index < 5 else 0,
+    }
+
+
+def _component_schemas(num_schemas: int, num_properties: int):
+    schemas = {}
+
+    for i in range(num_schemas):
+        properties = {
+            f"field_{j}": _property(f"field_{j}", j)
+            for j in range(num_properties)
+        }
+        properties["id"] = {
+            "type": "integer",
+            "readOnly": True,
+            "description": "The unique ID of this resource.",
+        }
+        properties["tags"] = {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "Tags applied to this resource.",
+        }
+        properties["nested"] = {
+            "type": "object",
+            "properties": {
+                "label": _property("label", 1),
+                "enabled": _property("enabled", 2),
+            },
+        }
+        properties["children"] = {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "purpose": _property("purpose", 0),
+                    "value": _property("value", 1),
+                },
+            },
+        }
+
+        schemas[f"Resource{i}"] = {
+            "allOf": [
+                {"$ref": "#/components/schemas/Base"},
+                {"type": "object", "properties": properties},
+            ]
+        }
+
+    schemas["Base"] = {
+        "type": "object",
+        "properties": {
+            "created": {
+                "type": "string",
+                "format": "date-time",
+                "readOnly": True,
+                "description": "When this resource was created.",
+            },
+            "updated": {
+                "type": "string",
+                "format": "date-time",
+                "readOnly": True,
+                "description": "When this resource was last updated.",
+            },
+        },
+    }
+
+    return schemas
+
+
+def _operation(summary: str, action: str, tag: str, **kwargs):
+    result = {
+        "summary": summary,
+        "description": f"{summary}. This is an operation description.",
+        "operationId": action.replace("-", "_") + tag,
+        "tags": [tag],
+        "x-linode-cli-action": action,
+    }
+    result.update(kwargs)
+    return result
+
+
+def _response(schema_ref: str, paginated: bool = False):
+    schema = {"$ref": schema_ref}
+
+    if paginated:
+        schema = {
+            "type": "object",
+            "properties": {
+                "data": {"type": "array", "items": schema},
+                **copy.deepcopy(PAGINATION_PROPERTIES),
+            },
+        }
+
+    return {
+        "200": {
+            "description": "OK",
+            "content": {"application/json": {"schema": schema}},
+        }
+    }
+
+
+def generate_spec(
+    num_commands: int = 100, num_properties: int = 30
+) -> Dict[str, Any]:
+    """
+    Generates a spec with a list, create, view, update and delete operation
+    for each command, sharing a set of component schemas.
+
+    :param num_commands: The number of commands to generate.
+    :param num_properties: The number of properties in each resource schema.
+
+    :returns: The generated spec as a dict.
+    """
+    paths = {}
+
+    for i in range(num_commands):
+        command = f"resource-{i}"
+        tag = f"Resource{i}"
+        ref = f"#/components/schemas/Resource{i % 10}"
+        request_body = {
+            "content": {"application/json": {"schema": {"$ref": ref}}}
+        }
+
+        paths[f"/resources-{i}"] = {
+            "x-linode-cli-command": command,
+            "get": _operation(
+                "List resources", "list", tag, responses=_response(ref, True)
+            ),
+            "post": _operation(
+                "Create a resource",
+                "create",
+                tag,
+                requestBody=request_body,
+                responses=_response(ref),
+            ),
+        }
+        paths[f"/resources-{i}/{{resourceId}}"] = {
+            "x-linode-cli-command": command,
+            "parameters": [
+                {
+                    "name": "resourceId",
+                    "in": "path",
+                    "required": True,
+                    "schema": {"type": "integer"},
+                }
+            ],
+            "get": _operation(
+                "View a resource", "view", tag, responses=_response(ref)
+            ),
+            "put": _operation(
+                "Update a resource",
+                "update",
+                tag,
+                requestBody=copy.deepcopy(request_body),
+                responses=_response(ref),
+            ),
+            "delete": _operation(
+                "Delete a resource",
+                "delete",
+                tag,
+                responses={
+                    "200": {
+                        "description": "OK",
+                        "content": {
+                            "application/json": {"schema": {"type": "object"}}
+                        },
+                    }
+                },
+            ),
+        }
+
+    return {
+        "openapi": "3.0.1",
+        "info": {"title": "Benchmark Spec", "version": "4.200.0"},
+        "servers": [{"url": "https://api.linode.com/v4"}],
+        "paths": paths,
+        "components": {
+            "schemas": _component_schemas(min(num_commands, 10), num_properties)
+        },
+    }
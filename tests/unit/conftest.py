@@ -8,6 +8,7 @@ from openapi3 import OpenAPI
 from openapi3.paths import Operation, Parameter
 from yaml import safe_load
 
+from linodecli import version_check
 from linodecli.baked import OpenAPIOperation
 from linodecli.cli import CLI
 
@@ -33,6 +34,18 @@ FIXTURES_PATH = os.path.normpath(
 )
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """
+    Prevents tests from reading or writing the user's CLI cache.
+    """
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+    # Forget the latest version looked up by any previous test
+    monkeypatch.setattr(version_check, "_cached", None)
+    monkeypatch.setattr(version_check, "_thread", None)
+
+
 @contextlib.contextmanager
 def open_fixture(filename: str) -> ContextManager[TextIO]:
     """
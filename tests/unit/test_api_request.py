@@ -6,19 +6,28 @@ Unit tests for linodecli.api_request
 import contextlib
 import io
 import json
+import time
 from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 import pytest
 import requests
+import requests_mock
 from _pytest.capture import CaptureFixture
 
-from linodecli import ExitCodes, api_request
+from linodecli import (
+    ExitCodes,
+    api_request,
+    rate_limit,
+    response_cache,
+    version_check,
+)
 from linodecli.baked.operation import (
     ExplicitEmptyListValue,
     ExplicitJsonValue,
     ExplicitNullValue,
 )
+from linodecli.retry import RetryPolicy
 
 
 class TestAPIRequest:
@@ -415,7 +424,7 @@ class TestAPIRequest:
 
             return mock_response
 
-        with patch("linodecli.api_request.requests.get", validate_http_request):
+        with patch.object(mock_cli.session, "get", validate_http_request):
             result = api_request.do_request(
                 mock_cli,
                 list_operation,
@@ -449,9 +458,7 @@ class TestAPIRequest:
 
         create_operation.allowed_defaults = ["region"]
 
-        with patch(
-            "linodecli.api_request.requests.post", validate_http_request
-        ):
+        with patch.object(mock_cli.session, "post", validate_http_request):
             result = api_request.do_request(
                 mock_cli,
                 create_operation,
@@ -478,7 +485,7 @@ class TestAPIRequest:
 
         update_operation.allowed_defaults = ["region"]
 
-        with patch("linodecli.api_request.requests.put", validate_http_request):
+        with patch.object(mock_cli.session, "put", validate_http_request):
             result = api_request.do_request(
                 mock_cli,
                 update_operation,
@@ -493,23 +500,8 @@ class TestAPIRequest:
         mock_cli.version = "1.0.0"
         mock_cli.spec_version = "1.0.0"
 
-        # Return a mock response from PyPI
-        def mock_http_response(url, headers=None, data=None, timeout=1):
-            assert "pypi.org" in url
-
-            r = requests.Response()
-            r.status_code = 200
-
-            def json_func():
-                return {
-                    "info": {
-                        # Add a fake new version
-                        "version": "1.1.0"
-                    }
-                }
-
-            r.json = json_func
-            return r
+        # Add a fake new version, as previously looked up from PyPI
+        version_check._write_cache({"checked": time.time(), "version": "1.1.0"})
 
         stderr_buf = io.StringIO()
 
@@ -520,10 +512,13 @@ class TestAPIRequest:
 
         with (
             contextlib.redirect_stderr(stderr_buf),
-            patch("linodecli.api_request.requests.get", mock_http_response),
+            patch("linodecli.version_check.requests.get") as mock_get,
         ):
             api_request._attempt_warn_old_version(mock_cli, mock_response)
 
+        # The cached version is still fresh, so PyPI isn't queried again
+        mock_get.assert_not_called()
+
         output = stderr_buf.getvalue()
         assert (
             "The API responded with version 1.1.0, which is newer than "
@@ -538,23 +533,8 @@ class TestAPIRequest:
         mock_cli.version = "1.0.0"
         mock_cli.spec_version = "1.0.0"
 
-        # Return a mock response from PyPI
-        def mock_http_response(url, headers=None, data=None, timeout=1):
-            assert "pypi.org" in url
-
-            r = requests.Response()
-            r.status_code = 200
-
-            def json_func():
-                return {
-                    "info": {
-                        # No new CLI release :(
-                        "version": "1.0.0"
-                    }
-                }
-
-            r.json = json_func
-            return r
+        # No new CLI release :(
+        version_check._write_cache({"checked": time.time(), "version": "1.0.0"})
 
         stderr_buf = io.StringIO()
 
@@ -563,33 +543,52 @@ class TestAPIRequest:
             status_code=200, reason="OK", headers={"X-Spec-Version": "1.1.0"}
         )
 
-        with (
-            contextlib.redirect_stderr(stderr_buf),
-            patch("linodecli.api_request.requests.get", mock_http_response),
-        ):
+        with contextlib.redirect_stderr(stderr_buf):
             api_request._attempt_warn_old_version(mock_cli, mock_response)
 
         output = stderr_buf.getvalue()
         assert "" == output
 
-    def test_up_to_date_cli(self, mock_cli):
-        # "up to date" version
+    def test_outdated_cli_unknown_version(self, mock_cli):
         mock_cli.suppress_warnings = False
         mock_cli.version = "1.0.0"
         mock_cli.spec_version = "1.0.0"
 
-        # Return a mock response from PyPI
-        def mock_http_response(url, headers=None, data=None, timeout=1):
+        # Simulate a slow PyPI; the warning must not wait for it
+        def mock_http_response(url, timeout=None):
             assert "pypi.org" in url
+            time.sleep(0.2)
 
             r = requests.Response()
             r.status_code = 200
+            r.json = lambda: {"info": {"version": "1.1.0"}}
+            return r
 
-            def json_func():
-                return {"info": {"version": "1.0.0"}}
+        stderr_buf = io.StringIO()
 
-            r.json = json_func
-            return r
+        mock_response = SimpleNamespace(
+            status_code=200, reason="OK", headers={"X-Spec-Version": "1.1.0"}
+        )
+
+        with (
+            contextlib.redirect_stderr(stderr_buf),
+            patch("linodecli.version_check.requests.get", mock_http_response),
+        ):
+            start = time.monotonic()
+            api_request._attempt_warn_old_version(mock_cli, mock_response)
+            assert time.monotonic() - start < 0.2
+
+            version_check.wait(None)
+
+        # The version is checked in the background for the next invocation
+        assert "" == stderr_buf.getvalue()
+        assert version_check._read_cache()["version"] == "1.1.0"
+
+    def test_up_to_date_cli(self, mock_cli):
+        # "up to date" version
+        mock_cli.suppress_warnings = False
+        mock_cli.version = "1.0.0"
+        mock_cli.spec_version = "1.0.0"
 
         stderr_buf = io.StringIO()
 
@@ -600,56 +599,183 @@ class TestAPIRequest:
 
         with (
             contextlib.redirect_stderr(stderr_buf),
-            patch("linodecli.api_request.requests.get", mock_http_response),
+            patch("linodecli.version_check.requests.get") as mock_get,
         ):
             api_request._attempt_warn_old_version(mock_cli, mock_response)
 
+        # PyPI is only checked if the API is newer than the CLI
+        mock_get.assert_not_called()
+
         output = stderr_buf.getvalue()
         assert "" == output
 
-    def test_do_request_retry(self, mock_cli, list_operation):
-        mock_response = Mock(status_code=408)
-        with patch(
-            "linodecli.api_request.requests.get", return_value=mock_response
-        ) and pytest.raises(SystemExit):
-            _ = api_request.do_request(mock_cli, list_operation, None)
-            assert mock_cli.retry_count == 3
-
-    def test_check_retry(self):
-        mock_response = Mock(status_code=200)
-        output = api_request._check_retry(mock_response)
-        assert not output
-
-        mock_response = Mock(status_code=408)
-        output = api_request._check_retry(mock_response)
-        assert output
-
-        mock_response = Mock(status_code=429)
-        output = api_request._check_retry(mock_response)
-        assert output
-
-        mock_response = Mock(
-            status_code=400,
-            headers={
-                "Server": "nginx",
-                "Content-Type": "text/html",
-            },
-        )
-        output = api_request._check_retry(mock_response)
-        assert output
+    def test_do_request_cache(self, mock_cli, list_operation):
+        mock_cli.config.config.set("testuser", "cache_ttl", "60")
+        url = "http://localhost/v4/foo/bar?page=1&page_size=100"
+
+        with requests_mock.Mocker() as m:
+            m.get(url, json={"data": ["cool"]})
+
+            for _ in range(2):
+                result = api_request.do_request(mock_cli, list_operation, [])
+                assert result.json() == {"data": ["cool"]}
+
+            assert m.call_count == 1
+
+            # A different filter is cached separately
+            api_request.do_request(
+                mock_cli, list_operation, ["--filterable_result", "cool"]
+            )
+            assert m.call_count == 2
+
+            mock_cli.refresh_cache = True
+            api_request.do_request(mock_cli, list_operation, [])
+            assert m.call_count == 3
+
+            mock_cli.refresh_cache = False
+            mock_cli.no_cache = True
+            api_request.do_request(mock_cli, list_operation, [])
+            assert m.call_count == 4
+
+    def test_do_request_cache_revalidate(
+        self, mock_cli, list_operation, monkeypatch
+    ):
+        mock_cli.config.config.set("testuser", "cache_ttl", "60")
+        url = "http://localhost/v4/foo/bar?page=1&page_size=100"
+
+        with requests_mock.Mocker() as m:
+            m.get(url, json={"data": ["cool"]}, headers={"ETag": '"a"'})
+            api_request.do_request(mock_cli, list_operation, [])
+
+            monkeypatch.setattr(
+                response_cache.CachedResponse, "is_fresh", lambda *_: False
+            )
+
+            m.get(url, status_code=304)
+            result = api_request.do_request(mock_cli, list_operation, [])
+
+            assert m.last_request.headers["If-None-Match"] == '"a"'
+            assert result.status_code == 200
+            assert result.json() == {"data": ["cool"]}
+
+    def test_do_request_cache_invalidate(
+        self, mock_cli, list_operation, update_operation
+    ):
+        mock_cli.config.config.set("testuser", "cache_ttl", "60")
+        url = "http://localhost/v4/foo/bar?page=1&page_size=100"
+
+        with requests_mock.Mocker() as m:
+            m.get(url, json={"data": ["cool"]})
+            m.put("http://localhost/v4/foo/bar/567", json={})
+
+            api_request.do_request(mock_cli, list_operation, [])
+            api_request.do_request(mock_cli, update_operation, ["567"])
+            api_request.do_request(mock_cli, list_operation, [])
+
+            assert [r.method for r in m.request_history] == [
+                "GET",
+                "PUT",
+                "GET",
+            ]
+
+    def test_do_request_rate_limit(self, mock_cli, list_operation, monkeypatch):
+        sleeps = []
+        monkeypatch.setattr(rate_limit.time, "sleep", sleeps.append)
+
+        with requests_mock.Mocker() as m:
+            m.get(
+                "http://localhost/v4/foo/bar?page=1&page_size=100",
+                json={},
+                headers={
+                    "X-RateLimit-Limit": "10",
+                    "X-RateLimit-Remaining": "0",
+                    "X-RateLimit-Reset": "30",
+                },
+            )
+
+            api_request.do_request(mock_cli, list_operation, [])
+            assert not sleeps
+
+            # The next request should wait for the limit to reset
+            api_request.do_request(mock_cli, list_operation, [])
+
+        assert len(sleeps) == 1
+        assert 25 < sleeps[0] <= 30
+
+    def test_get_cache_ttl(self, mock_cli, list_operation, create_operation):
+        assert api_request._get_cache_ttl(mock_cli, list_operation) == 0
+
+        config = mock_cli.config.config
+        config.set("testuser", "cache_ttl", "60")
+        config.set("testuser", "cache_ttl.default", "120")
+        assert api_request._get_cache_ttl(mock_cli, list_operation) == 120
+
+        config.set("testuser", "cache_ttl.default.foobarget", "300")
+        assert api_request._get_cache_ttl(mock_cli, list_operation) == 300
+
+        # Only GET responses are cached
+        assert api_request._get_cache_ttl(mock_cli, create_operation) == 0
+
+        config.set("testuser", "cache_ttl.default.foobarget", "-1")
+
+        with pytest.raises(SystemExit) as err:
+            api_request._get_cache_ttl(mock_cli, list_operation)
+
+        assert err.value.code == ExitCodes.ARGUMENT_ERROR
+
+    def test_do_request_retry(self, mock_cli, list_operation, monkeypatch):
+        monkeypatch.setattr(api_request.time, "sleep", lambda _: None)
+        request = api_request.RequestContext.from_cli(mock_cli)
+
+        with requests_mock.Mocker() as m, pytest.raises(SystemExit):
+            m.get(
+                "http://localhost/v4/foo/bar?page=1&page_size=100",
+                status_code=408,
+                json={"errors": [{"reason": "Request timed out"}]},
+            )
+            api_request.do_request(
+                mock_cli, list_operation, [], request=request
+            )
+
+        # The retries are counted on the request rather than the CLI
+        assert request.retry_count == 3
+
+    def test_do_request_backoff(self, mock_cli, list_operation, monkeypatch):
+        sleeps = []
+        monkeypatch.setattr(api_request.time, "sleep", sleeps.append)
+        mock_cli.retry_policy = RetryPolicy(jitter=False)
+
+        with requests_mock.Mocker() as m:
+            m.get(
+                "http://localhost/v4/foo/bar?page=1&page_size=100",
+                [
+                    {"status_code": 503, "json": {}},
+                    {"exc": requests.ConnectionError},
+                    {"status_code": 200, "json": {"data": []}},
+                ],
+            )
+
+            result = api_request.do_request(mock_cli, list_operation, [])
+
+        assert result.status_code == 200
+        assert sleeps == [1, 2]
+
+    def test_do_request_no_retry_post(
+        self, mock_cli, create_operation, monkeypatch
+    ):
+        monkeypatch.setattr(api_request.time, "sleep", lambda _: None)
 
-    def test_get_retry_after(self):
-        headers = {"Retry-After": "10"}
-        output = api_request._get_retry_after(headers)
-        assert output == 10
+        with requests_mock.Mocker() as m:
+            m.post("http://localhost/v4/foo/bar", exc=requests.ConnectionError)
 
-        headers = {"Retry-After": ""}
-        output = api_request._get_retry_after(headers)
-        assert output == 0
+            with pytest.raises(requests.ConnectionError):
+                api_request.do_request(
+                    mock_cli,
+                    create_operation,
+                    ["--generic_arg", "foo", "--test_param", "1"],
+                )
 
-        headers = {}
-        output = api_request._get_retry_after(headers)
-        assert output == 0
+            assert m.call_count == 1
 
     def test_traverse_request_body(self):
         result = api_request._traverse_request_body(
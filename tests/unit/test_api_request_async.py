@@ -0,0 +1,284 @@
+"""
+Unit tests for linodecli.api_request_async
+"""
+
+import asyncio
+import http.server
+import json
+import threading
+from types import SimpleNamespace
+
+import pytest
+import requests
+import requests_mock
+
+from linodecli import api_request_async, rate_limit
+from linodecli.api_request import RequestContext
+
+
+@pytest.fixture
+def no_aiohttp(monkeypatch):
+    """
+    Sends requests with the fallback transport, as if aiohttp were not
+    installed.
+    """
+    monkeypatch.setattr(api_request_async, "_import_aiohttp", lambda: None)
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """
+    Records calls to asyncio.sleep rather than sleeping.
+    """
+    result = []
+
+    async def sleep(delay):
+        result.append(delay)
+
+    monkeypatch.setattr(api_request_async.asyncio, "sleep", sleep)
+    return result
+
+
+class TestAPIRequestAsync:
+    """
+    Unit tests for linodecli.api_request_async
+    """
+
+    def test_do_request(self, no_aiohttp, mock_cli, update_operation):
+        async def __run():
+            return await asyncio.gather(
+                *(
+                    api_request_async.do_request(
+                        mock_cli,
+                        update_operation,
+                        ["--generic_arg", f"foo{i}", str(i)],
+                    )
+                    for i in range(50)
+                )
+            )
+
+        with requests_mock.Mocker() as m:
+            for i in range(50):
+                m.put(f"http://localhost/v4/foo/bar/{i}", json={"id": i})
+
+            responses = asyncio.run(__run())
+
+        assert [r.json() for r in responses] == [{"id": i} for i in range(50)]
+        assert sorted(r.json()["generic_arg"] for r in m.request_history) == (
+            sorted(f"foo{i}" for i in range(50))
+        )
+
+    def test_do_request_filter(self, no_aiohttp, mock_cli, list_operation):
+        with requests_mock.Mocker() as m:
+            m.get(
+                "http://localhost/v4/foo/bar?page=1&page_size=100",
+                json={"data": []},
+            )
+
+            asyncio.run(
+                api_request_async.do_request(
+                    mock_cli,
+                    list_operation,
+                    ["--filterable_result", "value"],
+                )
+            )
+
+        assert json.loads(m.last_request.headers["X-Filter"]) == {
+            "filterable_result": "value"
+        }
+
+    def test_do_request_retry(
+        self, no_aiohttp, sleeps, mock_cli, list_operation
+    ):
+        request = RequestContext()
+
+        with requests_mock.Mocker() as m:
+            m.get(
+                "http://localhost/v4/foo/bar?page=1&page_size=100",
+                [
+                    {"status_code": 503, "headers": {"Retry-After": "3"}},
+                    {"status_code": 200, "json": {"data": []}},
+                ],
+            )
+
+            response = asyncio.run(
+                api_request_async.do_request(
+                    mock_cli, list_operation, [], request=request
+                )
+            )
+
+        assert response.status_code == 200
+        assert request.retry_count == 1
+        assert sleeps == [3]
+
+    def test_do_request_rate_limit(
+        self, no_aiohttp, sleeps, mock_cli, list_operation, monkeypatch
+    ):
+        monkeypatch.setattr(rate_limit, "reserve", lambda key: 0.5)
+
+        with requests_mock.Mocker() as m:
+            m.get(
+                "http://localhost/v4/foo/bar?page=1&page_size=100",
+                json={"data": []},
+            )
+
+            asyncio.run(
+                api_request_async.do_request(mock_cli, list_operation, [])
+            )
+
+        assert sleeps == [0.5]
+
+    def test_do_request_blocking_io(
+        self, no_aiohttp, mock_cli, list_operation, monkeypatch
+    ):
+        threads = {}
+
+        def _record(name, func):
+            def __wrapper(*args):
+                threads[name] = threading.get_ident()
+                return func(*args)
+
+            return __wrapper
+
+        # The response cache and rate limit state are read and written
+        # from outside the event loop's thread
+        for module, name in [
+            (api_request_async, "_prepare_request"),
+            (api_request_async, "_finish_request"),
+            (rate_limit, "reserve"),
+            (rate_limit, "update"),
+        ]:
+            monkeypatch.setattr(
+                module, name, _record(name, getattr(module, name))
+            )
+
+        async def __run():
+            await api_request_async.do_request(mock_cli, list_operation, [])
+            return threading.get_ident()
+
+        with requests_mock.Mocker() as m:
+            m.get(
+                "http://localhost/v4/foo/bar?page=1&page_size=100",
+                json={"data": []},
+            )
+
+            loop_thread = asyncio.run(__run())
+
+        assert set(threads) == {
+            "_prepare_request",
+            "_finish_request",
+            "reserve",
+            "update",
+        }
+        assert loop_thread not in threads.values()
+
+    def test_get_session_pool_size(self, mock_cli):
+        # Only the parts of aiohttp used to create a session
+        aiohttp = SimpleNamespace(
+            TCPConnector=lambda limit: limit,
+            ClientSession=lambda connector: SimpleNamespace(
+                limit=connector, closed=False
+            ),
+        )
+
+        async def __run():
+            mock_cli.pool_size = 2
+            first = api_request_async._get_session(mock_cli, aiohttp)
+            assert api_request_async._get_session(mock_cli, aiohttp) is first
+
+            # A different pool size gets a session with its own limit
+            mock_cli.pool_size = 5
+            second = api_request_async._get_session(mock_cli, aiohttp)
+
+            api_request_async._sessions.pop(asyncio.get_running_loop())
+            return first.limit, second.limit
+
+        assert asyncio.run(__run()) == (2, 5)
+
+    def test_do_request_error(self, no_aiohttp, mock_cli, list_operation):
+        with requests_mock.Mocker() as m:
+            m.get(
+                "http://localhost/v4/foo/bar?page=1&page_size=100",
+                status_code=404,
+                json={"errors": [{"reason": "Not found"}]},
+            )
+
+            with pytest.raises(SystemExit):
+                asyncio.run(
+                    api_request_async.do_request(mock_cli, list_operation, [])
+                )
+
+            response = asyncio.run(
+                api_request_async.do_request(
+                    mock_cli, list_operation, [], skip_error_handling=True
+                )
+            )
+
+        assert response.status_code == 404
+
+    def test_call_operation_async(self, no_aiohttp, mock_cli, list_operation):
+        mock_cli.ops = {"foo": {"bar": list_operation}}
+
+        with requests_mock.Mocker() as m:
+            m.get(
+                "http://localhost/v4/foo/bar?page=1&page_size=100",
+                json={"data": [{"id": 1}]},
+            )
+
+            result = asyncio.run(mock_cli.call_operation_async("foo", "bar"))
+
+        assert result == (200, {"data": [{"id": 1}]})
+
+    def test_do_request_aiohttp(self, mock_cli, list_operation, monkeypatch):
+        pytest.importorskip("aiohttp")
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = json.dumps(
+                    {"filter": self.headers.get("X-Filter")}
+                ).encode()
+
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+
+        monkeypatch.setattr(
+            list_operation,
+            "url_base",
+            f"http://127.0.0.1:{server.server_port}",
+        )
+
+        async def __run():
+            try:
+                return await asyncio.gather(
+                    *(
+                        api_request_async.do_request(
+                            mock_cli,
+                            list_operation,
+                            ["--filterable_result", str(i)],
+                        )
+                        for i in range(20)
+                    )
+                )
+            finally:
+                await api_request_async.close()
+
+        try:
+            responses = asyncio.run(__run())
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert all(isinstance(r, requests.Response) for r in responses)
+        assert [json.loads(r.json()["filter"]) for r in responses] == [
+            {"filterable_result": str(i)} for i in range(20)
+        ]
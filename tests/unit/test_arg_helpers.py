@@ -1,9 +1,29 @@
 #!/usr/local/bin/python3
 
+import pytest
+
 from linodecli import arg_helpers
+from linodecli.exit_codes import ExitCodes
 
 
 class TestArgParsing:
+    def test_build_parser_no_abbrev(self):
+        parser = arg_helpers.build_parser()
+
+        # Action arguments that are prefixes of static arguments are left
+        # for the action, rather than being ambiguous or taken by them
+        parsed, args = parser.parse_known_args(
+            ["firewalls", "device-create", "123", "--id", "456", "--type", "x"]
+        )
+        assert (parsed.command, parsed.action) == ("firewalls", "device-create")
+        assert args == ["123", "--id", "456", "--type", "x"]
+
+        parsed, args = parser.parse_known_args(
+            ["linodes", "list", "--parallel", "2", "--para", "3"]
+        )
+        assert parsed.parallel_pages == arg_helpers.DEFAULT_PARALLEL_PAGES
+        assert args == ["--parallel", "2", "--para", "3"]
+
     # arg_helpers.register_plugin(module, config, ops)
     def test_register_plugin_success(
         self, mocker, module_mocker, mocked_config
@@ -149,3 +169,14 @@ class TestArgParsing:
         msg, code = arg_helpers.remove_plugin("testing.plugin", mocked_config)
         assert "not a registered plugin" in msg
         assert code == 14
+
+    def test_parse_bake_args(self):
+        assert arg_helpers.parse_bake_args([]).jobs == 1
+        assert arg_helpers.parse_bake_args(["--jobs", "4"]).jobs == 4
+        assert arg_helpers.parse_bake_args(["-j", "0"]).jobs == 0
+
+    def test_parse_bake_args_negative_jobs(self):
+        with pytest.raises(SystemExit) as err:
+            arg_helpers.parse_bake_args(["--jobs", "-1"])
+
+        assert err.value.code == ExitCodes.ARGUMENT_ERROR
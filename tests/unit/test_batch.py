@@ -0,0 +1,182 @@
+"""
+Unit tests for linodecli.batch
+"""
+
+import io
+import json
+import sys
+
+import pytest
+import requests_mock
+
+from linodecli import batch
+from linodecli.exit_codes import ExitCodes
+
+
+@pytest.fixture
+def batch_cli(mock_cli, list_operation, update_operation):
+    """
+    A CLI that can run the test operations.
+    """
+    mock_cli.ops = {"foo": {"list": list_operation, "update": update_operation}}
+    return mock_cli
+
+
+def _run(ctx, lines, parallel=1):
+    output = io.StringIO()
+    status = batch.run_batch(ctx, lines, parallel=parallel, output=output)
+    return status, [json.loads(v) for v in output.getvalue().splitlines()]
+
+
+class TestBatch:
+    """
+    Unit tests for linodecli.batch
+    """
+
+    @pytest.mark.parametrize(
+        "line,expected",
+        [
+            ("linodes view 123", ["linodes", "view", "123"]),
+            (
+                "linode-cli linodes update 123 --label 'my linode'",
+                ["linodes", "update", "123", "--label", "my linode"],
+            ),
+            (
+                '{"command": "linodes", "action": "view", "args": [123]}',
+                ["linodes", "view", "123"],
+            ),
+            ('{"command": "linodes", "action": "list"}', ["linodes", "list"]),
+        ],
+    )
+    def test_parse_line(self, line, expected):
+        assert batch.parse_line(line) == expected
+
+    @pytest.mark.parametrize(
+        "line",
+        [
+            "linodes",
+            '{"command": "linodes"}',
+            '{"command": "linodes", "action": "view", "args": "123"}',
+            '{"command": 1, "action": "view"}',
+            "{not json",
+            "linodes list --help",
+            '{"command": "linodes", "action": "list", "args": ["-h"]}',
+        ],
+    )
+    def test_parse_line_invalid(self, line):
+        with pytest.raises(ValueError):
+            batch.parse_line(line)
+
+    def test_parse_args(self):
+        assert batch.parse_args([]).parallel == 1
+        assert batch.parse_args(["--parallel", "3"]).parallel == 3
+
+    @pytest.mark.parametrize(
+        "args",
+        [["--parallel", "0"], ["--ids", "1"], ["--para", "2"], ["extra"]],
+    )
+    def test_parse_args_invalid(self, args):
+        with pytest.raises(SystemExit) as err:
+            batch.parse_args(args)
+
+        assert err.value.code == ExitCodes.ARGUMENT_ERROR
+
+    def test_open_input(self, tmp_path, monkeypatch):
+        stdin = io.StringIO("foo list\n")
+        monkeypatch.setattr("sys.stdin", stdin)
+
+        for path in (None, "-"):
+            with batch.open_input(path) as f:
+                assert f is stdin
+
+        # stdin is left open for the rest of the process
+        assert not stdin.closed
+
+        path = tmp_path / "batch"
+        path.write_text("foo list\n")
+
+        with batch.open_input(str(path)) as f:
+            assert f.read() == "foo list\n"
+
+        assert f.closed
+
+    def test_open_input_missing(self, tmp_path):
+        with pytest.raises(SystemExit) as err:
+            with batch.open_input(str(tmp_path / "missing")):
+                pass
+
+        assert err.value.code == ExitCodes.FILE_ERROR
+
+    @pytest.mark.parametrize("parallel", [1, 4])
+    def test_run_batch(self, batch_cli, parallel):
+        lines = [
+            "# Update some things",
+            "",
+            *(f"foo update {i} --generic_arg foo{i}" for i in range(10)),
+        ]
+
+        with requests_mock.Mocker() as m:
+            for i in range(10):
+                m.put(f"http://localhost/v4/foo/bar/{i}", json={"id": i})
+
+            status, results = _run(batch_cli, lines, parallel=parallel)
+
+        assert status == ExitCodes.SUCCESS
+        assert results == [
+            {
+                "line": i + 3,
+                "command": "foo",
+                "action": "update",
+                "status": 0,
+                "http_status": 200,
+                "response": {"id": i},
+            }
+            for i in range(10)
+        ]
+
+    def test_run_batch_errors(self, batch_cli):
+        lines = [
+            "foo list",
+            "bar list",
+            "foo missing",
+            "foo update",
+            "foo",
+            '{"command": "foo", "action": "update", "args": ["1"]}',
+        ]
+
+        with requests_mock.Mocker() as m:
+            m.get(
+                "http://localhost/v4/foo/bar?page=1&page_size=100",
+                json={"data": []},
+            )
+            m.put(
+                "http://localhost/v4/foo/bar/1",
+                status_code=404,
+                json={"errors": [{"reason": "Not found"}]},
+            )
+
+            status, results = _run(batch_cli, lines, parallel=2)
+
+        assert status == ExitCodes.REQUEST_FAILED
+        assert [(r["line"], r["status"]) for r in results] == [
+            (1, ExitCodes.SUCCESS),
+            (2, ExitCodes.UNRECOGNIZED_COMMAND),
+            (3, ExitCodes.UNRECOGNIZED_ACTION),
+            (4, 2),  # argparse's exit status for invalid arguments
+            (5, ExitCodes.ARGUMENT_ERROR),
+            (6, ExitCodes.REQUEST_FAILED),
+        ]
+        assert results[5]["http_status"] == 404
+        assert results[5]["response"] == {"errors": [{"reason": "Not found"}]}
+
+    def test_run_batch_exit_success(self, batch_cli, monkeypatch):
+        def do_request(*_, **__):
+            sys.exit(ExitCodes.SUCCESS)
+
+        monkeypatch.setattr("linodecli.api_request.do_request", do_request)
+
+        status, results = _run(batch_cli, ["foo list"])
+
+        # A command that exits without running never succeeds
+        assert status == ExitCodes.REQUEST_FAILED
+        assert results[0]["status"] == ExitCodes.ARGUMENT_ERROR
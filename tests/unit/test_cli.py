@@ -1,13 +1,19 @@
 from __future__ import annotations
 
 import copy
+import functools
+import importlib
+import io
+import json
 import math
 import os
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
-import requests
 import requests_mock
+import yaml
 from pytest import MonkeyPatch
 
 from tests.unit.conftest import FIXTURES_PATH, open_fixture
@@ -16,6 +22,10 @@ if True:
     from linodecli import CLI
     from linodecli.api_request import get_all_pages
     from linodecli.baked.operation import OpenAPIOperation
+    from linodecli.baked.store import load_baked_ops
+    from linodecli.cli import DEFAULT_POOL_SIZE
+    from linodecli.exit_codes import ExitCodes
+    from linodecli.output.output_handler import OutputMode
 
 
 class MockResponse:
@@ -122,6 +132,58 @@ class TestCLI:
             assert m.call_count == 1
             assert parsed_json_http.raw_element == parsed_json_local.raw_element
 
+    def test_session(self, mock_cli: CLI):
+        session = mock_cli.session
+
+        # The same session should be used for every request
+        assert mock_cli.session is session
+
+        adapter = session.get_adapter("https://api.linode.com/v4")
+        assert adapter.poolmanager.connection_pool_kw["maxsize"] == (
+            DEFAULT_POOL_SIZE
+        )
+
+    def test_session_pool_size(self, mock_cli: CLI):
+        mock_cli.config.config.set("testuser", "pool_size", "32")
+
+        adapter = mock_cli.session.get_adapter("https://api.linode.com/v4")
+        assert adapter.poolmanager.connection_pool_kw["maxsize"] == 32
+
+    def test_session_invalid_pool_size(self, mock_cli: CLI):
+        mock_cli.pool_size = -1
+
+        with pytest.raises(SystemExit) as err:
+            _ = mock_cli.session
+
+        assert err.value.code == ExitCodes.ARGUMENT_ERROR
+
+    def test_parse_spec_file_json(self, monkeypatch: MonkeyPatch):
+        def fail_yaml_load(*_, **__):
+            raise AssertionError("JSON spec was parsed as YAML")
+
+        monkeypatch.setattr(yaml, "load", fail_yaml_load)
+
+        with open_fixture("cli_test_load.json") as f:
+            content = f.read()
+
+        assert CLI._parse_spec_file(content.encode()) == json.loads(content)
+
+    def test_parse_spec_file_invalid(self):
+        with pytest.raises(ValueError, match="Failed to parse spec file"):
+            CLI._parse_spec_file(b"{ invalid: [")
+
+    def test_load_spec_dict_cached(self, monkeypatch: MonkeyPatch):
+        path = os.path.join(FIXTURES_PATH, "cli_test_load.yaml")
+
+        original = CLI._load_spec_dict(path)
+
+        def fail_parse(_):
+            raise AssertionError("The spec was parsed again")
+
+        monkeypatch.setattr(CLI, "_parse_spec_file", staticmethod(fail_parse))
+
+        assert CLI._load_spec_dict(path) == original
+
     def test_bake_missing_cmd_ext(self, mock_cli: CLI):
         try:
             mock_cli.bake(
@@ -140,6 +202,140 @@ class TestCLI:
         else:
             raise AssertionError("Expected a KeyError exception")
 
+    def test_bake_spec_stored_separately(
+        self, mock_cli: CLI, tmp_path, monkeypatch: MonkeyPatch
+    ):
+        data_path = str(tmp_path / "data-3")
+        monkeypatch.setattr(CLI, "_get_data_file", lambda self: data_path)
+
+        mock_cli.bake(os.path.join(FIXTURES_PATH, "cli_test_bake.yaml"))
+
+        assert os.path.exists(data_path)
+        assert os.path.exists(data_path + "-spec")
+
+        metadata, _ = load_baked_ops(data_path)
+        assert "_spec" not in metadata
+
+        mock_cli.load_baked()
+
+        # The spec should only be loaded once it is requested
+        assert mock_cli._spec is None
+        assert mock_cli.spec.info.version == "1.2.3"
+        assert mock_cli._spec is not None
+
+    def test_bake_incremental(
+        self, mock_cli: CLI, tmp_path, monkeypatch: MonkeyPatch
+    ):
+        data_path = str(tmp_path / "data-3")
+        monkeypatch.setattr(CLI, "_get_data_file", lambda self: data_path)
+
+        with open_fixture("cli_test_bake.yaml") as f:
+            spec = yaml.safe_load(f)
+
+        spec_path = tmp_path / "spec.yaml"
+        spec_path.write_text(yaml.safe_dump(spec, sort_keys=False))
+
+        mock_cli.bake(str(spec_path))
+
+        with open(data_path, "rb") as f:
+            full_bake = f.read()
+
+        baked_paths = []
+        # linodecli.cli is shadowed by the module-level CLI object
+        cli_module = importlib.import_module("linodecli.cli")
+        bake_path = cli_module.bake_path
+
+        def spy_bake_path(path):
+            baked_paths.append(path.path[-1])
+            return bake_path(path)
+
+        monkeypatch.setattr(cli_module, "bake_path", spy_bake_path)
+
+        # Nothing has changed, so every operation should be reused
+        mock_cli.bake(str(spec_path))
+
+        assert baked_paths == []
+        assert mock_cli._spec is None
+
+        with open(data_path, "rb") as f:
+            assert f.read() == full_bake
+
+        # Only the changed path should be rebuilt
+        spec["paths"]["/bar"]["get"]["summary"] = "List some bars"
+        spec_path.write_text(yaml.safe_dump(spec, sort_keys=False))
+
+        mock_cli.bake(str(spec_path))
+
+        assert baked_paths == ["/bar"]
+        assert mock_cli.ops["bar"]["list"].summary == "List some bars."
+        assert list(mock_cli.ops["foo"]) == ["list", "create", "view", "delete"]
+
+        _, ops = load_baked_ops(data_path)
+        assert ops["bar"]["list"].summary == "List some bars."
+        assert ops["foo"]["view"].action_aliases == ["show"]
+
+    def test_bake_parallel(self, mock_cli: CLI, tmp_path, monkeypatch):
+        data_path = str(tmp_path / "data-3")
+        monkeypatch.setattr(CLI, "_get_data_file", lambda self: data_path)
+
+        spec_path = os.path.join(FIXTURES_PATH, "cli_test_bake.yaml")
+
+        mock_cli.bake(spec_path)
+
+        with open(data_path, "rb") as f:
+            serial_bake = f.read()
+
+        os.remove(data_path)
+
+        # A parallel bake should produce exactly the same data file
+        mock_cli.bake(spec_path, jobs=2)
+
+        with open(data_path, "rb") as f:
+            assert f.read() == serial_bake
+
+        assert list(mock_cli.ops["foo"]) == ["list", "create", "view", "delete"]
+
+    def test_runtime_does_not_load_spec(
+        self, mock_cli: CLI, tmp_path, monkeypatch: MonkeyPatch
+    ):
+        data_path = str(tmp_path / "data-3")
+        monkeypatch.setattr(CLI, "_get_data_file", lambda self: data_path)
+
+        mock_cli.bake(os.path.join(FIXTURES_PATH, "cli_test_bake.yaml"))
+        mock_cli.load_baked()
+
+        def fail_load_spec(_):
+            raise AssertionError("The raw spec was loaded at runtime")
+
+        monkeypatch.setattr(CLI, "_load_baked_spec", fail_load_spec)
+
+        mock_cli.output_handler.mode = OutputMode.json
+
+        with requests_mock.Mocker() as m:
+            m.get(
+                "http://localhost/v4/foo/123",
+                json={"id": 123, "label": "cool", "tags": []},
+            )
+            m.get(
+                "http://localhost/v4/foo?page=1&page_size=100",
+                json={
+                    "data": [{"id": 123, "label": "cool", "tags": []}],
+                    "page": 1,
+                    "pages": 1,
+                    "results": 1,
+                },
+            )
+
+            mock_cli.handle_command("foo", "view", ["123"])
+            mock_cli.handle_command("foo", "list", [])
+
+            status, result = mock_cli.call_operation("foo", "view", ["123"])
+
+            assert m.call_count == 3
+
+        assert status == 200
+        assert result["label"] == "cool"
+
 
 def test_get_all_pages(
     mock_cli: CLI, list_operation: OpenAPIOperation, monkeypatch: MonkeyPatch
@@ -154,7 +350,7 @@ def test_get_all_pages(
             page = pages
         return MockResponse(page, pages, pages * 500)
 
-    monkeypatch.setattr(requests, "get", mock_get)
+    monkeypatch.setattr(mock_cli.session, "get", mock_get)
 
     merged_result = get_all_pages(mock_cli, list_operation, [])
 
@@ -162,3 +358,198 @@ def test_get_all_pages(
     assert merged_result["page"] == 1
     assert merged_result["pages"] == 1
     assert merged_result["results"] == TOTAL_DATA
+
+
+def test_get_all_pages_parallel(
+    mock_cli: CLI, list_operation: OpenAPIOperation, monkeypatch: MonkeyPatch
+):
+    pages = 6
+
+    def mock_get(url: str, *args, **kwargs):
+        page = int(re.search(r"\?page=(.*?)&page_size", url).group(1))
+
+        # Later pages respond first
+        time.sleep((pages - page) * 0.01)
+
+        response = MockResponse(page, pages, pages * 500)
+        response.json = lambda: {
+            "data": [page] * 500,
+            "page": page,
+            "pages": pages,
+            "results": pages * 500,
+        }
+        return response
+
+    monkeypatch.setattr(mock_cli.session, "get", mock_get)
+    mock_cli.parallel_pages = 4
+
+    merged_result = get_all_pages(mock_cli, list_operation, [])
+
+    assert merged_result["data"] == [
+        page for page in range(1, pages + 1) for _ in range(500)
+    ]
+    assert mock_cli.page == 1
+
+
+def test_call_operation_threads(
+    mock_cli: CLI,
+    list_operation: OpenAPIOperation,
+    update_operation: OpenAPIOperation,
+):
+    mock_cli.ops = {"foo": {"list": list_operation, "update": update_operation}}
+
+    def list_callback(request, context):
+        page = int(request.qs["page"][0])
+        page_size = int(request.qs["page_size"][0])
+
+        # Give other threads a chance to interleave with this request
+        time.sleep(0.001)
+
+        return {
+            "data": [{"page": page, "page_size": page_size}],
+            "page": page,
+            "pages": 3,
+        }
+
+    def update_callback(request, context):
+        time.sleep(0.001)
+        return {"id": request.path.rsplit("/", 1)[-1], "body": request.json()}
+
+    def run(i: int):
+        if i % 3 == 0:
+            status, result = mock_cli.call_operation("foo", "list")
+            assert status == 200
+            assert result["data"] == [{"page": 1, "page_size": 100}]
+        elif i % 3 == 1:
+            result = get_all_pages(mock_cli, list_operation, [])
+            assert result["data"] == [
+                {"page": page, "page_size": 500} for page in (1, 2, 3)
+            ]
+        else:
+            status, result = mock_cli.call_operation(
+                "foo",
+                "update",
+                ["--generic_arg", f"arg-{i}", "--test_param", str(i), str(i)],
+            )
+            assert status == 200
+            assert result == {
+                "id": str(i),
+                "body": {"generic_arg": f"arg-{i}", "test_param": i},
+            }
+
+    with requests_mock.Mocker() as m:
+        m.get(re.compile(r"^http://localhost/v4/foo/bar\?"), json=list_callback)
+        m.put(
+            re.compile(r"^http://localhost/v4/foo/bar/"), json=update_callback
+        )
+
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            list(executor.map(run, range(300)))
+
+    # Requests don't modify the CLI's options
+    assert (mock_cli.page, mock_cli.page_size) == (1, 100)
+
+
+@pytest.mark.parametrize(
+    "mode",
+    [
+        OutputMode.delimited,
+        OutputMode.json,
+        OutputMode.ndjson,
+        OutputMode.table,
+    ],
+)
+def test_handle_command_all_rows(
+    mock_cli: CLI,
+    list_operation: OpenAPIOperation,
+    monkeypatch: MonkeyPatch,
+    mode: OutputMode,
+):
+    pages = 3
+    output = io.StringIO()
+
+    # The output printed before each page was requested
+    printed = []
+
+    def mock_get(url: str, *args, **kwargs):
+        page = int(re.search(r"\?page=(.*?)&page_size", url).group(1))
+        printed.append(output.getvalue())
+
+        response = MockResponse(page, pages, pages * 2)
+        response.json = lambda: {
+            "data": [{"filterable_result": f"{page}-{i}"} for i in range(2)],
+            "page": page,
+            "pages": pages,
+            "results": pages * 2,
+        }
+        return response
+
+    monkeypatch.setattr(mock_cli.session, "get", mock_get)
+    monkeypatch.setattr(mock_cli, "find_operation", lambda *_: list_operation)
+    monkeypatch.setattr(
+        mock_cli.output_handler,
+        "print_response",
+        functools.partial(mock_cli.output_handler.print_response, to=output),
+    )
+
+    mock_cli.pagination = False
+    mock_cli.parallel_pages = 1
+    mock_cli.output_handler.mode = mode
+
+    mock_cli.handle_command("foo", "bar", [])
+
+    rows = [f"{page}-{i}" for page in range(1, pages + 1) for i in range(2)]
+
+    if mode == OutputMode.table:
+        # Tables are only printed once every page is received
+        assert printed == [""] * pages
+        assert all(row in output.getvalue() for row in rows)
+        return
+
+    # Rows for each page are printed before the next page is requested
+    assert "1-1" in printed[1] and "2-0" not in printed[1]
+
+    if mode == OutputMode.json:
+        assert json.loads(output.getvalue()) == [
+            {"filterable_result": row} for row in rows
+        ]
+    elif mode == OutputMode.ndjson:
+        assert output.getvalue().splitlines() == [
+            json.dumps({"filterable_result": row}, separators=(",", ":"))
+            for row in rows
+        ]
+    else:
+        assert output.getvalue().splitlines()[1:] == [
+            f"{row}\t" for row in rows
+        ]
+
+
+def test_module_cli(monkeypatch: MonkeyPatch):
+    """
+    Tests that `from linodecli import cli` still returns a CLI object,
+    which is only created the first time it is accessed.
+    """
+    import linodecli
+
+    created = []
+
+    def _make_cli(skip_config):
+        created.append(skip_config)
+        return mock_cli
+
+    mock_cli = object()
+    monkeypatch.setattr(linodecli, "_make_cli", _make_cli)
+    monkeypatch.setattr(linodecli, "TEST_MODE", True)
+
+    try:
+        assert "cli" not in vars(linodecli)
+
+        from linodecli import cli
+
+        assert cli is mock_cli
+        assert linodecli.cli is mock_cli
+
+        # TEST_MODE skips configuration
+        assert created == [True]
+    finally:
+        vars(linodecli).pop("cli", None)
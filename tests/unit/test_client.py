@@ -0,0 +1,203 @@
+"""
+Unit tests for linodecli.client
+"""
+
+import asyncio
+import json
+
+import pytest
+import requests_mock
+
+from linodecli import (
+    ApiError,
+    ArgumentError,
+    ConfigurationError,
+    LinodeClient,
+    api_request_async,
+)
+from linodecli.cli import CLI
+from tests.unit.conftest import MOCK_CONFIG
+
+
+@pytest.fixture
+def operations(list_operation, create_operation, update_operation, monkeypatch):
+    """
+    Loads the test operations in place of a baked spec.
+    """
+    ops = {
+        "foo": {
+            "list": list_operation,
+            "create": create_operation,
+            "update": update_operation,
+        }
+    }
+
+    def load_baked(self):
+        self.ops = ops
+
+    monkeypatch.setattr(CLI, "load_baked", load_baked)
+    return ops
+
+
+@pytest.fixture
+def config_file(tmp_path, monkeypatch):
+    """
+    Writes a config file for the client to load.
+    """
+    path = tmp_path / "linode-cli"
+    path.write_text(MOCK_CONFIG)
+
+    monkeypatch.setenv("LINODE_CLI_CONFIG", str(path))
+    monkeypatch.delenv("LINODE_CLI_TOKEN", raising=False)
+    return path
+
+
+class TestLinodeClient:
+    """
+    Unit tests for linodecli.client
+    """
+
+    def test_call(self, operations, config_file):
+        client = LinodeClient()
+
+        with requests_mock.Mocker() as m:
+            m.put("http://localhost/v4/foo/bar/567", json={"id": 567})
+
+            result = client.call(
+                "foo",
+                "update",
+                567,
+                generic_arg="foo",
+                object_list={"field_string": "bar"},
+            )
+
+        assert result == {"id": 567}
+        assert m.last_request.headers["Authorization"] == (
+            "Bearer notafaketoken"
+        )
+        assert m.last_request.json() == {
+            "generic_arg": "foo",
+            "object_list": {"field_string": "bar"},
+        }
+
+    def test_call_async(self, operations, config_file, monkeypatch):
+        monkeypatch.setattr(api_request_async, "_import_aiohttp", lambda: None)
+        client = LinodeClient()
+
+        async def __run():
+            try:
+                return await asyncio.gather(
+                    *(client.call_async("foo", "update", i) for i in range(10))
+                )
+            finally:
+                await client.close_async()
+
+        with requests_mock.Mocker() as m:
+            for i in range(10):
+                m.put(f"http://localhost/v4/foo/bar/{i}", json={"id": i})
+
+            m.put("http://localhost/v4/foo/bar/3", status_code=404, json={})
+
+            with pytest.raises(ApiError):
+                asyncio.run(__run())
+
+            m.put("http://localhost/v4/foo/bar/3", json={"id": 3})
+
+            assert asyncio.run(__run()) == [{"id": i} for i in range(10)]
+
+    def test_iter_items(self, operations, config_file):
+        client = LinodeClient(token="explicittoken")
+
+        with requests_mock.Mocker() as m:
+            for page in (1, 2):
+                m.get(
+                    f"http://localhost/v4/foo/bar?page={page}&page_size=500",
+                    json={"data": [{"id": page}], "page": page, "pages": 2},
+                )
+
+            items = client.iter_items("foo", "list", filterable_result="value")
+
+            # Pages are only requested as they're needed
+            assert next(items) == {"id": 1}
+            assert m.call_count == 1
+
+            assert list(items) == [{"id": 2}]
+
+        assert all(
+            r.headers["Authorization"] == "Bearer explicittoken"
+            and json.loads(r.headers["X-Filter"])
+            == {"filterable_result": "value"}
+            for r in m.request_history
+        )
+
+    def test_api_error(self, operations, config_file):
+        client = LinodeClient()
+
+        with requests_mock.Mocker() as m:
+            m.get(
+                "http://localhost/v4/foo/bar?page=1&page_size=500",
+                status_code=400,
+                json={"errors": [{"field": "label", "reason": "Bad label"}]},
+            )
+
+            with pytest.raises(ApiError) as e:
+                list(client.iter_items("foo", "list"))
+
+        assert e.value.status_code == 400
+        assert e.value.errors == [{"field": "label", "reason": "Bad label"}]
+        assert str(e.value) == "Request failed: 400 (label: Bad label)"
+
+    @pytest.mark.parametrize(
+        "command,action,params,kwargs",
+        [
+            ("foo", "missing", (), {}),
+            ("foo", "list", (), {"not_an_arg": 1}),
+            ("foo", "list", (), {"order_by": "not_an_arg"}),
+            ("foo", "update", (), {}),
+        ],
+    )
+    def test_invalid_arguments(
+        self, operations, config_file, command, action, params, kwargs
+    ):
+        client = LinodeClient()
+
+        with requests_mock.Mocker() as m, pytest.raises(ArgumentError):
+            client.call(command, action, *params, **kwargs)
+
+        assert not m.called
+
+    def test_token_precedence(self, operations, config_file, monkeypatch):
+        monkeypatch.setenv("LINODE_CLI_TOKEN", "envtoken")
+
+        assert LinodeClient()._cli.config.get_token() == "envtoken"
+        assert (
+            LinodeClient(user="testuser")._cli.config.get_token()
+            == "notafaketoken"
+        )
+        assert (
+            LinodeClient(token="explicittoken")._cli.config.get_token()
+            == "explicittoken"
+        )
+
+    def test_explicit_token_isolated(self, operations, config_file):
+        config = LinodeClient(token="explicittoken")._cli.config
+
+        # The default user's settings don't apply to an explicit token
+        assert config.username == "linode-cli-client"
+        assert config.get_value("region") is None
+
+        config = LinodeClient(
+            token="explicittoken", user="testuser"
+        )._cli.config
+
+        assert config.get_token() == "explicittoken"
+        assert config.get_value("region") == "us-southeast"
+
+    def test_not_configured(self, operations, config_file):
+        config_file.write_text("")
+
+        with pytest.raises(ConfigurationError):
+            LinodeClient()
+
+        with pytest.raises(ConfigurationError):
+            LinodeClient(user="testuser")
@@ -0,0 +1,208 @@
+"""
+Unit tests for linodecli.fanout
+"""
+
+import functools
+import io
+import json
+
+import pytest
+import requests_mock
+
+from linodecli import fanout
+from linodecli.exit_codes import ExitCodes
+from linodecli.output.output_handler import OutputMode
+
+
+@pytest.fixture
+def fanout_cli(mock_cli, list_operation, update_operation, monkeypatch):
+    """
+    A CLI that can run the test operations, and prints responses to
+    mock_cli.output.
+    """
+    mock_cli.ops = {"foo": {"list": list_operation, "update": update_operation}}
+    mock_cli.output = io.StringIO()
+
+    monkeypatch.setattr(
+        mock_cli.output_handler,
+        "print_response",
+        functools.partial(
+            mock_cli.output_handler.print_response, to=mock_cli.output
+        ),
+    )
+
+    return mock_cli
+
+
+def _run(ctx, ids, args=None, parallel=1, action="update"):
+    with pytest.raises(SystemExit) as err:
+        fanout.handle_command_ids(
+            ctx, "foo", action, args or [], ids, parallel=parallel
+        )
+
+    return err.value.code
+
+
+class TestFanout:
+    """
+    Unit tests for linodecli.fanout
+    """
+
+    def test_read_ids(self, tmp_path, monkeypatch):
+        assert fanout.read_ids("1,2, 3", None) == ["1", "2", "3"]
+
+        path = tmp_path / "ids"
+        path.write_text("4\n5 6,7\n\n")
+        assert fanout.read_ids("1", str(path)) == ["1", "4", "5", "6", "7"]
+
+        monkeypatch.setattr("sys.stdin", io.StringIO("8\n9\n"))
+        assert fanout.read_ids(None, "-") == ["8", "9"]
+
+    def test_read_ids_missing_file(self, tmp_path):
+        with pytest.raises(SystemExit) as err:
+            fanout.read_ids(None, str(tmp_path / "missing"))
+
+        assert err.value.code == ExitCodes.FILE_ERROR
+
+    def test_parse_args(self, update_operation):
+        parsed, args = fanout.parse_args(
+            ["--ids", "1,2", "--generic_arg", "foo", "--parallel=3"],
+            update_operation,
+        )
+
+        assert (parsed.ids, parsed.ids_from, parsed.parallel) == (
+            "1,2",
+            None,
+            3,
+        )
+        assert args == ["--generic_arg", "foo"]
+
+        parsed, args = fanout.parse_args(["123", "--id", "4"], update_operation)
+
+        assert parsed.ids is None
+        assert args == ["123", "--id", "4"]
+
+    def test_parse_args_operation_options(self, update_operation, monkeypatch):
+        # An operation's own arguments take precedence
+        monkeypatch.setattr(
+            type(update_operation), "get_option_strings", lambda _: ["--ids"]
+        )
+
+        parsed, args = fanout.parse_args(
+            ["123", "--ids", "4", "--ids-from", "-"], update_operation
+        )
+
+        assert (parsed.ids, parsed.ids_from) == (None, "-")
+        assert args == ["123", "--ids", "4"]
+
+    @pytest.mark.parametrize(
+        "args", [["--ids", "1", "--parallel", "0"], ["123", "--parallel", "2"]]
+    )
+    def test_parse_args_invalid_parallel(self, args, capsys):
+        with pytest.raises(SystemExit) as err:
+            fanout.parse_args(args)
+
+        assert err.value.code == ExitCodes.ARGUMENT_ERROR
+        assert "--parallel" in capsys.readouterr().err
+
+    def test_get_id_param(self, list_operation, update_operation):
+        assert fanout.get_id_param(update_operation).name == "barId"
+        assert fanout.get_id_param(list_operation) is None
+
+    @pytest.mark.parametrize(
+        "name,param_type,expected",
+        [
+            ("id", "string", True),
+            ("linodeId", "string", True),
+            ("clusterId", "string", True),
+            ("count", "integer", True),
+            ("uuid", "string", False),
+            ("paid", "string", False),
+            ("label", "string", False),
+        ],
+    )
+    def test_get_id_param_names(
+        self, update_operation, monkeypatch, name, param_type, expected
+    ):
+        param = update_operation.params[0]
+        monkeypatch.setattr(param, "name", name)
+        monkeypatch.setattr(param, "type", param_type)
+
+        assert (fanout.get_id_param(update_operation) is param) == expected
+
+    @pytest.mark.parametrize("parallel", [1, 4])
+    def test_handle_command_ids(self, fanout_cli, capsys, parallel):
+        with requests_mock.Mocker() as m:
+            for i in range(10):
+                m.put(
+                    f"http://localhost/v4/foo/bar/{i}",
+                    json={"filterable_result": f"foo{i}"},
+                )
+
+            status = _run(
+                fanout_cli,
+                [str(i) for i in range(10)],
+                ["--generic_arg", "foo"],
+                parallel=parallel,
+            )
+
+        assert status == ExitCodes.SUCCESS
+        assert sorted(r.url for r in m.request_history) == sorted(
+            f"http://localhost/v4/foo/bar/{i}" for i in range(10)
+        )
+        assert all(r.json()["generic_arg"] == "foo" for r in m.request_history)
+
+        # The results for every ID are printed in one table, in the order
+        # the IDs were given
+        output = fanout_cli.output.getvalue()
+        assert output.count("filterable_result") == 1
+        assert [output.index(f"foo{i} ") for i in range(10)] == sorted(
+            output.index(f"foo{i} ") for i in range(10)
+        )
+
+        assert "10 succeeded, 0 failed" in capsys.readouterr().err
+
+    def test_handle_command_ids_failures(self, fanout_cli, capsys):
+        with requests_mock.Mocker() as m:
+            m.put("http://localhost/v4/foo/bar/1", json={})
+            m.put(
+                "http://localhost/v4/foo/bar/2",
+                status_code=404,
+                json={"errors": [{"reason": "Not found"}]},
+            )
+
+            status = _run(fanout_cli, ["1", "2"], parallel=2)
+
+        assert status == ExitCodes.REQUEST_FAILED
+
+        captured = capsys.readouterr()
+        assert "1  succeeded" in captured.err
+        assert "2  failed (404: Not found)" in captured.err
+        assert "1 succeeded, 1 failed" in captured.err
+
+    def test_handle_command_ids_no_id_param(self, fanout_cli, capsys):
+        assert _run(fanout_cli, ["1"], action="list") == (
+            ExitCodes.ARGUMENT_ERROR
+        )
+        assert "does not take an ID" in capsys.readouterr().err
+
+    def test_handle_command_ids_no_ids(self, fanout_cli):
+        assert _run(fanout_cli, []) == ExitCodes.ARGUMENT_ERROR
+
+    def test_handle_command_ids_json(self, fanout_cli):
+        fanout_cli.output_handler.mode = OutputMode.json
+
+        with requests_mock.Mocker() as m:
+            for i in range(3):
+                m.put(
+                    f"http://localhost/v4/foo/bar/{i}",
+                    json={"filterable_result": f"foo{i}"},
+                )
+
+            status = _run(fanout_cli, ["0", "1", "2"], parallel=3)
+
+        assert status == ExitCodes.SUCCESS
+        assert [
+            r["filterable_result"]
+            for r in json.loads(fanout_cli.output.getvalue())
+        ] == ["foo0", "foo1", "foo2"]
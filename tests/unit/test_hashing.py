@@ -0,0 +1,106 @@
+"""
+Unit tests for linodecli.baked.hashing
+"""
+
+import copy
+import os
+
+import pytest
+from yaml import safe_load
+
+from linodecli.baked import hashing
+from linodecli.baked.hashing import hash_path_items, source_digest
+from linodecli.baked.paths import bake_path
+from tests.unit.conftest import open_fixture
+
+
+@pytest.fixture
+def bake_spec():
+    """
+    Returns the parsed multi-command test spec.
+    """
+    with open_fixture("cli_test_bake.yaml") as f:
+        return safe_load(f)
+
+
+class TestHashing:
+    """
+    Unit tests for linodecli.baked.hashing
+    """
+
+    def test_hash_path_items(self, bake_spec):
+        result = hash_path_items(bake_spec)
+
+        assert list(result) == ["/foo", "/foo/{fooId}", "/bar"]
+        assert len(set(result.values())) == 3
+
+        # Hashes should be stable between runs
+        assert hash_path_items(copy.deepcopy(bake_spec)) == result
+
+    def test_path_change(self, bake_spec):
+        original = hash_path_items(bake_spec)
+
+        bake_spec["paths"]["/bar"]["get"]["summary"] = "List some bars"
+        result = hash_path_items(bake_spec)
+
+        assert result["/foo"] == original["/foo"]
+        assert result["/foo/{fooId}"] == original["/foo/{fooId}"]
+        assert result["/bar"] != original["/bar"]
+
+    def test_ref_change(self, bake_spec):
+        original = hash_path_items(bake_spec)
+
+        bake_spec["components"]["schemas"]["Foo"]["description"] = "Changed"
+        result = hash_path_items(bake_spec)
+
+        assert result["/foo"] != original["/foo"]
+        assert result["/foo/{fooId}"] != original["/foo/{fooId}"]
+        assert result["/bar"] == original["/bar"]
+
+    def test_transitive_ref_change(self, bake_spec):
+        original = hash_path_items(bake_spec)
+
+        # Foo references Bar, so every path should change
+        bake_spec["components"]["schemas"]["Bar"]["description"] = "Changed"
+        result = hash_path_items(bake_spec)
+
+        for path, digest in result.items():
+            assert digest != original[path]
+
+    def test_unreferenced_change(self, bake_spec):
+        original = hash_path_items(bake_spec)
+
+        bake_spec["info"]["version"] = "1.2.4"
+        bake_spec["components"]["schemas"]["Unused"] = {"type": "string"}
+
+        assert hash_path_items(bake_spec) == original
+
+    def test_salt(self, bake_spec):
+        original = hash_path_items(bake_spec)
+        result = hash_path_items(bake_spec, salt="5.0.0")
+
+        for path, digest in result.items():
+            assert digest != original[path]
+
+    def test_circular_refs(self, bake_spec):
+        bake_spec["components"]["schemas"]["Bar"]["properties"]["foo"] = {
+            "$ref": "#/components/schemas/Foo"
+        }
+
+        result = hash_path_items(bake_spec)
+        assert len(result) == 3
+
+    def test_source_digest(self, tmp_path, monkeypatch):
+        # The logic deciding which operations a path produces must be
+        # covered by the digest
+        assert os.path.dirname(bake_path.__code__.co_filename) == (
+            os.path.dirname(hashing.__file__)
+        )
+
+        digest = source_digest()
+        assert source_digest() == digest
+
+        (tmp_path / "paths.py").write_text("METHODS = ()\n")
+        monkeypatch.setattr(hashing, "__file__", str(tmp_path / "hashing.py"))
+
+        assert source_digest() != digest
@@ -267,6 +267,26 @@ class TestHelpPages:
 
         assert "Action not found for command foo: fake" in stderr_buf.getvalue()
 
+    def test_action_help_ids(
+        self,
+        capsys,
+        mock_cli: CLI,
+        list_operation: OpenAPIOperation,
+        update_operation: OpenAPIOperation,
+    ):
+        mock_cli.ops = {
+            "foo": {"list": list_operation, "update": update_operation}
+        }
+
+        help_pages.print_help_action(mock_cli, "foo", "update")
+        assert (
+            "Use --ids or --ids-from instead of BARID"
+            in capsys.readouterr().out
+        )
+
+        help_pages.print_help_action(mock_cli, "foo", "list")
+        assert "--ids" not in capsys.readouterr().out
+
     def test_action_help_post_method(self, capsys, mocker, mock_cli):
         mocked_ops = mocker.MagicMock()
         mocked_ops.summary = "test summary"
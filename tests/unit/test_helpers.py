@@ -1,6 +1,12 @@
+import random
+import threading
+import time
 from argparse import ArgumentParser
 
+import pytest
+
 from linodecli.helpers import (
+    map_ordered,
     register_args_shared,
     register_pagination_args_shared,
 )
@@ -31,3 +37,48 @@ class TestHelpers:
         )
         assert args.as_user == "linode-user"
         assert args.suppress_warnings
+
+    @pytest.mark.parametrize("parallel", [1, 4])
+    def test_map_ordered(self, parallel):
+        def __slow_square(v):
+            time.sleep(random.random() / 100)
+            return v * v
+
+        assert list(map_ordered(__slow_square, range(20), parallel)) == [
+            v * v for v in range(20)
+        ]
+
+    def test_map_ordered_bounded(self):
+        read = []
+
+        def __items():
+            for i in range(100):
+                read.append(i)
+                yield i
+
+        results = map_ordered(lambda v: v, __items(), 4)
+
+        assert next(results) == 0
+        results.close()
+
+        # Only a bounded number of items are read ahead of the results
+        assert len(read) == 5
+
+    def test_map_ordered_error(self):
+        started = []
+        lock = threading.Lock()
+
+        def __fail_on_first(v):
+            with lock:
+                started.append(v)
+
+            if v == 0:
+                raise ValueError("failed")
+
+            return v
+
+        with pytest.raises(ValueError):
+            list(map_ordered(__fail_on_first, range(100), 4))
+
+        # No more calls are started once an error is reached
+        assert len(started) <= 5
@@ -0,0 +1,82 @@
+"""
+Unit tests for the import-time cost of the linodecli entry point
+"""
+
+import os
+import re
+import subprocess
+import sys
+from typing import Dict
+
+import pytest
+
+# The maximum cumulative time (in microseconds) importing the linodecli
+# package may take.  This is intentionally generous to account for slow
+# CI runners; the modules checked below are the stricter guard.
+IMPORT_TIME_BUDGET_US = 250_000
+
+# Modules that should never be imported when a command does not need them
+DEFERRED_MODULES = ("openapi3", "yaml", "rich", "requests", "packaging")
+
+# e.g. "import time:       465 |     117304 |   requests"
+IMPORT_TIME_LINE = re.compile(r"^import time:\s+\d+\s+\|\s+(\d+)\s+\|\s+(\S+)$")
+
+
+def _run_importtime(*args: str) -> Dict[str, int]:
+    """
+    Runs the CLI with -X importtime and returns a mapping of each imported
+    module to its cumulative import time in microseconds.
+    """
+    env = dict(os.environ)
+    env["LINODE_CLI_TEST_MODE"] = "1"
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "linodecli", *args],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    assert result.returncode == 0, result.stderr
+
+    modules = {}
+
+    for line in result.stderr.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match is None:
+            continue
+
+        cumulative, name = match.groups()
+        modules.setdefault(name, int(cumulative))
+
+    return modules
+
+
+@pytest.fixture(scope="module")
+def version_imports() -> Dict[str, int]:
+    """
+    Returns the modules imported when running `linode-cli --version`.
+    """
+    return _run_importtime("--version")
+
+
+class TestImports:
+    """
+    Unit tests for the import-time cost of the linodecli entry point
+    """
+
+    def test_version_skips_deferred_modules(self, version_imports):
+        imported = {name.split(".")[0] for name in version_imports}
+
+        for module in DEFERRED_MODULES:
+            assert module not in imported, f"{module} imported for --version"
+
+        assert "linodecli.overrides" not in version_imports
+
+    def test_version_import_time_budget(self, version_imports):
+        assert "linodecli" in version_imports
+        assert version_imports["linodecli"] < IMPORT_TIME_BUDGET_US, (
+            f"Importing linodecli took {version_imports['linodecli']}us, "
+            f"which exceeds the budget of {IMPORT_TIME_BUDGET_US}us"
+        )
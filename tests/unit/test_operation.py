@@ -2,6 +2,9 @@ import argparse
 import contextlib
 import io
 import json
+import pickle
+
+import pytest
 
 from linodecli.baked import operation
 from linodecli.baked.operation import (
@@ -247,6 +250,79 @@ class TestOperation:
             in stderr_result
         )
 
+    def test_parse_args_reuses_parser(self, create_operation):
+        result = create_operation.parse_args(
+            [
+                "--object_list.field_string",
+                "test1",
+                "--object_list.field_string",
+                "test2",
+            ]
+        )
+        assert [v["field_string"] for v in result.object_list] == [
+            "test1",
+            "test2",
+        ]
+
+        parser, _ = create_operation._get_parser()
+
+        # No state should leak between calls using the same parser
+        result = create_operation.parse_args(["--region", "us-east"])
+        assert create_operation._get_parser()[0] is parser
+        assert result.region == "us-east"
+        assert getattr(result, "object_list.field_string") is None
+
+        # The cached parser should never be pickled
+        unpickled = pickle.loads(pickle.dumps(create_operation))
+        assert not hasattr(unpickled, "_parser")
+        assert unpickled.parse_args(["--region", "us-east"]).region == "us-east"
+
+    def test_parse_args_order_requires_order_by(self, list_operation):
+        result = list_operation.parse_args(
+            ["--order-by", "filterable_result", "--order", "desc"]
+        )
+        assert result.order_by == "filterable_result"
+        assert result.order == "desc"
+
+        stderr_buf = io.StringIO()
+
+        with (
+            contextlib.redirect_stderr(stderr_buf),
+            pytest.raises(SystemExit),
+        ):
+            list_operation.parse_args(["--order", "desc"])
+
+        assert "required: --order-by" in stderr_buf.getvalue()
+
+        # --order-by is only required when --order is given
+        assert list_operation.parse_args([]).order_by is None
+
+    def test_list_arg_action_adjacent_keys(self):
+        """
+        Tests that precomputed adjacent keys produce the same result
+        as searching the namespace.
+        """
+
+        parser = argparse.ArgumentParser(
+            prog=f"foo",
+        )
+
+        keys = ["foo.foo", "foo.bar"]
+
+        for key in keys:
+            parser.add_argument(
+                f"--{key}",
+                action=operation.ListArgumentAction,
+                adjacent_keys=keys,
+                type=str,
+            )
+
+        result = parser.parse_args(
+            ["--foo.foo", "cool", "--foo.foo", "test", "--foo.bar", "wow"]
+        )
+        assert getattr(result, "foo.foo") == ["cool", "test"]
+        assert getattr(result, "foo.bar") == [None, "wow"]
+
     def test_array_arg_action_basic(self):
         """
         Tests a basic array argument condition..
@@ -1,11 +1,15 @@
+import argparse
 import io
 import json
 
+import pytest
 from rich import box
 from rich import print as rprint
 from rich.table import Table
 
 from linodecli import OutputMode
+from linodecli.arg_helpers import register_args
+from linodecli.output import output_handler
 
 
 class TestOutputHandler:
@@ -31,6 +35,71 @@ class TestOutputHandler:
 
         assert '[{"foo": "cool", "bar": "not cool"}]' in output.getvalue()
 
+    @pytest.mark.parametrize("pretty", [False, True])
+    @pytest.mark.parametrize(
+        "data",
+        [
+            [],
+            [{"foo": "cool", "bar": {"baz": [1, 2]}}],
+            [{"foo": "cool", "bar": {}}, {"foo": "line\nbreak", "bar": None}],
+        ],
+    )
+    def test_json_output_iterator(self, mock_cli, pretty, data):
+        output = io.StringIO()
+        mock_cli.output_handler.pretty_json = pretty
+
+        mock_cli.output_handler._json_output(["foo", "bar"], iter(data), output)
+
+        # Streamed output should match dumping the whole list at once
+        assert output.getvalue() == (
+            json.dumps(
+                data,
+                indent=2 if pretty else None,
+                sort_keys=pretty,
+            )
+            + "\n"
+        )
+
+    def test_ndjson_output(self, mock_cli):
+        output = io.StringIO()
+        headers = ["foo", "bar"]
+        data = [
+            {"foo": "cool", "bar": {"baz": 1}, "other": True},
+            {"foo": "line\nbreak", "bar": None},
+        ]
+
+        mock_cli.output_handler._ndjson_output(headers, iter(data), output)
+
+        assert output.getvalue() == (
+            '{"foo":"cool","bar":{"baz":1}}\n'
+            '{"foo":"line\\nbreak","bar":null}\n'
+        )
+
+    def test_ndjson_output_flush(self, mock_cli, monkeypatch):
+        monkeypatch.setattr(output_handler, "NDJSON_FLUSH_ROWS", 2)
+
+        output = io.StringIO()
+        flushed = []
+        output.flush = lambda: flushed.append(output.getvalue().count("\n"))
+
+        mock_cli.output_handler._ndjson_output(
+            ["foo"], [{"foo": i} for i in range(5)], output
+        )
+
+        assert flushed == [2, 4, 5]
+
+    def test_ndjson_configure(self, mock_cli):
+        parser = register_args(argparse.ArgumentParser(add_help=False))
+
+        handler = mock_cli.output_handler
+        handler.configure(
+            parser.parse_args(["--jsonl", "--pretty", "--format", "foo"])
+        )
+
+        assert handler.mode == OutputMode.ndjson
+        assert not handler.pretty_json
+        assert handler.columns == "foo"
+
     def test_select_json_elements(self, mock_cli):
         desired_keys = ["foo", "bar", "test"]
 
@@ -520,6 +589,25 @@ class TestOutputHandler:
         for i, line in enumerate(lines):
             assert line in output[i]
 
+    def test_supports_streaming(
+        self, mock_cli, get_operation_for_subtable_test
+    ):
+        handler = mock_cli.output_handler
+        response_model = get_operation_for_subtable_test.response_model
+
+        handler.mode = OutputMode.table
+        assert not handler.supports_streaming(response_model)
+
+        # Subtables are ignored in JSON output
+        handler.mode = OutputMode.json
+        assert handler.supports_streaming(response_model)
+
+        handler.mode = OutputMode.delimited
+        assert not handler.supports_streaming(response_model)
+
+        handler.single_table = True
+        assert handler.supports_streaming(response_model)
+
     def test_print_subtable_with_selection(
         self, mock_cli, get_operation_for_subtable_test
     ):
@@ -37,7 +37,7 @@ class TestOverrides:
 
         with (
             patch(
-                "linodecli.baked.operation.OUTPUT_OVERRIDES",
+                "linodecli.overrides.OUTPUT_OVERRIDES",
                 {override_signature: patch_func},
             ),
             patch.object(mock_cli.output_handler, "print") as p,
@@ -0,0 +1,67 @@
+"""
+Unit tests for linodecli.profiling
+"""
+
+import io
+import os
+import pstats
+
+import pytest
+
+from linodecli import profiling
+
+
+class TestProfiling:
+    """
+    Unit tests for linodecli.profiling
+    """
+
+    @pytest.mark.parametrize(
+        "args,expected",
+        [
+            (["linode-cli", "linodes", "list"], (None, False)),
+            (["linode-cli", "--profile", "linodes", "list"], ("", False)),
+            (
+                ["linode-cli", "linodes", "list", "--profile=out.prof"],
+                ("out.prof", False),
+            ),
+            (
+                ["linode-cli", "--profile-memory", "linodes", "list"],
+                (None, True),
+            ),
+        ],
+    )
+    def test_parse_args(self, args, expected):
+        path, memory, remaining = profiling.parse_args(args)
+
+        assert (path, memory) == expected
+        assert remaining == ["linode-cli", "linodes", "list"]
+
+    def test_profile(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        output = io.StringIO()
+
+        profiling.start("", memory=True)
+        profiling.set_context("linodes", "list")
+        sorted(str(i) for i in range(10000))
+        profiling.stop(file=output)
+
+        (path,) = os.listdir(tmp_path)
+        assert path.startswith("linode-cli-linodes-list-")
+        assert path.endswith(".prof")
+
+        stats = pstats.Stats(str(tmp_path / path))
+        assert any(
+            func[2] == "<built-in method builtins.sorted>"
+            for func in stats.stats
+        )
+
+        lines = output.getvalue().splitlines()
+        assert lines[0] == (
+            f"Wrote profile of `linode-cli linodes list` to {path}; "
+            f"view it with `python3 -m pstats {path}`"
+        )
+        assert lines[1].startswith(
+            "Peak memory usage of `linode-cli linodes list`: "
+        )
+        assert lines[2] == "Largest allocations:"
@@ -0,0 +1,175 @@
+"""
+Unit tests for linodecli.rate_limit
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+import requests
+
+from linodecli import rate_limit
+from linodecli.helpers import get_cache_dir
+
+KEY = rate_limit.get_key("token", "localhost", "linode/instances")
+
+
+def _make_response(status_code: int = 200, **headers):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers)
+    return response
+
+
+def _report(limit: int, remaining: int, reset_in: float):
+    rate_limit.update(
+        KEY,
+        _make_response(
+            **{
+                "X-RateLimit-Limit": str(limit),
+                "X-RateLimit-Remaining": str(remaining),
+                "X-RateLimit-Reset": str(int(time.time() + reset_in)),
+            }
+        ),
+    )
+
+
+def _acquire_many(count: int):
+    for _ in range(count):
+        rate_limit.acquire(KEY)
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """
+    Records calls to time.sleep rather than sleeping.
+    """
+    result = []
+    monkeypatch.setattr(rate_limit.time, "sleep", result.append)
+    return result
+
+
+class TestRateLimit:
+    """
+    Unit tests for linodecli.rate_limit
+    """
+
+    def test_acquire_unknown(self, sleeps):
+        assert rate_limit.acquire(KEY) == 0
+
+        assert not os.path.exists(
+            get_cache_dir(rate_limit.RATE_LIMIT_DIR, create=False)
+        )
+        assert not sleeps
+
+    def test_update_no_headers(self):
+        rate_limit.update(KEY, _make_response())
+
+        assert not os.listdir(get_cache_dir(rate_limit.RATE_LIMIT_DIR))
+
+    def test_acquire_remaining(self, sleeps):
+        _report(limit=100, remaining=50, reset_in=60)
+
+        for _ in range(10):
+            rate_limit.acquire(KEY)
+
+        assert not sleeps
+
+    def test_acquire_paced(self, sleeps):
+        _report(limit=100, remaining=3, reset_in=30)
+
+        for _ in range(3):
+            rate_limit.acquire(KEY)
+
+        # The remaining requests are spread over the rest of the window
+        assert len(sleeps) == 2
+        assert all(5 < v <= 30 for v in sleeps)
+
+    def test_acquire_exhausted(self, sleeps):
+        rate_limit.update(KEY, _make_response(429, **{"Retry-After": "10"}))
+
+        rate_limit.acquire(KEY)
+
+        assert len(sleeps) == 1
+        assert 9 < sleeps[0] <= 10
+
+    def test_acquire_beyond_max_wait(self, sleeps, monkeypatch):
+        monkeypatch.setattr(rate_limit, "MAX_WAIT", 5)
+
+        # Only one more request is allowed in the next 12 seconds
+        _report(limit=100, remaining=1, reset_in=12)
+
+        # The next slot is then 12 seconds away, too far to reserve, so
+        # nothing is reserved and the caller should try again later
+        rate_limit.acquire(KEY)
+        assert rate_limit.reserve(KEY) is None
+
+        state = rate_limit._read_state(rate_limit._state_path(KEY))
+        assert state["remaining"] == 0
+        assert state["next"] > time.time() + rate_limit.MAX_WAIT
+
+        # Once the slot is within MAX_WAIT it is reserved and waited for,
+        # rather than the request being sent before its slot
+        sleeps.clear()
+        monkeypatch.setattr(
+            rate_limit.time, "time", lambda now=time.time(): now + 8
+        )
+        rate_limit.acquire(KEY)
+
+        assert len(sleeps) == 1
+        assert 0 < sleeps[0] <= rate_limit.MAX_WAIT
+
+    def test_acquire_waits_past_max_wait(self, sleeps, monkeypatch):
+        monkeypatch.setattr(rate_limit, "MAX_WAIT", 5)
+
+        slots = iter([None, None, 2.0])
+        monkeypatch.setattr(rate_limit, "reserve", lambda key: next(slots))
+
+        assert rate_limit.acquire(KEY) == 12.0
+        assert sleeps == [5, 5, 2.0]
+
+    def test_acquire_expired(self, sleeps, monkeypatch):
+        _report(limit=100, remaining=0, reset_in=30)
+
+        path = rate_limit._state_path(KEY)
+        state = rate_limit._read_state(path)
+
+        # Once the reported window has passed, nothing is reserved or
+        # written until the API reports the rate limit again
+        monkeypatch.setattr(
+            rate_limit.time, "time", lambda now=time.time(): now + 31
+        )
+        monkeypatch.setattr(rate_limit, "_locked", None)
+
+        assert rate_limit.acquire(KEY) == 0
+        assert rate_limit._read_state(path) == state
+        assert not sleeps
+
+    def test_disabled(self, sleeps, monkeypatch):
+        monkeypatch.setenv(rate_limit.ENV_NO_RATE_LIMIT, "1")
+
+        rate_limit.update(KEY, _make_response(429, **{"Retry-After": "10"}))
+        assert rate_limit.acquire(KEY) == 0
+
+        assert not os.path.exists(
+            get_cache_dir(rate_limit.RATE_LIMIT_DIR, create=False)
+        )
+        assert not sleeps
+
+    def test_update_out_of_order(self):
+        _report(limit=100, remaining=40, reset_in=60)
+        _report(limit=100, remaining=45, reset_in=60)
+
+        state = rate_limit._read_state(rate_limit._state_path(KEY))
+        assert state["remaining"] == 40
+
+    def test_acquire_processes(self, sleeps):
+        _report(limit=100, remaining=100, reset_in=600)
+
+        with ProcessPoolExecutor(max_workers=4) as executor:
+            list(executor.map(_acquire_many, [10] * 4))
+
+        # Every process should have reserved a request from the shared state
+        state = rate_limit._read_state(rate_limit._state_path(KEY))
+        assert state["remaining"] == 60
@@ -0,0 +1,154 @@
+"""
+Unit tests for linodecli.response_cache
+"""
+
+import os
+
+import pytest
+import requests
+
+from linodecli import response_cache
+from linodecli.helpers import get_cache_dir
+
+
+def _make_response(body: bytes, url: str = "http://localhost/v4/foo"):
+    response = requests.Response()
+    response.status_code = 200
+    response.reason = "OK"
+    response.url = url
+    response.headers["ETag"] = '"a"'
+    response._content = body
+    return response
+
+
+class TestResponseCache:
+    """
+    Unit tests for linodecli.response_cache
+    """
+
+    @pytest.mark.parametrize(
+        "url_path,expected",
+        [
+            ("/{apiVersion}/linode/instances", "linode/instances"),
+            ("/{apiVersion}/linode/instances/{linodeId}", "linode/instances"),
+            (
+                "/{apiVersion}/linode/instances/{linodeId}/disks",
+                "linode/instances",
+            ),
+            ("/{apiVersion}/domains/{domainId}/records", "domains"),
+            ("/{apiVersion}/networking/ips/assign", "networking/ips"),
+            ("/{apiVersion}/regions", "regions"),
+        ],
+    )
+    def test_get_resource(self, url_path, expected):
+        assert response_cache.get_resource(url_path) == expected
+
+    def test_get_key(self):
+        key = response_cache.get_key("token", "http://localhost/v4/foo", None)
+
+        assert key != response_cache.get_key(
+            "token2", "http://localhost/v4/foo", None
+        )
+        assert key != response_cache.get_key(
+            "token", "http://localhost/v4/foo", '{"label": "cool"}'
+        )
+
+    def test_store_load(self):
+        response_cache.store("foo", "key", _make_response(b'{"id": 123}'))
+
+        cached = response_cache.load("foo", "key")
+
+        assert cached.is_fresh(60)
+        assert cached.get_validators() == {"If-None-Match": '"a"'}
+
+        response = cached.to_response()
+        assert response.status_code == 200
+        assert response.headers["etag"] == '"a"'
+        assert response.json() == {"id": 123}
+
+        assert response_cache.load("foo", "other") is None
+
+    def test_invalidate(self):
+        response_cache.store("linode", "a", _make_response(b"{}"))
+        response_cache.store("linode/instances", "b", _make_response(b"{}"))
+        response_cache.store("regions", "c", _make_response(b"{}"))
+
+        response_cache.invalidate("linode")
+
+        assert response_cache.load("linode", "a") is None
+        assert response_cache.load("linode/instances", "b") is None
+        assert response_cache.load("regions", "c") is not None
+
+    def test_prune(self, monkeypatch):
+        monkeypatch.setattr(response_cache, "MAX_RESPONSE_CACHE_SIZE", 1024)
+
+        body = b"[" + b" " * 300 + b"]"
+
+        for i in range(4):
+            response_cache.store("foo", str(i), _make_response(body))
+            os.utime(
+                os.path.join(get_cache_dir("responses", "foo"), f"{i}.json"),
+                (i, i),
+            )
+
+        response_cache.store("foo", "4", _make_response(body))
+
+        remaining = sorted(os.listdir(get_cache_dir("responses", "foo")))
+        assert remaining == ["3.json", "4.json"]
+
+    def test_prune_only_when_full(self, monkeypatch):
+        monkeypatch.setattr(response_cache, "MAX_RESPONSE_CACHE_SIZE", 2048)
+
+        prunes = []
+        prune = response_cache._prune
+
+        def _prune():
+            prunes.append(True)
+            prune()
+
+        monkeypatch.setattr(response_cache, "_prune", _prune)
+
+        body = b"[" + b" " * 300 + b"]"
+
+        # The first store finds the size of the cache; after that it's
+        # tracked without walking the cache until it grows too large
+        for i in range(3):
+            response_cache.store("foo", str(i), _make_response(body))
+
+        assert len(prunes) == 1
+
+        # Replacing a response doesn't count its size twice
+        response_cache.store("foo", "0", _make_response(body))
+        assert len(prunes) == 1
+
+        for i in range(3, 6):
+            response_cache.store("foo", str(i), _make_response(body))
+
+        assert len(prunes) > 1
+
+        size = sum(
+            entry.stat().st_size
+            for entry in os.scandir(get_cache_dir("responses", "foo"))
+        )
+        assert size <= 2048
+
+        with open(
+            os.path.join(get_cache_dir("responses"), ".size"),
+            encoding="utf-8",
+        ) as f:
+            assert int(f.read()) == size
+
+    def test_invalidate_resets_size(self):
+        response_cache.store("foo", "a", _make_response(b"{}"))
+        response_cache.invalidate("foo")
+
+        assert not os.path.exists(
+            os.path.join(get_cache_dir("responses"), ".size")
+        )
+
+    def test_invalidate_without_cache(self, tmp_path):
+        # Invalidating shouldn't create the cache directory when nothing
+        # has been cached
+        response_cache.invalidate("foo")
+
+        assert not os.path.exists(tmp_path / "cache")
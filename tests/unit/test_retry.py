@@ -0,0 +1,117 @@
+"""
+Unit tests for linodecli.retry
+"""
+
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from linodecli import retry
+from linodecli.retry import RetryPolicy
+
+
+class TestRetryPolicy:
+    """
+    Unit tests for linodecli.retry
+    """
+
+    def test_should_retry_status(self):
+        policy = RetryPolicy()
+
+        mock_response = Mock(status_code=200)
+        assert not policy.should_retry("get", 1, response=mock_response)
+
+        for status in (408, 429, 502, 503, 504):
+            mock_response = Mock(status_code=status)
+            assert policy.should_retry("get", 1, response=mock_response)
+
+        mock_response = Mock(
+            status_code=400,
+            headers={
+                "Server": "nginx",
+                "Content-Type": "text/html",
+            },
+        )
+        assert policy.should_retry("get", 1, response=mock_response)
+
+    def test_should_retry_idempotent(self):
+        policy = RetryPolicy()
+
+        # The API may have processed the request
+        assert not policy.should_retry(
+            "post", 1, response=Mock(status_code=502)
+        )
+        assert not policy.should_retry(
+            "post", 1, error=requests.ConnectionError()
+        )
+
+        # The API has not processed the request
+        assert policy.should_retry("post", 1, response=Mock(status_code=429))
+        assert policy.should_retry("post", 1, error=requests.ConnectTimeout())
+
+        assert policy.should_retry("put", 1, response=Mock(status_code=502))
+        assert policy.should_retry("get", 1, error=requests.ReadTimeout())
+
+        policy = RetryPolicy(retry_non_idempotent=True)
+        assert policy.should_retry("post", 1, response=Mock(status_code=502))
+
+    def test_should_retry_max_attempts(self):
+        policy = RetryPolicy(max_attempts=3)
+        mock_response = Mock(status_code=503)
+
+        assert policy.should_retry("get", 2, response=mock_response)
+        assert not policy.should_retry("get", 3, response=mock_response)
+
+        with pytest.raises(ValueError):
+            RetryPolicy(max_attempts=0)
+
+    def test_get_delay(self, monkeypatch):
+        policy = RetryPolicy(base_delay=1, max_delay=5, jitter=False)
+
+        assert [policy.get_delay(i) for i in range(1, 6)] == [1, 2, 4, 5, 5]
+
+        mock_response = Mock(headers={"Retry-After": "10"})
+        assert policy.get_delay(1, response=mock_response) == 10
+
+        monkeypatch.setattr(retry.random, "uniform", lambda a, b: b / 2)
+        policy = RetryPolicy(base_delay=1, max_delay=5)
+
+        assert policy.get_delay(3) == 2
+
+    def test_get_retry_after(self):
+        headers = {"Retry-After": "10"}
+        output = retry.get_retry_after(headers)
+        assert output == 10
+
+        headers = {"Retry-After": ""}
+        output = retry.get_retry_after(headers)
+        assert output is None
+
+        headers = {}
+        output = retry.get_retry_after(headers)
+        assert output is None
+
+    def test_from_config(self, mock_cli):
+        config = mock_cli.config.config
+        config.set("testuser", "retry_max_attempts", "6")
+        config.set("testuser", "retry_max_delay", "2.5")
+        config.set("testuser", "retry_jitter", "false")
+        config.set("testuser", "retry_statuses", "429, 503")
+
+        policy = RetryPolicy.from_config(mock_cli.config, base_delay=None)
+
+        assert policy == RetryPolicy(
+            max_attempts=6,
+            max_delay=2.5,
+            jitter=False,
+            retry_statuses=frozenset({429, 503}),
+        )
+
+        policy = RetryPolicy.from_config(mock_cli.config, max_attempts=1)
+        assert policy.max_attempts == 1
+
+        config.set("testuser", "retry_base_delay", "soon")
+
+        with pytest.raises(ValueError, match="retry_base_delay"):
+            RetryPolicy.from_config(mock_cli.config)
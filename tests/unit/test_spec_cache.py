@@ -0,0 +1,78 @@
+"""
+Unit tests for linodecli.spec_cache
+"""
+
+import os
+
+import pytest
+import requests_mock
+
+from linodecli import spec_cache
+from linodecli.helpers import get_cache_dir
+
+SPEC_URL = "https://localhost/openapi.yaml"
+
+
+class TestSpecCache:
+    """
+    Unit tests for linodecli.spec_cache
+    """
+
+    def test_fetch_spec_etag(self):
+        with requests_mock.Mocker() as m:
+            m.get(SPEC_URL, content=b"openapi: 3.0.1", headers={"ETag": '"a"'})
+            assert spec_cache.fetch_spec(SPEC_URL) == b"openapi: 3.0.1"
+
+            assert "If-None-Match" not in m.last_request.headers
+
+            m.get(SPEC_URL, status_code=304)
+            assert spec_cache.fetch_spec(SPEC_URL) == b"openapi: 3.0.1"
+
+            assert m.last_request.headers["If-None-Match"] == '"a"'
+
+    def test_fetch_spec_last_modified(self):
+        last_modified = "Wed, 21 Oct 2015 07:28:00 GMT"
+
+        with requests_mock.Mocker() as m:
+            m.get(
+                SPEC_URL,
+                content=b"openapi: 3.0.1",
+                headers={"Last-Modified": last_modified},
+            )
+            spec_cache.fetch_spec(SPEC_URL)
+
+            m.get(SPEC_URL, content=b"openapi: 3.0.2")
+            assert spec_cache.fetch_spec(SPEC_URL) == b"openapi: 3.0.2"
+
+            assert m.last_request.headers["If-Modified-Since"] == last_modified
+
+    def test_fetch_spec_failed(self):
+        with requests_mock.Mocker() as m:
+            m.get(SPEC_URL, status_code=404)
+
+            with pytest.raises(RuntimeError, match="Failed to GET"):
+                spec_cache.fetch_spec(SPEC_URL)
+
+    def test_load_parsed_spec(self):
+        calls = []
+
+        def parse(content):
+            calls.append(content)
+            return {"content": content.decode()}
+
+        assert spec_cache.load_parsed_spec(b"a", parse) == {"content": "a"}
+        assert spec_cache.load_parsed_spec(b"a", parse) == {"content": "a"}
+        assert spec_cache.load_parsed_spec(b"b", parse) == {"content": "b"}
+
+        assert calls == [b"a", b"b"]
+
+    def test_prune_parsed_specs(self, monkeypatch):
+        monkeypatch.setattr(spec_cache, "MAX_PARSED_SPECS", 2)
+
+        for i in range(4):
+            spec_cache.load_parsed_spec(str(i).encode(), lambda c: {})
+
+        cache_dir = get_cache_dir(spec_cache.SPEC_CACHE_DIR)
+        entries = [f for f in os.listdir(cache_dir) if f.endswith(".pickle")]
+
+        assert len(entries) == 2
@@ -0,0 +1,192 @@
+"""
+Unit tests for linodecli.baked.store
+"""
+
+import os
+import pickle
+import struct
+
+import pytest
+
+from linodecli.baked.store import (
+    FORMAT_VERSION,
+    HEADER,
+    MAGIC,
+    BakedCommand,
+    BakedOperations,
+    load_baked_ops,
+)
+from linodecli.cli import CLI
+from tests.unit.conftest import FIXTURES_PATH
+
+BAKE_FIXTURE = os.path.join(FIXTURES_PATH, "cli_test_bake.yaml")
+
+# cli_test_bake.yaml baked by a version of the CLI that pickled every
+# operation into a single dict, before baked objects used __slots__
+LEGACY_BAKE_FIXTURE = os.path.join(FIXTURES_PATH, "cli_test_bake_legacy.data")
+
+
+@pytest.fixture
+def baked_data_path(mock_cli: CLI, tmp_path, monkeypatch) -> str:
+    """
+    Bakes the multi-command test fixture into a temporary directory
+    and returns the path of the resulting data file.
+    """
+    monkeypatch.chdir(tmp_path)
+    mock_cli.bake(BAKE_FIXTURE)
+
+    return str(tmp_path / mock_cli._get_data_file())
+
+
+class TestStore:
+    """
+    Unit tests for linodecli.baked.store
+    """
+
+    def test_header(self, baked_data_path: str):
+        with open(baked_data_path, "rb") as f:
+            magic, version, index_length = HEADER.unpack(f.read(HEADER.size))
+
+        assert magic == MAGIC
+        assert version == FORMAT_VERSION
+        assert index_length > 0
+
+    def test_load_index_only(self, baked_data_path: str):
+        metadata, ops = load_baked_ops(baked_data_path)
+
+        assert metadata["_base_url"] == "http://localhost/v4"
+        assert metadata["_spec_version"] == "1.2.3"
+
+        assert isinstance(ops, BakedOperations)
+        assert set(ops) == {"foo", "bar"}
+        assert "foo" in ops
+        assert "baz" not in ops
+        assert len(ops) == 2
+
+        assert isinstance(ops["foo"], BakedCommand)
+        assert set(ops["foo"]) == {"list", "create", "view", "delete"}
+        assert ops["foo"].aliases == {"show": "view", "rm": "delete"}
+
+        # Nothing should have been unpickled yet
+        assert ops.loaded_operations() == []
+
+    def test_load_single_operation(self, baked_data_path: str):
+        _, ops = load_baked_ops(baked_data_path)
+
+        view = ops["foo"]["view"]
+        assert view.action_aliases == ["show"]
+        assert view.url_path == "/{apiVersion}/foo/{fooId}"
+
+        assert ops.loaded_operations() == [("foo", "view")]
+
+        # Operations should only be unpickled once
+        assert ops["foo"]["view"] is view
+
+        assert ops["bar"]["list"].action == "list"
+        assert ops.loaded_operations() == [("foo", "view"), ("bar", "list")]
+
+    def test_resolve_alias(self, baked_data_path: str):
+        _, ops = load_baked_ops(baked_data_path)
+
+        assert ops["foo"].resolve("rm").action == "delete"
+        assert ops["foo"].resolve("delete").action == "delete"
+        assert ops["foo"].resolve("cool") is None
+
+        assert ops.loaded_operations() == [("foo", "delete")]
+
+    def test_close(self, baked_data_path: str):
+        _, ops = load_baked_ops(baked_data_path)
+        view = ops["foo"]["view"]
+
+        with ops:
+            assert not ops._buffer.closed
+
+        assert ops._buffer.closed
+
+        # Operations loaded before the store was closed remain usable
+        assert view.action == "view"
+
+        with pytest.raises(ValueError):
+            _ = ops["foo"]["list"]
+
+    def test_rebake_closes_previous(
+        self, mock_cli: CLI, baked_data_path: str, monkeypatch
+    ):
+        closed = []
+        close = BakedOperations.close
+
+        def record_close(ops):
+            close(ops)
+            closed.append(ops._buffer.closed)
+
+        monkeypatch.setattr(BakedOperations, "close", record_close)
+
+        mock_cli.bake(BAKE_FIXTURE)
+
+        # The previous bake is closed before its data file is replaced
+        assert closed == [True]
+        assert set(load_baked_ops(baked_data_path)[1]) == {"foo", "bar"}
+
+    def test_unsupported_version(self, baked_data_path: str):
+        with open(baked_data_path, "r+b") as f:
+            f.seek(len(MAGIC))
+            f.write(struct.pack("<H", FORMAT_VERSION + 1))
+
+        with pytest.raises(ValueError, match="Unsupported baked data format"):
+            load_baked_ops(baked_data_path)
+
+    def test_load_legacy(self, mock_cli: CLI, tmp_path):
+        mock_cli.bake(BAKE_FIXTURE, save=False)
+
+        legacy = dict(mock_cli.ops)
+        legacy["_base_url"] = "http://localhost/v4"
+        legacy["_spec_version"] = "1.2.3"
+
+        data_path = tmp_path / "data-legacy"
+        with open(data_path, "wb") as f:
+            pickle.dump(legacy, f)
+
+        metadata, ops = load_baked_ops(str(data_path))
+
+        assert metadata == {
+            "_base_url": "http://localhost/v4",
+            "_spec_version": "1.2.3",
+        }
+        assert set(ops) == {"foo", "bar"}
+        assert ops["foo"]["list"].action == "list"
+
+    def test_load_legacy_fixture(self):
+        metadata, ops = load_baked_ops(LEGACY_BAKE_FIXTURE)
+
+        assert metadata["_base_url"] == "http://localhost/v4"
+        assert set(ops) == {"foo", "bar"}
+
+        operation = ops["foo"]["view"]
+        assert operation.url_path == "/{apiVersion}/foo/{fooId}"
+        assert [p.name for p in operation.params] == ["fooId"]
+        assert [a.name for a in operation.response_model.attrs]
+
+        parsed = operation.parse_args(["123"])
+        assert parsed.fooId == 123
+
+    def test_cli_load_legacy_fixture(self, mock_cli: CLI, monkeypatch):
+        monkeypatch.setattr(
+            mock_cli, "_get_data_file", lambda: LEGACY_BAKE_FIXTURE
+        )
+
+        mock_cli.load_baked()
+
+        assert mock_cli.base_url == "http://localhost/v4"
+        assert mock_cli.find_operation("foo", "show").action == "view"
+        assert mock_cli.spec_version == "1.2.3"
+
+    def test_find_operation_loads_one_operation(
+        self, mock_cli: CLI, baked_data_path: str
+    ):
+        _, mock_cli.ops = load_baked_ops(baked_data_path)
+
+        assert mock_cli.find_operation("foo", "show").action == "view"
+        assert mock_cli.ops.loaded_operations() == [("foo", "view")]
+
+        with pytest.raises(ValueError, match=r"Action not found for command *"):
+            mock_cli.find_operation("foo", "cool")
@@ -0,0 +1,157 @@
+"""
+Unit tests for linodecli.timings
+"""
+
+import functools
+import http.server
+import io
+import threading
+import time
+
+import pytest
+import requests
+import requests_mock
+
+from linodecli import timings
+from linodecli.output.output_handler import OutputMode
+
+
+@pytest.fixture
+def recording(monkeypatch):
+    """
+    Records timings for the duration of a test without printing a summary
+    when the tests exit.
+    """
+    records = []
+    monkeypatch.setattr(timings, "_enabled", True)
+    monkeypatch.setattr(timings, "_start", time.perf_counter())
+    monkeypatch.setattr(timings, "_records", records)
+    return records
+
+
+class TestTimings:
+    """
+    Unit tests for linodecli.timings
+    """
+
+    def test_disabled(self):
+        with timings.phase("outer"):
+            pass
+
+        assert not timings._records
+
+    def test_nested(self, recording):
+        with timings.phase("outer"):
+            time.sleep(0.05)
+
+            with timings.phase("inner"):
+                time.sleep(0.1)
+
+        (inner, _, inner_time), (outer, _, outer_time) = recording
+
+        assert (inner, outer) == ("inner", "outer")
+        assert inner_time >= 0.1
+
+        # Time spent in nested phases is not counted twice
+        assert 0.05 <= outer_time < 0.1
+
+    def test_print_summary(self, recording):
+        timings.record("spec load", 0.002)
+
+        for page in (1, 2):
+            with timings.page(page):
+                timings.record("time to first byte", 0.1 * page)
+
+        output = io.StringIO()
+        timings.print_summary(file=output)
+
+        lines = output.getvalue().splitlines()
+        assert lines[0] == "Timings:"
+        assert lines[1].split() == ["spec", "load", "2.0", "ms"]
+        assert lines[2].split() == [
+            "time",
+            "to",
+            "first",
+            "byte",
+            "300.0",
+            "ms",
+            "(2",
+            "times)",
+        ]
+        assert lines[3].split()[0] == "total"
+        assert lines[4:] == [
+            "Pages:",
+            "  1: time to first byte 100.0 ms",
+            "  2: time to first byte 200.0 ms",
+        ]
+
+    def test_handle_command_all_rows(
+        self, recording, mock_cli, list_operation, monkeypatch
+    ):
+        monkeypatch.setattr(
+            mock_cli, "find_operation", lambda *_: list_operation
+        )
+        monkeypatch.setattr(
+            mock_cli.output_handler,
+            "print_response",
+            functools.partial(
+                mock_cli.output_handler.print_response, to=io.StringIO()
+            ),
+        )
+
+        mock_cli.pagination = False
+        mock_cli.parallel_pages = 2
+        mock_cli.output_handler.mode = OutputMode.json
+
+        with requests_mock.Mocker() as m:
+            for page in (1, 2, 3):
+                m.get(
+                    f"http://localhost/v4/foo/bar?page={page}&page_size=500",
+                    json={"data": [], "page": page, "pages": 3},
+                )
+
+            mock_cli.handle_command("foo", "bar", [])
+
+        phases = {name for name, _, _ in recording}
+        assert {
+            "spec load",
+            "request build",
+            "arg parsing",
+            "time to first byte",
+            "body download",
+            "JSON decode",
+            "fix_json",
+            "rendering",
+        } <= phases
+
+        # Each page's request is attributed to that page
+        assert {
+            page for name, page, _ in recording if name == "body download"
+        } == {1, 2, 3}
+
+    def test_instrument_adapter(self, recording):
+        adapter = requests.adapters.HTTPAdapter()
+        timings.instrument_adapter(adapter)
+
+        session = requests.Session()
+        session.mount("http://", adapter)
+
+        class Handler(http.server.SimpleHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+
+        try:
+            session.head(f"http://127.0.0.1:{server.server_port}/")
+            session.head(f"http://127.0.0.1:{server.server_port}/")
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        # The connection is only established once
+        assert [name for name, _, _ in recording] == ["connect"]
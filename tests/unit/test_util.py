@@ -0,0 +1,110 @@
+"""
+Unit tests for linodecli.baked.util
+"""
+
+import logging
+import pickle
+
+from linodecli.baked.operation import OpenAPIOperationParameter
+from linodecli.baked.response import OpenAPIResponseAttr, _parse_response_model
+from linodecli.baked.util import (
+    _aggregate_schema_properties,
+    schema_memo,
+    set_slots_state,
+)
+from tests.unit.conftest import _get_parsed_spec
+
+
+def _get_foo_schemas():
+    """
+    Returns the Foo schema as referenced by two different operations.
+    """
+    spec = _get_parsed_spec("cli_test_bake.yaml")
+
+    create_schema = (
+        spec.paths["/foo"].post.responses["200"].content["application/json"]
+    ).schema
+    view_schema = (
+        spec.paths["/foo/{fooId}"]
+        .get.responses["200"]
+        .content["application/json"]
+    ).schema
+
+    return create_schema, view_schema
+
+
+class TestSchemaMemo:
+    """
+    Unit tests for schema memoization during bakes
+    """
+
+    def test_schema_memo(self):
+        create_schema, view_schema = _get_foo_schemas()
+
+        expected = _parse_response_model(view_schema)
+
+        with schema_memo() as memo:
+            first = _parse_response_model(create_schema)
+            second = _parse_response_model(view_schema)
+
+        assert memo.hits["_parse_response_model"] == 1
+        assert [a.name for a in first] == [a.name for a in expected]
+        assert [a.name for a in second] == [a.name for a in expected]
+
+        # Callers should be able to modify the returned list
+        assert first is not second
+        first.pop()
+        assert len(second) == len(expected)
+
+    def test_schema_memo_inactive(self):
+        create_schema, _ = _get_foo_schemas()
+
+        with schema_memo() as memo:
+            pass
+
+        _aggregate_schema_properties(create_schema)
+        _aggregate_schema_properties(create_schema)
+
+        assert len(memo.results) == 0
+
+    def test_schema_memo_debug_log(self, caplog):
+        create_schema, view_schema = _get_foo_schemas()
+
+        with caplog.at_level(logging.DEBUG, logger="linodecli.baked.util"):
+            with schema_memo():
+                _aggregate_schema_properties(create_schema)
+                _aggregate_schema_properties(view_schema)
+
+        assert (
+            "Schema memo for _aggregate_schema_properties: 1 hits, 1 misses"
+            in caplog.text
+        )
+
+
+class TestSetSlotsState:
+    """
+    Unit tests for restoring the pickled state of slotted baked classes
+    """
+
+    def test_set_slots_state(self):
+        create_schema, _ = _get_foo_schemas()
+
+        attrs = _parse_response_model(create_schema)
+
+        # Slotted objects are pickled with a (dict, slots) state
+        restored = pickle.loads(pickle.dumps(attrs))
+        assert [a.name for a in restored] == [a.name for a in attrs]
+
+    def test_set_slots_state_dict(self):
+        # Objects baked before the baked classes used __slots__ have their
+        # attributes pickled as a plain dict
+        attr = OpenAPIResponseAttr.__new__(OpenAPIResponseAttr)
+        set_slots_state(attr, {"name": "label", "filterable": True})
+
+        assert attr.name == "label"
+        assert attr.filterable
+
+        param = OpenAPIOperationParameter.__new__(OpenAPIOperationParameter)
+        param.__setstate__({"name": "linodeId", "type": "integer"})
+
+        assert (param.name, param.type) == ("linodeId", "integer")
@@ -0,0 +1,66 @@
+"""
+Unit tests for linodecli.version_check
+"""
+
+import time
+from unittest.mock import patch
+
+import requests
+
+from linodecli import version_check
+
+
+def _make_response(version: str):
+    response = requests.Response()
+    response.status_code = 200
+    response.json = lambda: {"info": {"version": version}}
+    return response
+
+
+class TestVersionCheck:
+    """
+    Unit tests for linodecli.version_check
+    """
+
+    def test_fresh(self):
+        version_check._write_cache({"checked": time.time(), "version": "2.0.0"})
+
+        with patch("linodecli.version_check.requests.get") as mock_get:
+            assert version_check.get_latest_version() == "2.0.0"
+
+        mock_get.assert_not_called()
+
+    def test_expired(self):
+        version_check._write_cache(
+            {
+                "checked": time.time() - version_check.VERSION_CHECK_TTL - 1,
+                "version": "2.0.0",
+            }
+        )
+
+        with patch(
+            "linodecli.version_check.requests.get",
+            return_value=_make_response("2.1.0"),
+        ) as mock_get:
+            # The expired version is used until the refresh completes
+            assert version_check.get_latest_version() == "2.0.0"
+            version_check.wait(None)
+
+            # The check is only made once per process
+            version_check.get_latest_version()
+
+        mock_get.assert_called_once()
+        assert version_check._read_cache()["version"] == "2.1.0"
+
+    def test_failed(self):
+        with patch(
+            "linodecli.version_check.requests.get",
+            side_effect=requests.ConnectionError,
+        ):
+            assert version_check.get_latest_version() is None
+            version_check.wait(None)
+
+        # The failed attempt is cached so PyPI isn't queried on every invocation
+        cached = version_check._read_cache()
+        assert cached["version"] is None
+        assert version_check._is_fresh(cached)